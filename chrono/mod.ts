@@ -24,8 +24,10 @@ import { Time } from "./time";
 export * from "./recurrence/rrule";
 export * from "./recurrence/ical";
 export * from "./recurrence/recurrence";
+export * from "./recurrence/recurrence-set";
 export * from "./recurrence/iso-date";
 export * from "./recurrence/exdate";
+export * from "./recurrence/agenda";
 
 export function naivedate(year: number, mth1: number, day1: number): NaiveDate {
   return NaiveDate.fromYmd1(year, mth1, day1).exp();
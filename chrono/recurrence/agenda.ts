@@ -0,0 +1,139 @@
+import { NaiveDate } from "../naive-date";
+import { GoogleEventGenerator, Recurrence } from "./recurrence";
+
+/**
+ * A single time-ordered stream of the occurrences of many series.
+ *
+ * Each series is a cursor over its own occurrences, and a min-heap keyed on
+ * each cursor's next start instant merges them. Taking the first `n`
+ * occurrences only advances the series that contribute to them, instead of
+ * expanding every series and sorting the lot.
+ *
+ * Usage:
+ * ```typescript
+ * const agenda = new Agenda(recurrences, today);
+ * const page = agenda.take(20);
+ * const nextPage = agenda.take(20);
+ * ```
+ */
+export class Agenda {
+  private readonly heap: Agenda.Head[] = [];
+
+  /**
+   * `Recurrence`s are read from `from` on (DTSTART by default).
+   * `GoogleEventGenerator`s are read from where they are, skipping events
+   * before `from`.
+   */
+  constructor(sources: Iterable<Agenda.Source>, from?: Option<NaiveDate>) {
+    let index = 0;
+    for (const source of sources) {
+      const pull = Agenda.cursor(source, from);
+      const mse = pull();
+      if (mse != null) this.heap.push({ index, source, mse, pull });
+      index += 1;
+    }
+    for (let i = (this.heap.length >> 1) - 1; i >= 0; --i) this.siftDown(i);
+  }
+
+  get isEmpty(): boolean {
+    return this.heap.length === 0;
+  }
+
+  /**
+   * The earliest occurrence not taken yet, or null once every series has
+   * ended.
+   */
+  next(): Option<Agenda.Entry> {
+    const head = this.heap[0];
+    if (!head) return null;
+    const entry = { index: head.index, source: head.source, mse: head.mse };
+
+    const mse = head.pull();
+    if (mse != null) {
+      head.mse = mse;
+    } else {
+      const last = this.heap.pop()!;
+      if (this.heap.length === 0) return entry;
+      this.heap[0] = last;
+    }
+    this.siftDown(0);
+    return entry;
+  }
+
+  /**
+   * The next `n` occurrences, fewer if the series run out.
+   */
+  take(n: number): Agenda.Entry[] {
+    const out: Agenda.Entry[] = [];
+    while (out.length < n) {
+      const entry = this.next();
+      if (!entry) break;
+      out.push(entry);
+    }
+    return out;
+  }
+
+  *[Symbol.iterator](): Generator<Agenda.Entry> {
+    for (let entry = this.next(); entry; entry = this.next()) yield entry;
+  }
+
+  private siftDown(i: number) {
+    const heap = this.heap;
+    const head = heap[i];
+    for (;;) {
+      let child = 2 * i + 1;
+      if (child >= heap.length) break;
+      if (
+        child + 1 < heap.length &&
+        Agenda.before(heap[child + 1], heap[child])
+      ) {
+        child += 1;
+      }
+      if (!Agenda.before(heap[child], head)) break;
+      heap[i] = heap[child];
+      i = child;
+    }
+    heap[i] = head;
+  }
+}
+
+export namespace Agenda {
+  export type Source = Recurrence | GoogleEventGenerator;
+
+  export type Entry = {
+    // position of the series among the agenda's sources
+    index: number;
+    source: Source;
+    // start of the occurrence, in ms since epoch
+    mse: number;
+  };
+
+  export type Head = Entry & {
+    // start of the series' following occurrence, null once it has ended
+    pull: () => Option<number>;
+  };
+
+  // earlier first, ties in the order the sources were given
+  export function before(a: Head, b: Head): boolean {
+    return a.mse < b.mse || (a.mse === b.mse && a.index < b.index);
+  }
+
+  export function cursor(
+    source: Source,
+    from?: Option<NaiveDate>,
+  ): () => Option<number> {
+    if (source instanceof Recurrence) {
+      const instants = source.instants(from);
+      return () => {
+        const next = instants.next();
+        return next.done ? null : next.value;
+      };
+    }
+    return () => {
+      for (let event = source.next(); event; event = source.next()) {
+        if (!from || event.ndt.date.dse >= from.dse) return event.mse;
+      }
+      return null;
+    };
+  }
+}
@@ -146,21 +146,12 @@ export class ExDate {
    * Parse a date-only string (YYYYMMDD format)
    */
   private static parseDateOnly(dateStr: string): Result<IsoDate> {
-    const regex = /^(\d{4})(\d{2})(\d{2})$/;
-    const match = dateStr.match(regex);
-    
-    if (!match) {
+    // IsoDate.scan reads the fields by position, so only the length is left
+    // to check
+    if (dateStr.length !== 8) {
       return err(Error(`Invalid date format: ${dateStr}`));
     }
-    
-    const [_, year, month, day] = match;
-    const ndr = NaiveDate.fromYmd1Str(year, month, day);
-    
-    if (ndr.isErr) {
-      return ndr.expeCast();
-    }
-    
-    return ok(new IsoDate(ndr.asOk()!, null, null));
+    return IsoDate.scan(dateStr);
   }
 
   /**
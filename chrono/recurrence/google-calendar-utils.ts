@@ -1,5 +1,7 @@
+import { DseSet } from "../units/dse-set";
 import { YearMonthDay } from "../units/year-month-day";
 import { ICalendar } from "./ical";
+import { ICalDateLine } from "./ical-date-line";
 
 /**
  * Utilities for Google Calendar-specific recurrence behavior
@@ -162,32 +164,48 @@ export function startDateMatchesByday(
 }
 
 /**
- * Creates a set of excluded dates from EXDATE rules
+ * The days excluded by EXDATE rules, from the lines' own day indexes
  */
-export function createExcludedDatesSet(inner: ICalendar.Raw): Set<number> {
-  return new Set(
-    inner.lines.exdate?.flatMap(
-      (exdate) => exdate.dates?.map((d) => d.dse) ?? [],
-    ) ?? [],
-  );
+export function createExcludedDays(inner: ICalendar.Raw): ICalDateLine.Days {
+  return ICalDateLine.Days.of(inner.lines.exdate ?? []);
 }
 
+/**
+ * How far `processAllEvents` has got, updated before each event is yielded
+ */
+export type EmitProgress = {
+  emitted: number; // events yielded, towards COUNT
+  watermark: number; // dse of the last event yielded
+};
+
 /**
  * Processes all events from a raw generator with COUNT logic and deduplication
+ *
+ * When `resumed`, the raw generator picks up after `progress.watermark`, and
+ * `progress.emitted` events have already been counted
  */
 export function* processAllEvents(
   rawEvents: Generator<YearMonthDay>,
   pattern: CountPattern,
   countLimit?: number,
   startDate?: YearMonthDay,
-  excl?: Set<number>,
+  excl?: ICalDateLine.Days,
   inner?: ICalendar.Raw,
+  progress?: Option<EmitProgress>,
+  resumed: boolean = false,
 ): Generator<YearMonthDay> {
-  let emittedCount = 0;
-  const seenEvents = new Set<string>();
+  let emittedCount = resumed ? progress!.emitted : 0;
+  const seenEvents = new DseSet();
+  const emit = (event: YearMonthDay) => {
+    emittedCount++;
+    if (progress) {
+      progress.emitted = emittedCount;
+      progress.watermark = event.dse;
+    }
+  };
   
   // Use the stateless function to determine if start date should be emitted separately
-  const shouldEmitStartSeparately = inner && startDate && shouldEmitStartDateSeparately(inner, startDate, pattern);
+  const shouldEmitStartSeparately = !resumed && inner && startDate && shouldEmitStartDateSeparately(inner, startDate, pattern);
   
   // Handle start date emission for Google Calendar BYDAY patterns (non-yearly only)
   if (shouldEmitStartSeparately) {
@@ -196,11 +214,9 @@ export function* processAllEvents(
       const matchesByday = startDateMatchesByday(startDate!, options.byday);
 
       if (matchesByday && !excl?.has(startDate!.dse)) {
-        const startDateKey = startDate!.toString();
-        if (!seenEvents.has(startDateKey)) {
-          seenEvents.add(startDateKey);
+        if (seenEvents.add(startDate!.dse)) {
+          emit(startDate!);
           yield startDate!;
-          emittedCount++;
           
           // Check COUNT limit after emitting start date
           if (countLimit && emittedCount >= countLimit) {
@@ -215,17 +231,16 @@ export function* processAllEvents(
   for (const event of rawEvents) {
     if (excl?.has(event.dse)) continue;
     
-    // Deduplicate events
-    const eventKey = event.toString();
-    if (seenEvents.has(eventKey)) continue;
-    seenEvents.add(eventKey);
+    // Deduplicate events, including those returned before resuming
+    if (!seenEvents.add(event.dse)) continue;
+    if (resumed && event.dse <= progress!.watermark) continue;
     
     // Check COUNT limit before emitting
     if (countLimit && emittedCount >= countLimit) {
       return;
     }
     
+    emit(event);
     yield event;
-    emittedCount++;
   }
 }
\ No newline at end of file
@@ -3,13 +3,40 @@ import { ICalAttributes } from "./ical-attributes";
 import { IsoDate } from "./iso-date";
 
 export class ICalDateLine implements ICalDateLine.Like {
+  // `dates`, once built
+  private cachedDates: Option<NaiveDateTime[]> = null;
+  private build: Option<() => NaiveDateTime[]> = null;
+
   constructor(
     readonly label: string,
-    readonly dates: NaiveDateTime[],
+    // parsed lines pass a function, so an EXDATE line that is only checked
+    // against (see `days`) never builds its dates
+    dates: NaiveDateTime[] | (() => NaiveDateTime[]),
     readonly region?: Option<TimezoneRegion>,
     readonly value?: Option<"DATE" | "DATE-TIME">,
     readonly determinism?: Option<ICalDateLine.TestDeterminism>,
-  ) {}
+    // the dates are UTC (eg. `19980401T133000Z`) rather than floating
+    readonly utc: boolean = false,
+    // see `days`, when already known
+    private cachedDays?: Option<Int32Array>,
+  ) {
+    if (Array.isArray(dates)) this.cachedDates = dates;
+    else this.build = dates;
+  }
+
+  get dates(): NaiveDateTime[] {
+    return (this.cachedDates ??= this.build!());
+  }
+
+  /**
+   * The days since epoch of `dates`, sorted and distinct: the index to
+   * check a date against an EXDATE line.
+   */
+  get days(): Int32Array {
+    return (this.cachedDays ??= ICalDateLine.index(
+      Int32Array.from(this.dates, (d) => d.dse).sort(),
+    ));
+  }
 
   // Examples:
   //
@@ -19,6 +46,7 @@ export class ICalDateLine implements ICalDateLine.Like {
   // EXDATE:20231225T090000,20231226T090000
   // EXDATE;VALUE=DATE-TIME:20231225T090000,20231226T090000
   // EXDATE;VALUE=DATE-TIME;TZID=Europe/Brussels:20231225T090000,20231226T090000
+  // RDATE;VALUE=DATE:20231228
   //
   static async parse(
     s: string,
@@ -62,42 +90,126 @@ export class ICalDateLine implements ICalDateLine.Like {
 
 export namespace ICalDateLine {
   export class Raw {
+    // `nd`, once scanned
+    private cachedNd: Option<IsoDate[]>;
+    private readonly source: Option<Raw.Source>;
+
     constructor(
       readonly tag: string,
       readonly attributes: ICalAttributes,
-      readonly nd: IsoDate[],
-    ) {}
-
-    static parse(s: string, requiresTag: boolean = true): Result<Raw> {
-      const lines = s.split(/\r?\n/);
-      const line = lines.join("");
+      nd: IsoDate[] | Raw.Source,
+      // sorted, distinct days since epoch of `nd`
+      readonly days: Option<Int32Array> = null,
+    ) {
+      this.cachedNd = Array.isArray(nd) ? nd : null;
+      this.source = Array.isArray(nd) ? null : nd;
+    }
 
-      const m = line.match(/^([^:]+):(.*)$/);
-      if (!m) return erm("invalid");
+    /**
+     * The line's timestamps, scanned on first use.
+     */
+    get nd(): IsoDate[] {
+      if (this.cachedNd) return this.cachedNd;
+      const { line, bounds } = this.source!;
+      const nd: IsoDate[] = new Array(bounds.length - 1);
+      for (let k = 0; k < nd.length; ++k) {
+        // already checked by `parse`
+        nd[k] = IsoDate.scan(line, bounds[k], bounds[k + 1] - 1).exp();
+      }
+      return (this.cachedNd = nd);
+    }
 
-      const [_, rawParams, rawTimestamps] = m;
+    static parse(s: string, requiresTag: boolean = true): Result<Raw> {
+      // folded lines
+      const line = s.includes("\n") ? s.split(/\r?\n/).join("") : s;
 
+      const colon = line.indexOf(":");
+      if (colon <= 0) return erm("invalid");
+      const rawParams = line.slice(0, colon);
       const attributes = ICalAttributes.fromRawAttributes(rawParams.split(";"));
-      const timestamps = rawTimestamps
-        .split(",")
-        .map(IsoDate.parse)
-        .map((ts) => ts.exp());
+
+      // only the timestamps' days are read here, straight from their
+      // digits into the line's index; the timestamps themselves are scanned
+      // from `bounds` if they're asked for
+      let count = 1;
+      let comma = line.indexOf(",", colon);
+      for (; comma >= 0; comma = line.indexOf(",", comma + 1)) ++count;
+      // timestamp k is [bounds[k], bounds[k + 1] - 1)
+      const bounds = new Int32Array(count + 1);
+      const days = new Int32Array(count);
+      let sorted = true;
+      bounds[0] = colon + 1;
+      for (let k = 0; k < count; ++k) {
+        let hi = line.indexOf(",", bounds[k]);
+        if (hi < 0) hi = line.length;
+        const day = IsoDate.scanDay(line, bounds[k], hi);
+        if (day == null) {
+          return erm(`icaldate/no-match/input=${line.slice(bounds[k], hi)}`);
+        }
+        days[k] = day;
+        if (k > 0 && days[k] < days[k - 1]) sorted = false;
+        bounds[k + 1] = hi + 1;
+      }
 
       const tagCandidate = attributes.order[0];
       if (requiresTag) {
-        if (tagCandidate !== "EXDATE" && tagCandidate !== "DTSTART") {
+        if (
+          tagCandidate !== "EXDATE" &&
+          tagCandidate !== "DTSTART" &&
+          tagCandidate !== "RDATE"
+        ) {
           return erm(`tag required but got '${tagCandidate}'`);
         }
       }
 
-      return Result.ok(new Raw(tagCandidate, attributes, timestamps));
+      return Result.ok(
+        new Raw(
+          tagCandidate,
+          attributes,
+          { line, bounds },
+          ICalDateLine.index(sorted ? days : days.sort()),
+        ),
+      );
+    }
+
+    /**
+     * Whether the line's timestamps are UTC, going by the first one's
+     * trailing `Z`.
+     */
+    get utc(): boolean {
+      if (this.cachedNd) return this.cachedNd[0]?.z != null;
+      const { line, bounds } = this.source!;
+      return IsoDate.scanZ(line, bounds[0], bounds[1] - 1);
+    }
+
+    /**
+     * The line's TZID, if any.
+     */
+    get tzname(): Option<Tzname> {
+      const tzname = this.attributes.get("tzid");
+      return tzname != null && typeof tzname === "string"
+        ? (tzname as Tzname)
+        : null;
     }
 
     async resolve(deterministic: boolean = false): Promise<ICalDateLine> {
+      const tzname = this.tzname;
+      if (tzname != null) await TimezoneRegion.prefetch([tzname]);
+      return this.resolveSync(deterministic);
+    }
+
+    /**
+     * `resolve` against the regions already loaded (see
+     * `TimezoneRegion.prefetch`). A TZID that isn't loaded falls back to UTC,
+     * as `TimezoneRegion.get` does for one that can't be.
+     */
+    resolveSync(deterministic: boolean = false): ICalDateLine {
       let region: Option<TimezoneRegion>;
-      const tzname = this.attributes.get("tzid");
-      if (tzname != null && typeof tzname === "string") {
-        region = await TimezoneRegion.get(tzname as Tzname);
+      const tzname = this.tzname;
+      if (tzname != null) {
+        region =
+          TimezoneRegion.cached(tzname) ??
+          TimezoneRegion.cached("UTC" as Tzname);
       }
 
       let exdateValue: Option<"DATE" | "DATE-TIME">;
@@ -111,18 +223,28 @@ export namespace ICalDateLine {
 
       return new ICalDateLine(
         this.tag,
-        this.nd.map((d) => d.extend()),
+        () => this.nd.map((d) => d.extend()),
         region,
         exdateValue,
         deterministic
           ? {
               attributeOrder: this.attributes.order,
-              includeZ: this.nd[0]?.z != null,
+              includeZ: this.utc,
             }
           : null,
+        this.utc,
+        this.days,
       );
     }
   }
+
+  export namespace Raw {
+    export type Source = {
+      line: string;
+      // offsets of the timestamps in `line`, see `Raw.parse`
+      bounds: Int32Array;
+    };
+  }
 }
 
 export namespace ICalDateLine {
@@ -139,4 +261,63 @@ export namespace ICalDateLine {
   export type Like = {
     dates: NaiveDateTime[];
   } & Options;
+
+  /**
+   * Sorted, distinct days since epoch (eg. an EXDATE line's), looked up
+   * with a binary search.
+   */
+  export class Days implements Iterable<number> {
+    static EMPTY = new Days(new Int32Array(0));
+
+    constructor(readonly sorted: Int32Array) {}
+
+    /**
+     * The days of all of `lines`.
+     */
+    static of(lines: Iterable<ICalDateLine>): Days {
+      const all: Int32Array[] = [];
+      for (const line of lines) all.push(line.days);
+      if (all.length === 0) return Days.EMPTY;
+      if (all.length === 1) return new Days(all[0]);
+
+      const merged = new Int32Array(all.reduce((n, d) => n + d.length, 0));
+      let n = 0;
+      for (const days of all) {
+        merged.set(days, n);
+        n += days.length;
+      }
+      return new Days(ICalDateLine.index(merged.sort()));
+    }
+
+    get size(): number {
+      return this.sorted.length;
+    }
+
+    has(dse: number): boolean {
+      const sorted = this.sorted;
+      let lo = 0;
+      let hi = sorted.length;
+      while (lo < hi) {
+        const mid = (lo + hi) >>> 1;
+        if (sorted[mid] < dse) lo = mid + 1;
+        else hi = mid;
+      }
+      return lo < sorted.length && sorted[lo] === dse;
+    }
+
+    [Symbol.iterator](): Iterator<number> {
+      return this.sorted[Symbol.iterator]();
+    }
+  }
+
+  /**
+   * `sorted` without repeats, deduplicated in place.
+   */
+  export function index(sorted: Int32Array): Int32Array {
+    let n = 0;
+    for (let i = 0; i < sorted.length; ++i) {
+      if (n === 0 || sorted[i] !== sorted[n - 1]) sorted[n++] = sorted[i];
+    }
+    return n === sorted.length ? sorted : sorted.subarray(0, n);
+  }
 }
@@ -1,10 +1,17 @@
 import { Result, err, ok } from "../result";
+import { Tzname } from "../timezone";
+import { TimezoneRegion } from "../timezone-region";
 import { ICalDateLine } from "./ical-date-line";
 import { RRule } from "./rrule";
 
 export namespace ICalendar {
   export type Lines = Optional<{
+    // the first RRULE
     rrule: RRule;
+    // every RRULE, in order, when there may be more than one
+    rrules: RRule[];
+    exrule: RRule[];
+    rdate: ICalDateLine[];
     exdate: ICalDateLine[];
     dtstart: ICalDateLine;
   }>;
@@ -19,15 +26,66 @@ export namespace ICalendar {
       return this.lines.rrule;
     }
 
+    get rrules(): RRule[] {
+      return this.lines.rrules ?? (this.lines.rrule ? [this.lines.rrule] : []);
+    }
+
     get dtstart(): Option<ICalDateLine> {
       return this.lines.dtstart;
     }
 
+    /**
+     * Whether this is a recurrence set rather than a single rule: more than
+     * one RRULE, or any RDATE or EXRULE.
+     */
+    get isSet(): boolean {
+      return (
+        this.rrules.length > 1 ||
+        !!this.lines.rdate?.length ||
+        !!this.lines.exrule?.length
+      );
+    }
+
+    /**
+     * Parses the lines of a calendar, loading the timezones its date lines
+     * refer to.
+     */
     static async parse(
       lines: string[],
       deterministic: boolean = false,
     ): Promise<Result<Raw>> {
-      const inner: Lines = {};
+      return (await Raw.parseMany([lines], deterministic))[0];
+    }
+
+    /**
+     * `parse` for many calendars at once: every calendar is scanned first,
+     * then their timezones are loaded in one batch, and the rest is
+     * synchronous.
+     */
+    static async parseMany(
+      calendars: Iterable<string[]>,
+      deterministic: boolean = false,
+    ): Promise<Result<Raw>[]> {
+      const scanned: Result<Scanned>[] = [];
+      const tznames = new Set<Tzname>();
+      for (const lines of calendars) {
+        const res = Raw.scan(lines, deterministic);
+        for (const tzname of res.asOk()?.tznames ?? []) tznames.add(tzname);
+        scanned.push(res);
+      }
+      await TimezoneRegion.prefetch(tznames);
+      return scanned.map((res) => res.map((s) => s.resolve()));
+    }
+
+    /**
+     * The synchronous first half of `parse`: reads the lines, but leaves the
+     * date lines' timezones unresolved.
+     */
+    static scan(
+      lines: string[],
+      deterministic: boolean = false,
+    ): Result<Scanned> {
+      const inner: Scanned.Lines = {};
       const order: Option<string[]> = deterministic ? [] : null;
 
       for (const line of lines) {
@@ -36,9 +94,22 @@ export namespace ICalendar {
           order?.push("RRULE");
           if (rrule.asErr())
             return err(Error("failed to parse rrule", rrule.asErr()!));
-          inner.rrule = rrule.asOk()!;
+          inner.rrule ??= rrule.asOk()!;
+          (inner.rrules ??= []).push(rrule.asOk()!);
+        } else if (line.startsWith("EXRULE")) {
+          const exrule = RRule.parse(line.slice("EXRULE:".length));
+          order?.push("EXRULE");
+          if (exrule.asErr())
+            return err(Error("failed to parse exrule", exrule.asErr()!));
+          (inner.exrule ??= []).push(exrule.asOk()!);
+        } else if (line.startsWith("RDATE")) {
+          const date = ICalDateLine.Raw.parse(line);
+          order?.push("RDATE");
+          if (date.asErr())
+            return err(Error("failed to parse rdate", date.asErr()!));
+          (inner.rdate ??= []).push(date.asOk()!);
         } else if (line.startsWith("EXDATE")) {
-          const date = await ICalDateLine.parse(line, deterministic);
+          const date = ICalDateLine.Raw.parse(line);
           order?.push("EXDATE");
           if (date.asErr())
             return err(Error("failed to parse exdate", date.asErr()!));
@@ -47,7 +118,7 @@ export namespace ICalendar {
           }
           inner.exdate.push(date.asOk()!);
         } else if (line.startsWith("DTSTART")) {
-          const date = await ICalDateLine.parse(line, deterministic);
+          const date = ICalDateLine.Raw.parse(line);
           order?.push("DTSTART");
           if (date.asErr())
             return err(Error("failed to parse dtstart", date.asErr()!));
@@ -55,25 +126,85 @@ export namespace ICalendar {
         }
       }
 
-      return ok(new ICalendar.Raw(inner, order));
+      return ok(new Scanned(inner, order, deterministic));
     }
 
     toString(): string {
       const parts: string[] = [];
+      const lines: Record<string, { toString(): string }[]> = {
+        DTSTART: this.lines.dtstart ? [this.lines.dtstart] : [],
+        RRULE: this.rrules,
+        RDATE: this.lines.rdate ?? [],
+        EXRULE: (this.lines.exrule ?? []).map((exrule) => ({
+          toString: () => "EX" + exrule.toString().slice("R".length),
+        })),
+        EXDATE: this.lines.exdate ?? [],
+      };
 
-      for (const order of this.order ?? ["DTSTART", "RRULE", "EXDATE"]) {
-        if (order === "DTSTART" && this.lines.dtstart) {
-          parts.push(this.lines.dtstart.toString());
-        } else if (order === "RRULE" && this.lines.rrule) {
-          parts.push(this.lines.rrule.toString());
-        } else if (order === "EXDATE" && this.lines.exdate) {
-          for (const exdate of this.lines.exdate) {
-            parts.push(exdate.toString());
-          }
+      if (this.order) {
+        // each entry is the next line with that tag
+        const seen: Record<string, number> = {};
+        for (const tag of this.order) {
+          const i = (seen[tag] = (seen[tag] ?? -1) + 1);
+          const line = lines[tag]?.[i];
+          if (line) parts.push(line.toString());
+        }
+      } else {
+        for (const tag of ["DTSTART", "RRULE", "RDATE", "EXRULE", "EXDATE"]) {
+          for (const line of lines[tag]) parts.push(line.toString());
         }
       }
 
       return parts.join("\n");
     }
   }
+
+  /**
+   * A calendar whose lines are read, with its date lines still raw: see
+   * `Raw.scan`.
+   */
+  export class Scanned {
+    constructor(
+      readonly lines: Scanned.Lines,
+      readonly order: Option<string[]>,
+      readonly deterministic: boolean = false,
+    ) {}
+
+    /**
+     * The distinct TZIDs of the date lines, to load before `resolve`.
+     */
+    get tznames(): Set<Tzname> {
+      const { dtstart, rdate, exdate } = this.lines;
+      const tznames = new Set<Tzname>();
+      for (const line of [dtstart, ...(rdate ?? []), ...(exdate ?? [])]) {
+        const tzname = line?.tzname;
+        if (tzname != null) tznames.add(tzname);
+      }
+      return tznames;
+    }
+
+    /**
+     * Resolves the date lines against the timezones already loaded (see
+     * `ICalDateLine.Raw.resolveSync`).
+     */
+    resolve(): Raw {
+      const { dtstart, rdate, exdate, ...rules } = this.lines;
+      const resolve = (line: ICalDateLine.Raw) =>
+        line.resolveSync(this.deterministic);
+      const lines: Lines = { ...rules };
+      if (dtstart) lines.dtstart = resolve(dtstart);
+      if (rdate) lines.rdate = rdate.map(resolve);
+      if (exdate) lines.exdate = exdate.map(resolve);
+      return new Raw(lines, this.order);
+    }
+  }
+
+  export namespace Scanned {
+    export type Lines = Omit<ICalendar.Lines, "rdate" | "exdate" | "dtstart"> &
+      Optional<{
+        rdate: ICalDateLine.Raw[];
+        exdate: ICalDateLine.Raw[];
+        dtstart: ICalDateLine.Raw;
+      }>;
+  }
 }
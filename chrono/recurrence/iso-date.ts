@@ -2,7 +2,8 @@ import { NaiveDate } from "../naive-date";
 import { NaiveDateTime } from "../naive-datetime";
 import { NaiveTime } from "../naive-time";
 import { Result, erm, ok } from "../result";
-import { TentoMath } from "../utils";
+import { Month } from "../units/month";
+import { Year } from "../units/year";
 
 export class IsoDate {
   constructor(
@@ -13,32 +14,89 @@ export class IsoDate {
   ) {}
 
   static parse(s: string): Result<IsoDate> {
-    return IsoDate.parseRaw(s).map(([nd, nt, Z]) => new IsoDate(nd, nt, Z));
+    return IsoDate.scan(s);
+  }
+
+  /**
+   * Parses the date in `s` from `lo` to `hi`, surrounding whitespace aside,
+   * reading its fields by position rather than with a regex, so a line of
+   * many dates is parsed without slicing it up.
+   */
+  static scan(
+    s: string,
+    lo: number = 0,
+    hi: number = s.length,
+  ): Result<IsoDate> {
+    return IsoDate.scanRaw(s, lo, hi).map(
+      ([nd, nt, Z]) => new IsoDate(nd, nt, Z),
+    );
   }
 
   static parseRaw(
     s: string,
   ): Result<[NaiveDate, Option<NaiveTime>, Option<"Z">]> {
-    const regex = /^(\d{4})(\d{2})(\d{2})(?:T(\d{2})(\d{2})?(\d{2})?)?Z?$/;
-    const match = s.trim().match(regex);
-    if (!match) return erm(`icaldate/no-match/input=${s}`);
+    return IsoDate.scanRaw(s, 0, s.length);
+  }
 
-    const [_, year, month, day, hrs, mins, secs] = match;
+  // YYYYMMDD[THH[MM[SS]]][Z]
+  static scanRaw(
+    s: string,
+    lo: number,
+    hi: number,
+  ): Result<[NaiveDate, Option<NaiveTime>, Option<"Z">]> {
+    const at = span(s, lo, hi);
+    if (!at) return erm(`icaldate/no-match/input=${s.slice(lo, hi).trim()}`);
+    lo = at.lo;
 
-    const ndr = NaiveDate.fromYmd1Str(year, month, day);
+    const ndr = NaiveDate.fromYmd1(
+      digits(s, lo, 4),
+      digits(s, lo + 4, 2),
+      digits(s, lo + 6, 2),
+    );
     if (ndr.isErr) return ndr.expeCast();
     const nd = ndr.asOk()!;
 
+    const len = at.len;
     const nt =
-      hrs != null
+      len > 8
         ? NaiveTime.wrap({
-            hrs: TentoMath.int(hrs) || 0,
-            mins: TentoMath.int(mins) || 0,
-            secs: TentoMath.int(secs) || 0,
+            hrs: digits(s, lo + 9, 2),
+            mins: len >= 13 ? digits(s, lo + 11, 2) : 0,
+            secs: len >= 15 ? digits(s, lo + 13, 2) : 0,
           })
         : null;
 
-    return ok([nd, nt, s.endsWith("Z") ? "Z" : null]);
+    return ok([nd, nt, at.z]);
+  }
+
+  /**
+   * Whether the date `scan` would parse from `lo` to `hi` is UTC (ends in
+   * `Z`), without building it.
+   */
+  static scanZ(s: string, lo: number = 0, hi: number = s.length): boolean {
+    return span(s, lo, hi)?.z != null;
+  }
+
+  /**
+   * Days since epoch of the date `scan` would parse from `lo` to `hi`,
+   * worked out from its digits without building it. Null if it isn't one.
+   */
+  static scanDay(
+    s: string,
+    lo: number = 0,
+    hi: number = s.length,
+  ): Option<number> {
+    const at = span(s, lo, hi);
+    if (!at) return null;
+    const yr = digits(s, at.lo, 4);
+    const mth = digits(s, at.lo + 4, 2);
+    const day = digits(s, at.lo + 6, 2);
+    const leap = Year.isLeapYear(yr) ? 1 : 0;
+    if (mth < 1 || mth > 12) return null;
+    if (day < 1 || day > Month.DAYS_IN_MONTH[leap][mth - 1]) return null;
+    return (
+      Year.dseFromYear(yr) + Month.MONTH_START_OF_YEAR[leap][mth - 1] + day - 1
+    );
   }
 
   trunc(): NaiveDate {
@@ -58,3 +116,49 @@ export class IsoDate {
     return this.ical();
   }
 }
+
+// where the date in [lo, hi) starts, without surrounding whitespace, and
+// its length without the trailing Z; null if it isn't one
+function span(
+  s: string,
+  lo: number,
+  hi: number,
+): Option<{ lo: number; len: number; z: Option<"Z"> }> {
+  while (lo < hi && isSpace(s.charCodeAt(lo))) ++lo;
+  while (hi > lo && isSpace(s.charCodeAt(hi - 1))) --hi;
+  const z = hi > lo && s.charCodeAt(hi - 1) === Z ? "Z" : null;
+  const end = z ? hi - 1 : hi;
+
+  const len = end - lo;
+  const timed = len > 8 && s.charCodeAt(lo + 8) === T;
+  const valid =
+    (len === 8 || (timed && (len === 11 || len === 13 || len === 15))) &&
+    isDigits(s, lo, lo + 8) &&
+    (!timed || isDigits(s, lo + 9, end));
+  return valid ? { lo, len, z } : null;
+}
+
+const T = 84;
+const Z = 90;
+const ZERO = 48;
+
+function isSpace(c: number): boolean {
+  return c === 32 || (c >= 9 && c <= 13);
+}
+
+function isDigits(s: string, lo: number, hi: number): boolean {
+  for (let i = lo; i < hi; ++i) {
+    const d = s.charCodeAt(i) - ZERO;
+    if (d < 0 || d > 9) return false;
+  }
+  return true;
+}
+
+// the `n` digit number at `i`, already checked with `isDigits`
+function digits(s: string, i: number, n: number): number {
+  let value = 0;
+  for (let end = i + n; i < end; ++i) {
+    value = value * 10 + (s.charCodeAt(i) - ZERO);
+  }
+  return value;
+}
@@ -0,0 +1,144 @@
+import { DateUnit } from "../units/date-unit";
+import { DaysSinceEpoch } from "../units/units";
+import { YearMonthDay } from "../units/year-month-day";
+
+/**
+ * Lazy set algebra over sorted streams of dates, for recurrence sets
+ * (several RRULEs and RDATEs, minus EXRULEs).
+ *
+ * Every stream stays a generator: `union` merges its inputs by keeping one
+ * head per input, and `difference` walks the excluded stream alongside the
+ * included one. Nothing is materialized, so infinite rules cost only what is
+ * read from them.
+ *
+ * Streams are sorted by `order`: 1 for ascending, -1 for descending.
+ */
+export namespace RecurrenceSet {
+  export type Order = 1 | -1;
+
+  /**
+   * Where a stream stopped on its period budget. Everything before `from`
+   * has been yielded, so the set resumes by seeking each of its rules to
+   * `from`.
+   */
+  export type Cut = {
+    // the continuation of the rule that ran out
+    continuation: YearMonthDay.Continuation;
+    from: YearMonthDay;
+  };
+
+  export type Source = Iterator<YearMonthDay, Option<Cut> | void>;
+
+  /**
+   * A rule's stream, with the continuation it returns on its budget turned
+   * into a `Cut`.
+   */
+  export function* rule(
+    dates: Generator<YearMonthDay, Option<YearMonthDay.Continuation>>,
+    unit: DateUnit.Type,
+  ): Generator<YearMonthDay, Option<Cut>> {
+    const continuation = yield* dates;
+    if (!continuation) return null;
+
+    // a period yields dates anywhere in its month or year, not just from
+    // the day it's anchored on
+    const { period } = continuation;
+    const from =
+      unit === "year" || unit === "month"
+        ? YearMonthDay.fromYmd1Exp(
+            period.yr,
+            unit === "year" ? 1 : period.month1,
+            1,
+          )
+        : period.castValid();
+    return { continuation, from };
+  }
+
+  /**
+   * The distinct dates of `sources`, merged.
+   *
+   * If a source is cut, its later dates are unknown, so the union stops
+   * before the earliest cut.
+   */
+  export function* union(
+    sources: Source[],
+    order: Order = 1,
+  ): Generator<YearMonthDay, Option<Cut>> {
+    const heads: Option<YearMonthDay>[] = [];
+    // assigned in `pull`, out of sight of narrowing
+    let cut = null as Option<Cut>;
+    const pull = (i: number) => {
+      const next = sources[i].next();
+      heads[i] = next.done ? null : next.value;
+      if (next.done && next.value) cut = earlier(cut, next.value);
+    };
+    for (let i = 0; i < sources.length; ++i) pull(i);
+
+    let last: Option<number> = null;
+    for (;;) {
+      // a handful of rules per set, so a scan beats a heap
+      let min = -1;
+      for (let i = 0; i < heads.length; ++i) {
+        const head = heads[i];
+        if (head && (min < 0 || order * (head.dse - heads[min]!.dse) < 0)) {
+          min = i;
+        }
+      }
+      if (min < 0) return cut;
+
+      const nd = heads[min]!;
+      if (cut && nd.dse >= cut.from.dse) return cut;
+      pull(min);
+      if (nd.dse === last) continue;
+      last = nd.dse;
+      yield nd;
+    }
+  }
+
+  /**
+   * The dates of `include` that aren't in `exclude`.
+   */
+  export function* difference(
+    include: Source,
+    exclude: Source,
+    order: Order = 1,
+  ): Generator<YearMonthDay, Option<Cut>> {
+    let excluded = exclude.next();
+    for (let next = include.next(); ; next = include.next()) {
+      const exclusionCut = excluded.done ? excluded.value ?? null : null;
+      if (next.done) return earlier(next.value ?? null, exclusionCut);
+
+      const nd = next.value;
+      while (!excluded.done && order * (excluded.value.dse - nd.dse) < 0) {
+        excluded = exclude.next();
+      }
+      if (excluded.done) {
+        // the exclusions ran out on their budget, so `nd` may be one of them
+        const cut = excluded.value;
+        if (cut && nd.dse >= cut.from.dse) return cut;
+      } else if (excluded.value.dse === nd.dse) {
+        continue;
+      }
+      yield nd;
+    }
+  }
+
+  /**
+   * Sorted, distinct dates from days since epoch (eg. RDATEs).
+   */
+  export function* dates(
+    dses: Iterable<number>,
+    order: Order = 1,
+  ): Generator<YearMonthDay> {
+    const sorted = [...new Set(dses)].sort((a, b) => order * (a - b));
+    for (const dse of sorted) {
+      yield YearMonthDay.fromDse(dse as DaysSinceEpoch);
+    }
+  }
+
+  function earlier(a: Option<Cut>, b: Option<Cut>): Option<Cut> {
+    if (!a) return b;
+    if (!b) return a;
+    return b.from.dse < a.from.dse ? b : a;
+  }
+}
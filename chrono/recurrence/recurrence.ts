@@ -1,20 +1,30 @@
 import { DateTime } from "../datetime";
 import { NaiveDate } from "../naive-date";
 import { NaiveDateTime } from "../naive-datetime";
+import { NaiveTime } from "../naive-time";
 import { Result, err, ok } from "../result";
 import { FixedOffset, Utc } from "../timezone";
+import { Time } from "../time";
 import { TimezoneRegion } from "../timezone-region";
+import { DateUnit } from "../units/date-unit";
+import { DaysSinceEpoch } from "../units/units";
 import { YearMonthDay } from "../units/year-month-day";
 import {
   CountPattern,
   calculateGoogleCalendarStartDate,
-  createExcludedDatesSet,
+  EmitProgress,
+  createExcludedDays,
   detectCountPattern,
   processAllEvents,
   shouldEmitStartDateSeparately,
   startDateMatchesByday,
 } from "./google-calendar-utils";
 import { ICalendar } from "./ical";
+import { ICalDateLine } from "./ical-date-line";
+import { RRule } from "./rrule";
+import { RRulePlan } from "./rrule-plan";
+import { RRuleTimes } from "./rrule-times";
+import { RecurrenceSet } from "./recurrence-set";
 
 /**
  * Google Calendar-specific recurrence rule implementation
@@ -57,7 +67,8 @@ import { ICalendar } from "./ical";
  * ## Implementation Details
  *
  * - Uses `GoogleEventGenerator` class for Google-specific event generation
- * - Leverages `TimezoneRegion.googleDatetimeResolved()` for DST handling
+ * - Leverages `TimezoneRegion.GoogleCursor` (`googleDatetimeResolved()` with a
+ *   transition cursor) for DST handling
  * - Implements proper date-only vs datetime UNTIL distinction in RRule parsing
  * - Handles nth-weekday patterns via `bynthday` field in RRuleLike interface
  *
@@ -91,89 +102,153 @@ interface RecurrenceGenerationState {
   startDateParsed: NaiveDate;
   startDateTime: DateTime<FixedOffset>; // Original datetime with offset to preserve local time
   timezone?: Option<TimezoneRegion>; // Timezone for handling DST shifts
-  excl: Set<number>;
+  context: Option<ExpansionContext>; // Per-series timezone work, done once
+  excl: ICalDateLine.Days;
   startDateExcluded: boolean;
   untilDate?: NaiveDate;
   untilDt: Option<DateTime<Utc>>;
-  allGeneratedEvents: DateTime<Utc>[]; // Buffer all generated events
+  pending: PendingEvent[]; // Generated but not yet returned (lookahead)
+  lastGenerated: Option<DateTime<Utc>>; // Most recently generated event
   generationComplete: boolean; // Track if we've exhausted the generator
-  lastReturnedIndex: number; // Track how many events we've returned so far
+  startPending: boolean; // The start date is still to be included
+  // Position of the raw generator and post-processor, kept up to date as
+  // they yield, and where the events returned so far left them
+  track: YearMonthDay.Continuation;
+  progress: EmitProgress;
+  returned: Recurrence.Cursor;
+  // Where the raw generator stopped on a period budget without a date, if it
+  // did: the series may carry on from there (see `token`)
+  stalled: { at: Option<YearMonthDay.Continuation> };
 }
 
-// Function to ensure all events are generated and buffered
+// An event with the cursor to resume from once it's been returned
+interface PendingEvent {
+  event: DateTime<Utc>;
+  cursor: Recurrence.Cursor;
+}
+
+// Timezone work that is the same for every occurrence of a series
+interface ExpansionContext {
+  // The original start time, as local time in the series' timezone
+  localTime: NaiveTime;
+  // Resolves DST for each occurrence in amortized O(1)
+  cursor: TimezoneRegion.GoogleCursor;
+}
+
+function expansionContext(
+  startDateTime: DateTime<FixedOffset>,
+  timezone: TimezoneRegion,
+): ExpansionContext {
+  // Convert the original start time to the proper local time in the target timezone
+  const startInTargetTimezone = startDateTime
+    .toUtc()
+    .toTz(timezone.tzAtMse(startDateTime.mse));
+  return {
+    localTime: startInTargetTimezone.ndt.time,
+    cursor: new TimezoneRegion.GoogleCursor(timezone, startDateTime),
+  };
+}
+
+// Function to generate events until one lands past endDate (or the series ends)
 function ensureEventsGenerated(
   state: RecurrenceGenerationState,
   endDate: NaiveDate,
 ): void {
-  // First, include start date if it should be included
-  if (!state.startDateExcluded && state.allGeneratedEvents.length === 0) {
-    state.allGeneratedEvents.push(state.startDateTime.toUtc());
-  }
+  pushStartEvent(state);
 
   // Continue generating from where we left off until we have enough events or generator is exhausted
   while (!state.generationComplete) {
     // Check if we already have events past the endDate - if so, we can stop for now
-    const lastGeneratedEvent =
-      state.allGeneratedEvents[state.allGeneratedEvents.length - 1];
+    const lastGeneratedEvent = state.lastGenerated;
     if (lastGeneratedEvent && lastGeneratedEvent.ndt.date.dse > endDate.dse) {
       return;
     }
+    generateNextEvent(state);
+  }
+}
 
-    const result = state.generator.next();
-    if (result.done) {
+// Pulls one date from the generator, pushing its event unless it's skipped
+function generateNextEvent(state: RecurrenceGenerationState): void {
+  const result = state.generator.next();
+  if (result.done) {
+    state.generationComplete = true;
+    return;
+  }
+
+  const dateInstance = result.value;
+  const cursor: Recurrence.Cursor = {
+    // the raw generator hasn't yielded yet if it's still at the sentinel
+    continuation: state.track.index < 0 ? null : { ...state.track },
+    emitted: state.progress.emitted,
+    watermark: dateInstance.dse,
+  };
+
+  // Skip if this is the start date and we already included it
+  if (
+    dateInstance.dse === state.startDateParsed.dse &&
+    !state.startDateExcluded
+  ) {
+    return;
+  }
+  // Skip what was returned before resuming
+  if (dateInstance.dse <= state.returned.watermark) return;
+
+  // Create datetime with proper timezone handling
+  let event: DateTime<Utc>;
+  if (state.context) {
+    // Create a naive datetime for the recurrence date at the same local time
+    const localRecurrenceNaiveDateTime = dateInstance.withTime(
+      state.context.localTime,
+    );
+
+    // Google Calendar always preserves local time across DST transitions
+    // Use Google-specific datetime resolution that preserves original timezone context
+    // This ensures that:
+    // - Spring forward (DST begins): Local time is preserved, UTC shifts earlier
+    // - Fall back (DST ends): Local time is preserved, UTC shifts later
+    const localRecurrenceDateTime = state.context.cursor.resolve(
+      localRecurrenceNaiveDateTime,
+    );
+    event = localRecurrenceDateTime.toUtc();
+    if (state.untilDt?.isBefore(event)) {
       state.generationComplete = true;
       return;
     }
+  } else {
+    // No timezone, just use the same time as the original start datetime
+    event = new DateTime(
+      dateInstance.withTime(state.startDateTime.ndt.time),
+      Utc,
+    );
+  }
+  pushEvent(state, event, cursor);
+}
 
-    const dateInstance = result.value;
+// The start date goes first, unless it's excluded or was already returned
+function pushStartEvent(state: RecurrenceGenerationState) {
+  if (!state.startPending) return;
+  state.startPending = false;
+  if (state.startDateExcluded) return;
+  if (state.startDateParsed.dse <= state.returned.watermark) return;
+  pushEvent(state, state.startDateTime.toUtc(), {
+    continuation: null,
+    emitted: 0,
+    watermark: state.startDateParsed.dse,
+  });
+}
 
-    // Skip if this is the start date and we already included it
-    if (
-      dateInstance.dse === state.startDateParsed.dse &&
-      !state.startDateExcluded
-    ) {
-      continue;
-    }
-
-    // Create datetime with proper timezone handling
-    let event: DateTime<Utc>;
-    if (state.timezone) {
-      // Convert the original start time to the proper local time in the target timezone
-      const startInTargetTimezone = state.startDateTime
-        .toUtc()
-        .toTz(state.timezone.tzAtMse(state.startDateTime.mse));
-      const originalLocalTime = startInTargetTimezone.ndt.time;
-
-      // Create a naive datetime for the recurrence date at the same local time
-      const localRecurrenceNaiveDateTime =
-        dateInstance.withTime(originalLocalTime);
-
-      // Google Calendar always preserves local time across DST transitions
-      // Use Google-specific datetime resolution that preserves original timezone context
-      // This ensures that:
-      // - Spring forward (DST begins): Local time is preserved, UTC shifts earlier
-      // - Fall back (DST ends): Local time is preserved, UTC shifts later
-      const localRecurrenceDateTime = state.timezone.googleDatetimeResolved(
-        localRecurrenceNaiveDateTime,
-        state.startDateTime,
-      );
-      event = localRecurrenceDateTime.toUtc();
-      if (state.untilDt?.isBefore(event)) {
-        state.generationComplete = true;
-        return;
-      }
-    } else {
-      // No timezone, just use the same time as the original start datetime
-      event = new DateTime(
-        dateInstance.withTime(state.startDateTime.ndt.time),
-        Utc,
-      );
-    }
-    state.allGeneratedEvents.push(event);
-  }
+function pushEvent(
+  state: RecurrenceGenerationState,
+  event: DateTime<Utc>,
+  cursor: Recurrence.Cursor,
+) {
+  state.pending.push({ event, cursor });
+  state.lastGenerated = event;
 }
 
-// Function to generate events up to a specific date using buffered approach
+// Function to generate events up to a specific date, streaming from the
+// generator. Only the lookahead past the previous endDate is kept around, so
+// each call costs proportional to the events it returns.
 function generateEventsUpToDate(
   state: RecurrenceGenerationState,
   endDate: NaiveDate,
@@ -181,16 +256,18 @@ function generateEventsUpToDate(
   // Ensure we have generated enough events up to the requested date
   ensureEventsGenerated(state, endDate);
 
-  // Find all events up to (and including) the endDate
-  const eventsUpToEndDate = state.allGeneratedEvents.filter(
-    (event) => event.ndt.date.dse <= endDate.dse,
-  );
-
-  // Return only the new events beyond what we've already returned
-  const newEvents = eventsUpToEndDate.slice(state.lastReturnedIndex);
-
-  // Update the index to track how many we've returned
-  state.lastReturnedIndex = eventsUpToEndDate.length;
+  // Return the pending events up to (and including) the endDate, keep the rest
+  const newEvents: DateTime<Utc>[] = [];
+  const remaining: PendingEvent[] = [];
+  for (const pending of state.pending) {
+    if (pending.event.ndt.date.dse <= endDate.dse) {
+      newEvents.push(pending.event);
+      state.returned = pending.cursor;
+    } else {
+      remaining.push(pending);
+    }
+  }
+  state.pending = remaining;
 
   return newEvents;
 }
@@ -218,12 +295,19 @@ function generateEventsUpToDate(
  */
 export class GoogleEventGenerator {
   private state: RecurrenceGenerationState;
+  private readonly recurrence: Recurrence;
 
+  /**
+   * With a `cursor` (see `token`), picks up after the events returned when
+   * it was taken, without replaying the series up to them.
+   */
   constructor(
     recurrence: Recurrence,
     startDateTime: DateTime<FixedOffset>,
     timezone?: Option<TimezoneRegion>,
+    cursor?: Option<Recurrence.Cursor>,
   ) {
+    this.recurrence = recurrence;
     const startDateParsed = startDateTime.ndt.date;
 
     // Check if RRULE has an UNTIL date
@@ -235,17 +319,24 @@ export class GoogleEventGenerator {
         : null;
 
     // Check if start date is excluded by EXDATE rules
-    const excl = new Set(
-      recurrence.inner.lines.exdate?.flatMap(
-        (exdate) => exdate.dates?.map((d) => d.dse) ?? [],
-      ) ?? [],
-    );
+    const excl = createExcludedDays(recurrence.inner);
     const startDateExcluded = excl.has(startDateParsed.dse);
 
-    const generator = recurrence.generateToDate(
+    // index -1 until the raw generator yields
+    const track: YearMonthDay.Continuation = cursor?.continuation
+      ? { ...cursor.continuation }
+      : { period: startDateParsed.castMaybeInValid(), index: -1, used: 0 };
+    const progress: EmitProgress = {
+      emitted: cursor?.emitted ?? 0,
+      watermark: cursor?.watermark ?? -Infinity,
+    };
+    const stalled: RecurrenceGenerationState["stalled"] = { at: null };
+    const generator = generateUntilExcl(
+      recurrence.inner,
       startDateParsed,
       untilDate, // Use UNTIL date if present, otherwise will generate indefinitely
       true, // Use Google Calendar behavior
+      { track, progress, resumed: !!cursor?.continuation, stalled },
     );
 
     this.state = {
@@ -253,16 +344,67 @@ export class GoogleEventGenerator {
       startDateParsed,
       startDateTime,
       timezone,
+      context: timezone ? expansionContext(startDateTime, timezone) : null,
       excl,
       startDateExcluded,
       untilDate,
       untilDt,
-      allGeneratedEvents: [],
+      pending: [],
+      lastGenerated: null,
       generationComplete: false,
-      lastReturnedIndex: 0,
+      startPending: true,
+      track,
+      progress,
+      stalled,
+      returned: cursor ?? {
+        continuation: null,
+        emitted: 0,
+        watermark: -Infinity,
+      },
     };
   }
 
+  /**
+   * Resumes the generator a `token` was taken from, see `token()`.
+   */
+  static resume(
+    recurrence: Recurrence,
+    startDateTime: DateTime<FixedOffset>,
+    timezone: Option<TimezoneRegion>,
+    token: string,
+  ): Result<GoogleEventGenerator> {
+    const cursor = Recurrence.Cursor.decode(recurrence, token);
+    if (cursor.asErr() != null) return err(cursor.asErr()!);
+    return ok(
+      new GoogleEventGenerator(
+        recurrence,
+        startDateTime,
+        timezone,
+        cursor.asOk()!,
+      ),
+    );
+  }
+
+  /**
+   * An opaque token for the position after the events returned so far, to
+   * carry on from with `GoogleEventGenerator.resume` (eg. on the next page
+   * of an API). Null once the series has ended; a series that stalled on a
+   * run of periods without a date still has a token, which picks up there.
+   */
+  token(): Option<string> {
+    const state = this.state;
+    if (state.pending.length === 0 && state.generationComplete) {
+      const at = state.stalled.at;
+      if (!at) return null;
+      return Recurrence.Cursor.encode(this.recurrence, {
+        continuation: at,
+        emitted: state.progress.emitted,
+        watermark: state.returned.watermark,
+      });
+    }
+    return Recurrence.Cursor.encode(this.recurrence, state.returned);
+  }
+
   /**
    * Generate recurrence events up to a specified end date.
    *
@@ -270,7 +412,7 @@ export class GoogleEventGenerator {
    * - Uses the earlier of the query end date or UNTIL date
    * - Handles DST transitions by preserving local time
    * - Applies proper EXDATE exclusions
-   * - Buffers events for efficient incremental generation
+   * - Streams events, so successive calls only pay for the new events
    *
    * @param endDate - The end date for event generation (exclusive)
    * @returns Array of generated events in UTC timezone
@@ -284,9 +426,31 @@ export class GoogleEventGenerator {
 
     return generateEventsUpToDate(this.state, effectiveEndDate);
   }
+
+  /**
+   * The next event after those already returned, or null once the series
+   * has ended or stalled (see `token`).
+   */
+  next(): Option<DateTime<Utc>> {
+    const state = this.state;
+    pushStartEvent(state);
+    while (state.pending.length === 0 && !state.generationComplete) {
+      generateNextEvent(state);
+    }
+    const pending = state.pending.shift();
+    if (!pending) return null;
+    state.returned = pending.cursor;
+    return pending.event;
+  }
 }
 
 export class Recurrence {
+  // lazily computed for `occursOn` and `countBetween`
+  private excluded: Option<ICalDateLine.Days> = null;
+  private cachedLayout: Option<Recurrence.Layout> = null;
+  private cachedMembers: Option<Recurrence.Members> = null;
+  private cachedTimes: Option<RRuleTimes> | undefined = undefined;
+
   constructor(readonly inner: ICalendar.Raw) {}
 
   static async parse(
@@ -300,6 +464,18 @@ export class Recurrence {
     return ok(new Recurrence(raw));
   }
 
+  /**
+   * `parse` for many series at once, loading their timezones in one batch
+   * (see `ICalendar.Raw.parseMany`).
+   */
+  static async parseMany(
+    series: Iterable<string[]>,
+    determinstic: boolean = false,
+  ): Promise<Result<Recurrence>[]> {
+    const raws = await ICalendar.Raw.parseMany(series, determinstic);
+    return raws.map((raw) => raw.map((r) => new Recurrence(r)));
+  }
+
   async timezone(): Promise<Option<TimezoneRegion>> {
     const tzid = this.inner.rrule?.inner.options?.tzid;
     if (!tzid) return null;
@@ -314,10 +490,565 @@ export class Recurrence {
     return generateUntilExcl(this.inner, date, end, useGoogleCalendarBehavior);
   }
 
-  generate(date?: Option<NaiveDate>, limit?: number): Generator<YearMonthDay> {
+  /**
+   * Generates the occurrences from `date` (DTSTART by default).
+   *
+   * An open-ended series examines at most `YearMonthDay.DEFAULT_BUDGET`
+   * periods; if that runs out first, the generator returns where it stopped
+   * rather than null, and `stream()` carries on past it.
+   */
+  generate(
+    date?: Option<NaiveDate>,
+    limit?: number,
+  ): Generator<YearMonthDay, Option<YearMonthDay.Continuation>> {
     return generateExcl(this.inner, date, limit);
   }
 
+  /**
+   * Generates occurrences on or after `date`.
+   *
+   * Unlike `generate(date)`, which restarts the series at `date`, the series
+   * stays anchored at DTSTART so INTERVAL alignment and COUNT still apply.
+   * The periods before `date` are skipped in closed form rather than
+   * replayed. Without `end`, it stops on the period budget like `generate`.
+   */
+  seek(
+    date: NaiveDate,
+    end?: Option<NaiveDate>,
+  ): Generator<YearMonthDay, Option<YearMonthDay.Continuation>> {
+    return generateExcl(this.inner, null, null, date, end);
+  }
+
+  /**
+   * Whether `generate()` would yield `date`, without generating the series.
+   *
+   * The period containing `date` is found from DTSTART and INTERVAL, and the
+   * rule's BYxxx parts are checked against that one date. With COUNT, the
+   * last occurrence is generated once and cached.
+   */
+  occursOn(date: NaiveDate): boolean {
+    if (this.inner.isSet) return this.setOccursOn(date);
+    const layout = this.layout();
+    if (date.dse < layout.first.dse) return false;
+    if (layout.last != null && date.dse > layout.last) return false;
+
+    this.excluded ??= createExcludedDays(this.inner);
+    if (this.excluded.has(date.dse)) return false;
+    return this.matches(layout, date);
+  }
+
+  /**
+   * Number of occurrences with a date in [start, end), as `generate()` would
+   * yield them.
+   *
+   * Only the first and last periods of the range are expanded; the whole
+   * periods in between are counted arithmetically (see
+   * `RRulePlan.countPeriods`). Recurrence sets are counted as they're
+   * generated.
+   */
+  countBetween(start: NaiveDate, end: NaiveDate): number {
+    if (this.inner.isSet) {
+      if (end.dse <= start.dse) return 0;
+      let count = 0;
+      for (const _ of this.seek(start, end.addDays(-1))) ++count;
+      return count;
+    }
+
+    const layout = this.layout();
+    const { step, origin, plan } = layout;
+    const lo = Math.max(start.dse, layout.first.dse);
+    const hi = Math.min(end.dse - 1, layout.last ?? Infinity);
+    if (hi < lo) return 0;
+
+    const inRange = (dse: number) => dse >= lo && dse <= hi;
+    const index = (dse: number) =>
+      YearMonthDay.ndindex(
+        origin,
+        step,
+        YearMonthDay.fromDse(dse as DaysSinceEpoch),
+      );
+    const first = index(lo);
+    const last = index(hi);
+
+    let count = 0;
+    for (const k of first === last ? [first] : [first, last]) {
+      const period = YearMonthDay.ndnth(origin, step, k);
+      for (const dse of plan.expand(period, step.type)) {
+        if (inRange(dse)) ++count;
+      }
+    }
+    count += plan.countPeriods(origin, step, first + 1, last);
+
+    this.excluded ??= createExcludedDays(this.inner);
+    for (const dse of this.excluded) {
+      const date = YearMonthDay.fromDse(dse as DaysSinceEpoch);
+      if (inRange(dse) && this.matches(layout, date)) --count;
+    }
+    return count;
+  }
+
+  /**
+   * Index of `date` among the occurrences `generate()` yields, or null if
+   * it isn't one.
+   */
+  indexOf(date: NaiveDate): Option<number> {
+    if (!this.occursOn(date)) return null;
+    const first = this.inner.isSet
+      ? this.members().first
+      : this.layout().first;
+    return this.countBetween(first, date);
+  }
+
+  /**
+   * Occurrences on or before `anchor`, latest first: the same dates as
+   * `generate()`, in reverse.
+   *
+   * Only the periods between DTSTART and `anchor` are looked at, and COUNT
+   * and UNTIL are applied by moving the anchor back to the series' last
+   * possible occurrence.
+   */
+  *reverse(anchor: NaiveDate): Generator<YearMonthDay> {
+    if (this.inner.isSet) {
+      yield* this.setReverse(anchor);
+      return;
+    }
+    const { first, step, options, last } = this.layout();
+    if (last != null && last < anchor.dse) {
+      if (last < first.dse) return;
+      anchor = YearMonthDay.fromDse(last as DaysSinceEpoch);
+    }
+    const filter = options.filter ?? YearMonthDay.Filter.identity();
+
+    this.excluded ??= createExcludedDays(this.inner);
+    const dates = YearMonthDay.ndrangeReverse({
+      start: first,
+      step,
+      filter: Array.isArray(filter)
+        ? YearMonthDay.Filter.compose(filter)
+        : filter,
+      end: options.end,
+      weekStart: options.weekStart ?? first.dayOfWeek,
+      anchor,
+      cadence: options.cadence,
+    });
+    for (const nd of dates) {
+      if (this.excluded.has(nd.dse)) continue;
+      yield nd;
+    }
+  }
+
+  /**
+   * The last occurrence strictly before `date`, if any.
+   */
+  previous(date: NaiveDate): Option<YearMonthDay> {
+    const dates = this.reverse(date.addDays(-1));
+    const found = dates.next();
+    dates.return(undefined);
+    return found.done ? null : found.value;
+  }
+
+  private layout(): Recurrence.Layout {
+    if (this.cachedLayout) return this.cachedLayout;
+
+    const first = this.inner.dtstart!.dates[0]!.date;
+    const rrule = this.inner.rrule!;
+    const { step, options } = rrule.toFilterProps(
+      null,
+      null,
+      false,
+      null,
+      first,
+    );
+    const weekStart = options?.weekStart ?? first.dayOfWeek;
+    let last = options?.end?.dse ?? null;
+    if (options?.limit) {
+      // COUNT bounds the expansion, excluded dates still count towards it
+      last = -Infinity;
+      const all = first.rangeProps({
+        step,
+        options: { ...options, budget: Infinity },
+      });
+      for (const nd of all) last = nd.dse;
+    }
+
+    return (this.cachedLayout = {
+      first,
+      step,
+      options: options ?? {},
+      origin: YearMonthDay.ndorigin(first, step, weekStart),
+      plan: rrule.compile(step.type),
+      last,
+    });
+  }
+
+  // each rule of a recurrence set as a series of its own
+  private members(): Recurrence.Members {
+    if (this.cachedMembers) return this.cachedMembers;
+
+    const dtstart = this.inner.dtstart;
+    const series = (rrule: RRule) =>
+      new Recurrence(new ICalendar.Raw({ dtstart, rrule }));
+    const rdates = [
+      ...new Set(
+        this.inner.lines.rdate?.flatMap((rdate) =>
+          rdate.dates.map((d) => d.date.dse),
+        ) ?? [],
+      ),
+    ].sort((a, b) => a - b);
+    const first = dtstart!.dates[0]!.date;
+
+    return (this.cachedMembers = {
+      rrules: this.inner.rrules.map(series),
+      exrules: (this.inner.lines.exrule ?? []).map(series),
+      rdates,
+      first:
+        rdates.length > 0 && rdates[0] < first.dse
+          ? YearMonthDay.fromDse(rdates[0] as DaysSinceEpoch)
+          : first,
+    });
+  }
+
+  private setOccursOn(date: NaiveDate): boolean {
+    const { rrules, exrules, rdates } = this.members();
+    this.excluded ??= createExcludedDays(this.inner);
+    if (this.excluded.has(date.dse)) return false;
+    if (exrules.some((exrule) => exrule.occursOn(date))) return false;
+    return (
+      rdates.includes(date.dse) ||
+      rrules.some((rrule) => rrule.occursOn(date))
+    );
+  }
+
+  private setReverse(anchor: NaiveDate): Generator<YearMonthDay> {
+    const { rrules, exrules, rdates } = this.members();
+    const included = RecurrenceSet.union(
+      [
+        ...rrules.map((rrule) => rrule.reverse(anchor)),
+        RecurrenceSet.dates(
+          rdates.filter((dse) => dse <= anchor.dse),
+          -1,
+        ),
+      ],
+      -1,
+    );
+    const dates = exrules.length
+      ? RecurrenceSet.difference(
+          included,
+          RecurrenceSet.union(
+            exrules.map((exrule) => exrule.reverse(anchor)),
+            -1,
+          ),
+          -1,
+        )
+      : included;
+
+    this.excluded ??= createExcludedDays(this.inner);
+    const excluded = this.excluded;
+    return (function* () {
+      for (const nd of dates) {
+        if (!excluded.has(nd.dse)) yield nd;
+      }
+    })();
+  }
+
+  // whether the rule itself produces `date`, ignoring the series bounds
+  private matches(layout: Recurrence.Layout, date: NaiveDate): boolean {
+    const { step, origin, plan } = layout;
+    const index = YearMonthDay.ndindex(origin, step, date);
+    const period = YearMonthDay.ndnth(origin, step, index);
+    return plan.includes(period, step.type, date.dse);
+  }
+
+  /**
+   * The next `size` occurrences after where `token` was taken (DTSTART
+   * without one), and the token for the page after them, null once the
+   * series has ended.
+   *
+   * The token records the rule's period and how far into it the page
+   * stopped, so a page resumes there instead of replaying the series from
+   * DTSTART. Recurrence sets resume by seeking past the last date returned.
+   * A page comes up short if the period budget runs out first; its token
+   * carries on from there.
+   */
+  page(size: number, token?: Option<string>): Result<Recurrence.Page> {
+    let cursor: Option<Recurrence.Cursor> = null;
+    if (token) {
+      const decoded = Recurrence.Cursor.decode(this, token);
+      if (decoded.asErr() != null) return err(decoded.asErr()!);
+      cursor = decoded.asOk()!;
+    }
+
+    const isSet = this.inner.isSet;
+    const continuation = isSet ? null : cursor?.continuation;
+    const budget = YearMonthDay.DEFAULT_BUDGET;
+    // index -1 until the rule yields
+    const track: YearMonthDay.Continuation = continuation
+      ? { ...continuation }
+      : {
+          period: this.inner.dtstart!.dates[0]!.date.castMaybeInValid(),
+          index: -1,
+          used: 0,
+        };
+    const seek =
+      cursor && !continuation
+        ? YearMonthDay.fromDse((cursor.watermark + 1) as DaysSinceEpoch)
+        : null;
+    const dates = isSet
+      ? generateSetExcl(this.inner, null, null, seek, null, { budget })
+      : generateExcl(this.inner, null, null, seek, null, {
+          budget,
+          resume: continuation ? { ...continuation } : null,
+          track,
+        });
+
+    const out: YearMonthDay[] = [];
+    let emitted = cursor?.emitted ?? 0;
+    let watermark = cursor?.watermark ?? -Infinity;
+    let rest: Option<YearMonthDay.Continuation> = null;
+    let resumeFrom: Option<number> = null;
+    while (out.length < size) {
+      const next = dates.next();
+      if (next.done) {
+        const cut = next.value;
+        if (!cut) return ok({ dates: out, token: null });
+        // out of budget: sets seek past the cut, rules carry on from it
+        if ("from" in cut) resumeFrom = cut.from.dse - 1;
+        else rest = cut;
+        break;
+      }
+      if (next.value.dse <= watermark) continue;
+      out.push(next.value);
+      watermark = next.value.dse;
+      ++emitted;
+    }
+
+    const next: Recurrence.Cursor = {
+      continuation: isSet
+        ? null
+        : rest ?? (track.index < 0 ? continuation ?? null : { ...track }),
+      emitted,
+      watermark: Math.max(watermark, resumeFrom ?? -Infinity),
+    };
+    return ok({ dates: out, token: Recurrence.Cursor.encode(this, next) });
+  }
+
+  /**
+   * Lazily generates occurrences on or after `from` (DTSTART by default),
+   * examining at most `budget` periods of the rule.
+   *
+   * Nothing is cut off silently: once iterated, the stream's `continuation`
+   * is set if the budget ran out before the series ended, and `resume()`
+   * carries on from there with a fresh budget.
+   */
+  stream(options: Recurrence.Stream.Options = {}): Recurrence.Stream {
+    return new Recurrence.Stream(this.inner, options, null);
+  }
+
+  /**
+   * Start instants, in ms since epoch, of the occurrences on or after
+   * `from`, with the same wall clock handling as `between`.
+   */
+  *instants(
+    from?: Option<NaiveDate>,
+    tz?: Option<TimezoneRegion>,
+  ): Generator<number> {
+    const dtstart = this.inner.dtstart!;
+    const region = tz ?? dtstart.region;
+    const cursor = region ? new TimezoneRegion.WallClockCursor(region) : null;
+
+    for (const local of this.locals(cursor, from)) {
+      yield local - (cursor?.offsetMs(local) ?? 0);
+    }
+  }
+
+  /**
+   * Occurrences with a local date in [start, end), as start instants packed
+   * into a `Float64Array` of epoch ms.
+   *
+   * Each occurrence is at DTSTART's time of day, or at the times picked by
+   * the rule's BYHOUR, BYMINUTE and BYSECOND parts and sub-daily FREQ (see
+   * `RRuleTimes`), as wall clock time in `tz` (DTSTART's TZID by default,
+   * otherwise UTC). With `withOffsets`, the UTC offset in ms of each
+   * occurrence is returned in a parallel array.
+   *
+   * Nothing is allocated per occurrence beyond the dates themselves; callers
+   * that need `DateTime`s can wrap the instants lazily.
+   */
+  between(
+    start: NaiveDate,
+    end: NaiveDate,
+    tz?: Option<TimezoneRegion>,
+    withOffsets: boolean = false,
+  ): Recurrence.Instants {
+    const dtstart = this.inner.dtstart!;
+    const region = tz ?? dtstart.region;
+    const cursor = region ? new TimezoneRegion.WallClockCursor(region) : null;
+
+    let mse = new Float64Array(Recurrence.INITIAL_INSTANTS);
+    let offsets = withOffsets
+      ? new Int32Array(Recurrence.INITIAL_INSTANTS)
+      : null;
+    let len = 0;
+    if (end.dse <= start.dse) return { mse: mse.slice(0, 0), offsets };
+
+    const last = end.addDays(-1);
+    for (const local of this.locals(cursor, start, last)) {
+      if (len === mse.length) {
+        const grown = new Float64Array(len * 2);
+        grown.set(mse);
+        mse = grown;
+        if (offsets) {
+          const grownOffsets = new Int32Array(len * 2);
+          grownOffsets.set(offsets);
+          offsets = grownOffsets;
+        }
+      }
+
+      const offset = cursor?.offsetMs(local) ?? 0;
+      mse[len] = local - offset;
+      if (offsets) offsets[len] = offset;
+      ++len;
+    }
+
+    return {
+      mse: mse.slice(0, len),
+      offsets: offsets?.slice(0, len) ?? null,
+    };
+  }
+
+  // local wall clock times, in ms since epoch, of the occurrences with a date
+  // from `from` to `end` (inclusive)
+  private *locals(
+    cursor: Option<TimezoneRegion.WallClockCursor>,
+    from?: Option<NaiveDate>,
+    end?: Option<NaiveDate>,
+  ): Generator<number> {
+    const times = this.times();
+    if (times) {
+      yield* generateTimedExcl(this.inner, times, cursor, from, end);
+      return;
+    }
+
+    // instants are consumed lazily and drop the continuation, so no budget
+    const tod = this.inner.dtstart!.dates[0]!.time.toMs;
+    const dates = generateExcl(this.inner, null, null, from, end, {
+      budget: Infinity,
+    });
+    for (const nd of dates) {
+      yield nd.dse * Time.MS_PER_DAY + tod;
+    }
+  }
+
+  // the times of day of a single rule, null if it's only at DTSTART's
+  private times(): Option<RRuleTimes> {
+    if (this.cachedTimes === undefined) {
+      this.cachedTimes = this.inner.isSet
+        ? null
+        : RRuleTimes.compile(
+            this.inner.rrule!.inner,
+            this.inner.dtstart!.dates[0]!.time,
+          );
+    }
+    return this.cachedTimes;
+  }
+
+  /**
+   * The occurrences of each of `recurrences` with a date in `window`, as
+   * `between` would give them.
+   *
+   * The window's calendar (each day's year, month, day of year and weekday)
+   * is built once and every rule is checked against it day by day, so a
+   * batch of series over the same days doesn't walk its periods once per
+   * series. UTC offsets are shared too, per timezone and time of day, and
+   * returned alongside as with `between` when `withOffsets` is set.
+   * Recurrence sets and rules with their own times of day are expanded
+   * with `between`.
+   */
+  static expandMany(
+    recurrences: Iterable<Recurrence>,
+    window: Recurrence.Window,
+    tz?: Option<TimezoneRegion>,
+    withOffsets: boolean = false,
+  ): Recurrence.Instants[] {
+    const out: Recurrence.Instants[] = [];
+    for (const recurrence of recurrences) {
+      out.push(
+        recurrence.inner.isSet || recurrence.times()
+          ? recurrence.between(window.start, window.end, tz, withOffsets)
+          : recurrence.within(window, tz, withOffsets),
+      );
+    }
+    return out;
+  }
+
+  private within(
+    window: Recurrence.Window,
+    tz?: Option<TimezoneRegion>,
+    withOffsets: boolean = false,
+  ): Recurrence.Instants {
+    const layout = this.layout();
+    const { first, step, origin, plan, last } = layout;
+    const dtstart = this.inner.dtstart!;
+    const region = tz ?? dtstart.region;
+    const tod = dtstart.dates[0]!.time.toMs;
+    const offsets = region ? window.offsets(region, tod) : null;
+    this.excluded ??= createExcludedDays(this.inner);
+
+    const lo = Math.max(first.dse - window.lo, 0);
+    const hi = Math.min((last ?? Infinity) - window.lo + 1, window.len);
+    const mse = new Float64Array(Math.max(hi - lo, 0));
+    const out = withOffsets ? new Int32Array(mse.length) : null;
+    let len = 0;
+
+    const unit = step.type;
+    // rules without BYxxx days only fall on DTSTART's anniversaries, and
+    // BYSETPOS needs the whole period, so both are checked on their own
+    const expands = plan.expands(unit);
+    const direct = (expands || unit === "day") && !plan.rules.setpos;
+    const base =
+      unit === "year"
+        ? origin.yr
+        : unit === "month"
+          ? origin.yr * 12 + origin.month1 - 1
+          : origin.dse;
+    const { years, months, days, doys, weekdays } = window;
+    let info: Option<RRulePlan.Year> = null;
+
+    for (let i = lo; i < hi; ++i) {
+      const dse = window.lo + i;
+      if (this.excluded.has(dse)) continue;
+      if (direct) {
+        // periods of one unit, every INTERVAL units from the origin
+        const units =
+          unit === "year"
+            ? years[i] - base
+            : unit === "month"
+              ? months[i] - base
+              : unit === "week"
+                ? Math.floor((dse - base) / 7)
+                : dse - base;
+        if (units % step.value !== 0) continue;
+        const year = info?.yr === years[i] ? info : plan.year(years[i]);
+        info = year;
+        if (!year.mask[doys[i]]) continue;
+      } else {
+        if (!expands && unit !== "day") {
+          const anniversary =
+            unit === "week"
+              ? weekdays[i] === origin.dayOfWeek.dow
+              : days[i] === origin.day;
+          if (!anniversary) continue;
+        }
+        const date = YearMonthDay.fromDse(dse as DaysSinceEpoch);
+        if (!this.matches(layout, date)) continue;
+      }
+      const offset = offsets?.[i] ?? 0;
+      if (out) out[len] = offset;
+      mse[len++] = dse * Time.MS_PER_DAY + tod - offset;
+    }
+    return { mse: mse.slice(0, len), offsets: out?.slice(0, len) ?? null };
+  }
+
   async generateGoogleEvents(
     startDateTime: DateTime<FixedOffset>,
     timezone: Option<TimezoneRegion>,
@@ -327,22 +1058,553 @@ export class Recurrence {
   }
 }
 
+export namespace Recurrence {
+  export const INITIAL_INSTANTS = 64;
+
+  // how the series maps onto the periods of its rule
+  export type Layout = {
+    // DTSTART's date
+    first: NaiveDate;
+    step: DateUnit;
+    options: YearMonthDay.FilterPropsOptions;
+    // start of period 0
+    origin: YearMonthDay.MaybeValid;
+    plan: RRulePlan;
+    // days since epoch of the last possible occurrence, from UNTIL or COUNT
+    last: Option<number>;
+  };
+
+  // the rules of a recurrence set, each as a series of its own
+  export type Members = {
+    rrules: Recurrence[];
+    exrules: Recurrence[];
+    // days since epoch of the RDATEs, sorted
+    rdates: number[];
+    // the earlier of DTSTART and the first RDATE
+    first: NaiveDate;
+  };
+
+  export type Instants = {
+    // occurrence start instants, in ms since epoch
+    mse: Float64Array;
+    // utc offset of each occurrence in ms, if requested
+    offsets: Option<Int32Array>;
+  };
+
+  export type Page = {
+    dates: YearMonthDay[];
+    // for the next page, null if the series has ended
+    token: Option<string>;
+  };
+
+  /**
+   * Where a paginated expansion stopped: the rule's position, how many
+   * occurrences have been returned, and the last one (the watermark, nothing
+   * on or before it is returned again).
+   */
+  export type Cursor = {
+    // null to resume by seeking past the watermark
+    continuation: Option<YearMonthDay.Continuation>;
+    emitted: number;
+    // days since epoch of the last occurrence returned
+    watermark: number;
+  };
+
+  export namespace Cursor {
+    export const VERSION = 1;
+
+    /**
+     * An opaque token for `cursor`: its fields in base 36, behind a version
+     * and a fingerprint of the recurrence it belongs to.
+     */
+    export function encode(recurrence: Recurrence, cursor: Cursor): string {
+      const c = cursor.continuation;
+      const fields = [
+        VERSION,
+        fingerprint(recurrence),
+        cursor.emitted,
+        cursor.watermark,
+        ...(c ? [c.period.yr, c.period.mth, c.period.day, c.index] : []),
+        ...(c ? [c.used, c.offset ?? 0] : []),
+      ];
+      // nothing returned yet leaves the watermark at -Infinity
+      return fields
+        .map((f) => (Number.isFinite(f) ? f.toString(36) : ""))
+        .join(".");
+    }
+
+    export function decode(
+      recurrence: Recurrence,
+      token: string,
+    ): Result<Cursor> {
+      const parts = token.split(".");
+      if (parts.length !== 4 && parts.length !== 10) {
+        return err(Error(`invalid cursor: ${token}`));
+      }
+      const fields: number[] = [];
+      for (const [i, part] of parts.entries()) {
+        if (i === 3 && part === "") {
+          fields.push(-Infinity);
+        } else if (/^-?[0-9a-z]+$/.test(part)) {
+          fields.push(parseInt(part, 36));
+        } else {
+          return err(Error(`invalid cursor: ${token}`));
+        }
+      }
+
+      const [version, hash, emitted, watermark] = fields;
+      if (version !== VERSION) {
+        return err(Error(`unsupported cursor version: ${version}`));
+      }
+      if (hash !== fingerprint(recurrence)) {
+        return err(Error("cursor is for a different recurrence"));
+      }
+      const [yr, mth, day, index, used, offset] = fields.slice(4);
+      const continuation =
+        fields.length === 10
+          ? {
+              period: YearMonthDay.fromYmd1Unchecked(yr, mth, day),
+              index,
+              used,
+              offset,
+            }
+          : null;
+      return ok({ continuation, emitted, watermark });
+    }
+
+    // FNV-1a of the recurrence's lines
+    function fingerprint(recurrence: Recurrence): number {
+      const s = recurrence.inner.toString();
+      let hash = 0x811c9dc5;
+      for (let i = 0; i < s.length; ++i) {
+        hash ^= s.charCodeAt(i);
+        hash = Math.imul(hash, 0x01000193);
+      }
+      return hash >>> 0;
+    }
+  }
+
+  export class Stream implements Iterable<YearMonthDay> {
+    // where to resume from, set once iteration stops on the budget
+    continuation: Option<YearMonthDay.Continuation> = null;
+    // recurrence sets resume by seeking their rules to this date instead
+    private resumeFrom: Option<NaiveDate> = null;
+
+    constructor(
+      private readonly inner: ICalendar.Raw,
+      readonly options: Stream.Options,
+      private readonly from: Option<YearMonthDay.Continuation>,
+    ) {}
+
+    *[Symbol.iterator](): Generator<YearMonthDay> {
+      const budget = this.options.budget ?? YearMonthDay.DEFAULT_BUDGET;
+      if (this.inner.isSet) {
+        const cut = yield* generateSetExcl(
+          this.inner,
+          null,
+          null,
+          this.options.from,
+          this.options.end,
+          { budget },
+        );
+        this.continuation = cut?.continuation ?? null;
+        this.resumeFrom = cut?.from ?? null;
+        return;
+      }
+      this.continuation = yield* generateExcl(
+        this.inner,
+        null,
+        null,
+        this.options.from,
+        this.options.end,
+        { budget, resume: this.from },
+      );
+    }
+
+    /**
+     * The rest of the series after an exhausted budget, or null if the
+     * series ended.
+     */
+    resume(budget?: number): Option<Stream> {
+      if (!this.continuation) return null;
+      const options = {
+        ...this.options,
+        budget: budget ?? this.options.budget,
+      };
+      if (this.resumeFrom) {
+        return new Stream(
+          this.inner,
+          { ...options, from: this.resumeFrom },
+          null,
+        );
+      }
+      return new Stream(this.inner, options, this.continuation);
+    }
+  }
+
+  export namespace Stream {
+    export type Options = Optional<{
+      from: NaiveDate; // inclusive
+      end: NaiveDate; // inclusive
+      // maximum number of periods to examine
+      budget: number;
+    }>;
+  }
+
+  /**
+   * The calendar of a range of days, from `start` up to `end` (exclusive),
+   * as typed arrays indexed by day, for `Recurrence.expandMany`.
+   */
+  export class Window {
+    // days since epoch of `start`
+    readonly lo: number;
+    readonly len: number;
+    readonly years: Int32Array;
+    // months since year 0
+    readonly months: Int32Array;
+    // day of month, 1-indexed
+    readonly days: Uint8Array;
+    // day of year, 0-indexed
+    readonly doys: Uint16Array;
+    // indexed like `Weekday.dow`
+    readonly weekdays: Uint8Array;
+    // utc offsets in ms of each day, by timezone and time of day
+    private readonly tables = new Map<
+      TimezoneRegion,
+      Map<number, Int32Array>
+    >();
+
+    constructor(
+      readonly start: NaiveDate,
+      readonly end: NaiveDate,
+    ) {
+      this.lo = start.dse;
+      this.len = Math.max(end.dse - start.dse, 0);
+      this.years = new Int32Array(this.len);
+      this.months = new Int32Array(this.len);
+      this.days = new Uint8Array(this.len);
+      this.doys = new Uint16Array(this.len);
+      this.weekdays = new Uint8Array(this.len);
+
+      let nd = start;
+      for (let i = 0; i < this.len; ++i, nd = nd.addDays(1)) {
+        this.years[i] = nd.yr;
+        this.months[i] = nd.yr * 12 + nd.month1 - 1;
+        this.days[i] = nd.day;
+        this.doys[i] = nd.dayOfYear - 1;
+        this.weekdays[i] = nd.dayOfWeek.dow;
+      }
+    }
+
+    /**
+     * The utc offset in ms of `tod` (ms from midnight) on each day in
+     * `region`, computed once per window.
+     */
+    offsets(region: TimezoneRegion, tod: number): Int32Array {
+      let byTod = this.tables.get(region);
+      if (!byTod) this.tables.set(region, (byTod = new Map()));
+      let table = byTod.get(tod);
+      if (!table) {
+        table = new Int32Array(this.len);
+        const cursor = new TimezoneRegion.WallClockCursor(region);
+        for (let i = 0; i < this.len; ++i) {
+          table[i] = cursor.offsetMs((this.lo + i) * Time.MS_PER_DAY + tod);
+        }
+        byTod.set(tod, table);
+      }
+      return table;
+    }
+  }
+}
+
 function* generateExcl(
   inner: ICalendar.Raw,
   date?: Option<NaiveDate>,
   limit?: Option<number>,
-) {
-  const generator = (date ?? inner.dtstart!.dates[0]!.date).rangeProps(
-    inner.rrule!.toFilterProps(limit),
+  seek?: Option<NaiveDate>,
+  end?: Option<NaiveDate>,
+  overrides: NaiveDate.FilterPropsOptions = {},
+): Generator<YearMonthDay, Option<YearMonthDay.Continuation>> {
+  if (inner.isSet) {
+    const cut = yield* generateSetExcl(
+      inner,
+      date,
+      limit,
+      seek,
+      end,
+      overrides,
+    );
+    return cut?.continuation ?? null;
+  }
+
+  const start = date ?? inner.dtstart!.dates[0]!.date;
+  const props = inner.rrule!.toFilterProps(limit, end, false, seek, start);
+  const generator = start.rangeProps({
+    step: props.step,
+    options: { ...props.options, ...overrides },
+  });
+  const excl = createExcludedDays(inner);
+  for (let next = generator.next(); ; next = generator.next()) {
+    if (next.done) return next.value;
+    if (excl.has(next.value.dse)) continue;
+    yield next.value;
+  }
+}
+
+// The dates of a recurrence set: its RRULEs and RDATEs merged, minus its
+// EXRULEs and EXDATEs. Each rule applies its own COUNT, while `limit` caps
+// the set as a whole.
+function* generateSetExcl(
+  inner: ICalendar.Raw,
+  date?: Option<NaiveDate>,
+  limit?: Option<number>,
+  seek?: Option<NaiveDate>,
+  end?: Option<NaiveDate>,
+  overrides: NaiveDate.FilterPropsOptions = {},
+): Generator<YearMonthDay, Option<RecurrenceSet.Cut>> {
+  const start = date ?? inner.dtstart!.dates[0]!.date;
+  const expand = (rrule: RRule, limit?: Option<number>) => {
+    const props = rrule.toFilterProps(limit, end, false, seek, start);
+    const options = { ...props.options, ...overrides };
+    // seeking backs off a period, which would eat a budget of 1 whole
+    if (options.budget != null) options.budget += 1;
+    return RecurrenceSet.rule(
+      start.rangeProps({ step: props.step, options }),
+      props.step.type,
+    );
+  };
+
+  const from = seek ?? date;
+  const rdates = RecurrenceSet.dates(
+    inner.lines.rdate
+      ?.flatMap((rdate) => rdate.dates.map((d) => d.date.dse))
+      .filter(
+        (dse) => (!from || dse >= from.dse) && (!end || dse <= end.dse),
+      ) ?? [],
   );
-  const excl = new Set(
-    inner.lines.exdate?.flatMap(
-      (exdate) => exdate.dates?.map((d) => d.dse) ?? [],
-    ) ?? [],
+  const included = RecurrenceSet.union([
+    ...inner.rrules.map((rrule) => expand(rrule, limit)),
+    rdates,
+  ]);
+  const dates = inner.lines.exrule?.length
+    ? RecurrenceSet.difference(
+        included,
+        RecurrenceSet.union(
+          inner.lines.exrule.map((exrule) => expand(exrule)),
+        ),
+      )
+    : included;
+
+  const excl = createExcludedDays(inner);
+  let count = 0;
+  let last: Option<YearMonthDay> = null;
+  for (let next = dates.next(); ; next = dates.next()) {
+    if (next.done) {
+      const cut = next.value;
+      // never resume before what's already been yielded
+      if (cut && last && cut.from.dse <= last.dse) {
+        return { ...cut, from: last.addDays(1) };
+      }
+      return cut;
+    }
+    if (excl.has(next.value.dse)) continue;
+    last = next.value;
+    yield last;
+    if (limit && ++count >= limit) return null;
+  }
+}
+
+// Local wall clock times of the occurrences of a rule with times of day,
+// with a date from `from` to `end`. COUNT and UNTIL apply to the instants
+// rather than the days, and an EXDATE removes the instant it names (or the
+// whole day, for VALUE=DATE).
+function* generateTimedExcl(
+  inner: ICalendar.Raw,
+  times: RRuleTimes,
+  cursor: Option<TimezoneRegion.WallClockCursor>,
+  from?: Option<NaiveDate>,
+  end?: Option<NaiveDate>,
+): Generator<number> {
+  const first = inner.dtstart!.dates[0]!;
+  const rrule = inner.rrule!;
+  const count = rrule.inner.options?.count;
+  const until = rrule.inner.options?.until;
+  const setpos = RRulePlan.positions(rrule.inner.options?.bysetpos);
+
+  // with COUNT or BYSETPOS, the days before `from` still have to be seen
+  const props = rrule.toFilterProps(
+    null,
+    end,
+    false,
+    count || setpos ? null : from,
+    first.date,
   );
-  for (const nd of generator) {
-    if (excl.has(nd.dse)) continue;
-    yield nd;
+  // BYSETPOS needs every period whole, so the end is applied after it
+  const last = props.options?.end ?? null;
+  const days = first.date.rangeProps({
+    step: props.step,
+    options: {
+      ...props.options,
+      limit: null,
+      end: setpos ? null : last,
+      budget: Infinity,
+    },
+  });
+  const locals = setpos
+    ? selectTimed(rrule, times, first.date, days, props, setpos, last)
+    : timedLocals(times, first.date, days);
+
+  // whole days are looked up in the lines' index; other EXDATEs are
+  // instants, in their own TZID, UTC with a trailing Z, or else at the
+  // series' wall clock
+  const exdates = inner.lines.exdate ?? [];
+  const excludedDays = ICalDateLine.Days.of(
+    exdates.filter((exdate) => exdate.value === "DATE"),
+  );
+  const excluded = new Set<number>();
+  for (const exdate of exdates) {
+    if (exdate.value === "DATE") continue;
+    const zone = exdate.utc
+      ? null
+      : exdate.region
+        ? new TimezoneRegion.WallClockCursor(exdate.region)
+        : cursor;
+    for (const d of exdate.dates) {
+      const local = d.date.dse * Time.MS_PER_DAY + d.time.toMs;
+      excluded.add(local - (zone?.offsetMs(local) ?? 0));
+    }
+  }
+
+  const startMs = first.date.dse * Time.MS_PER_DAY + first.time.toMs;
+  const fromMs = from ? from.dse * Time.MS_PER_DAY : -Infinity;
+  const endMs = last ? (last.dse + 1) * Time.MS_PER_DAY : Infinity;
+  const untilMs = until?.nt
+    ? until.nd.dse * Time.MS_PER_DAY + until.nt.toMs
+    : null;
+
+  let counted = 0;
+  for (const local of locals) {
+    if (local < startMs) continue;
+    if (local >= endMs) return;
+    if (untilMs != null) {
+      // a UTC UNTIL is compared against the instant
+      const t = until!.z ? local - (cursor?.offsetMs(local) ?? 0) : local;
+      if (t > untilMs) return;
+    }
+    if (count && ++counted > count) return;
+    if (local < fromMs) continue;
+    const dse = Math.floor(local / Time.MS_PER_DAY);
+    if (excludedDays.has(dse)) continue;
+    if (excluded.size > 0) {
+      const instant = local - (cursor?.offsetMs(local) ?? 0);
+      if (excluded.has(instant)) continue;
+    }
+    yield local;
+  }
+}
+
+// local times of the instants on `days`, including those before DTSTART
+function* timedLocals(
+  times: RRuleTimes,
+  start: NaiveDate,
+  days: Iterable<NaiveDate>,
+): Generator<number> {
+  for (const day of days) {
+    const midnight = day.dse * Time.MS_PER_DAY;
+    for (const offset of times.offsets(day.dse - start.dse)) {
+      yield midnight + offset;
+    }
+  }
+}
+
+// The BYSETPOS picks among the instants of each of the rule's periods, up to
+// the end of the period containing `last`. The first period is filled in
+// from before DTSTART, since its earlier instants still count.
+function* selectTimed(
+  rrule: RRule,
+  times: RRuleTimes,
+  start: NaiveDate,
+  days: Iterable<NaiveDate>,
+  props: NaiveDate.FilterProps,
+  positions: number[],
+  last: Option<NaiveDate>,
+): Generator<number> {
+  const { step } = props;
+  const origin = YearMonthDay.ndorigin(
+    start.castMaybeInValid(),
+    step,
+    props.options?.weekStart ?? start.dayOfWeek,
+  );
+  // sub-daily periods are the frequency's slots, otherwise they're the
+  // day generator's
+  const slotMs = times.stride != null ? times.rules.unit * Time.MS_PER_SEC : 0;
+  const period = (day: NaiveDate, local: number) =>
+    slotMs
+      ? Math.floor(local / slotMs)
+      : YearMonthDay.ndindex(origin, step, day.castMaybeInValid());
+
+  const before =
+    !slotMs && step.type !== "day"
+      ? rrule
+          .compile(step.type)
+          .expand(origin, step.type)
+          .filter((dse) => dse < start.dse)
+          .map((dse) => YearMonthDay.fromDse(dse as DaysSinceEpoch))
+      : [];
+
+  const all = (function* () {
+    yield* before;
+    yield* days;
+  })();
+
+  const setpos = new RRulePlan.SetPos(positions);
+  let current: Option<number> = null;
+  let finished = false;
+  for (const day of all) {
+    // the end's period is the last one needed
+    finished ||= !!last && day.dse > last.dse;
+    const midnight = day.dse * Time.MS_PER_DAY;
+    for (const offset of times.offsets(day.dse - start.dse)) {
+      const local = midnight + offset;
+      const key = period(day, local);
+      if (key !== current) {
+        yield* setpos.flush();
+        if (finished) return;
+        current = key;
+      }
+      const picked = setpos.push(local);
+      if (picked != null) yield picked;
+    }
+  }
+  yield* setpos.flush();
+}
+
+// Runs `expand` from `from`, resuming it each time its period budget runs
+// out. A budget that runs out without a single date stops the run, since
+// Google's BYWEEKNO filters have no plan to prove a rule empty and would
+// otherwise spin forever; where it stopped is recorded in `stalled` and
+// returned, so it isn't mistaken for the end of the series.
+function* resumed(
+  expand: (
+    from: Option<YearMonthDay.Continuation>,
+  ) => Generator<YearMonthDay, Option<YearMonthDay.Continuation>>,
+  from: Option<YearMonthDay.Continuation>,
+  stalled?: Option<{ at: Option<YearMonthDay.Continuation> }>,
+): Generator<YearMonthDay, Option<YearMonthDay.Continuation>> {
+  for (;;) {
+    const dates = expand(from);
+    let any = false;
+    let next = dates.next();
+    for (; !next.done; next = dates.next()) {
+      any = true;
+      yield next.value;
+    }
+    if (!next.value) return null;
+    if (!any) {
+      if (stalled) stalled.at = next.value;
+      return next.value;
+    }
+    from = next.value;
   }
 }
 
@@ -355,6 +1617,13 @@ function* generateUntilExcl(
   date?: Option<NaiveDate>,
   end?: Option<NaiveDate>,
   useGoogleCalendarBehavior?: boolean,
+  // kept up to date for `GoogleEventGenerator.token`, and resumed from
+  resume?: Option<{
+    track: YearMonthDay.Continuation;
+    progress: EmitProgress;
+    resumed: boolean;
+    stalled: { at: Option<YearMonthDay.Continuation> };
+  }>,
 ) {
   const originalStartDate = date ?? inner.dtstart!.dates[0]!.date;
 
@@ -366,12 +1635,25 @@ function* generateUntilExcl(
   );
 
   // Create raw event generator
-  const rawGenerator = generatorStartDate.rangeProps(
-    inner.rrule!.toFilterProps(null, end, useGoogleCalendarBehavior),
+  const props = inner.rrule!.toFilterProps(
+    null,
+    end,
+    useGoogleCalendarBehavior,
+    null,
+    generatorStartDate,
+  );
+  const rawGenerator = resumed(
+    (from) =>
+      generatorStartDate.rangeProps({
+        step: props.step,
+        options: { ...props.options, track: resume?.track, resume: from },
+      }),
+    resume?.resumed ? { ...resume.track } : null,
+    resume?.stalled,
   );
 
   // Create excluded dates set using utility function
-  const excl = createExcludedDatesSet(inner);
+  const excl = createExcludedDays(inner);
 
   // Detect COUNT pattern and use comprehensive post-processor
   const pattern = detectCountPattern(inner, useGoogleCalendarBehavior);
@@ -385,5 +1667,7 @@ function* generateUntilExcl(
     originalStartDate,
     excl,
     inner,
+    resume?.progress,
+    resume?.resumed,
   );
 }
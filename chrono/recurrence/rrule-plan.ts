@@ -0,0 +1,928 @@
+import { DateUnit } from "../units/date-unit";
+import { Month } from "../units/month";
+import { PartialDate } from "../units/partial-date";
+import { Easter } from "../units/easter";
+import { DaysSinceEpoch } from "../units/units";
+import { Weekday } from "../units/weekday";
+import { Year } from "../units/year";
+import { YearMonthDay } from "../units/year-month-day";
+import { YearMonthDayFilter } from "../units/year-month-day-filter";
+import { TentoMath } from "../utils";
+import { RRuleLike } from "./rrule";
+
+/**
+ * A compiled form of an RRULE's BYxxx parts.
+ *
+ * Instead of chaining one generator per BYxxx part for every period, the
+ * plan folds all of them into a single per-year mask (one byte per day of
+ * the year). A period's occurrences are then the set bits of the mask that
+ * fall inside the period.
+ *
+ * The per-year mask is the AND of:
+ *   - month mask (BYMONTH)
+ *   - weekday mask (BYDAY, or BYDAY with an ordinal, relative to the year or
+ *     month depending on the frequency)
+ *   - monthday and negative-monthday masks (BYMONTHDAY)
+ *   - yearday mask (BYYEARDAY)
+ *   - weekno mask (BYWEEKNO, ISO weeks)
+ *   - easter mask (BYEASTER, from `Easter`'s table)
+ *
+ * BYSETPOS then picks from each period's occurrences as they're read off the
+ * mask (see `RRulePlan.SetPos`).
+ *
+ * Years of the same type (see `RRulePlan.yearType`) share their mask and its
+ * sorted days, so a long expansion computes at most 14 of them (56 with
+ * BYWEEKNO), and a period's occurrences are found by binary search.
+ *
+ * NOTE: Google Calendar's BYWEEKNO behaviour isn't expressible as a mask and
+ * still goes through `YearMonthDayFilter`.
+ */
+export class RRulePlan {
+  private readonly years = new Map<number, RRulePlan.Year>();
+  // per-year occurrences by `RRulePlan.yearType`, unless the rule has
+  // BYEASTER (which doesn't repeat with the calendar)
+  private readonly types: Option<RRulePlan.Occurrences>[] = new Array(
+    RRulePlan.NUM_YEAR_TYPES,
+  );
+  private analysis: Option<RRulePlan.Analysis> = null;
+  private readonly cadences = new Map<string, Option<YearMonthDay.Cadence>>();
+  // 1 at the `RRulePlan.cycleIndex` of each year or month of the calendar
+  // cycle that can have occurrences, null if they all can
+  private readonly periods = new Map<"year" | "month", Option<Uint8Array>>();
+  // prefix sums of the occurrences per period over a calendar cycle
+  private readonly tallies = new Map<string, Int32Array>();
+
+  constructor(
+    readonly unit: DateUnit.Type,
+    readonly rules: RRulePlan.Rules,
+  ) {}
+
+  /**
+   * `withSetpos` is false for rules with times of day, whose BYSETPOS picks
+   * among instants rather than days.
+   */
+  static compile(
+    options: RRuleLike["options"],
+    unit: DateUnit.Type,
+    withSetpos: boolean = true,
+  ): RRulePlan {
+    const flags = (values: Option<number[]>, size: number, sign: 1 | -1) => {
+      if (!values || values.length === 0) return null;
+      let mask: Option<Uint8Array> = null;
+      for (const v of values) {
+        const idx = v * sign;
+        if (idx <= 0 || idx >= size) continue;
+        mask ??= new Uint8Array(size);
+        mask[idx] = 1;
+      }
+      // all values out of range, nothing can match
+      return mask ?? new Uint8Array(size);
+    };
+    const split = (values: Option<number[]>, size: number) => {
+      if (!values || values.length === 0) return [null, null];
+      const pos = values.filter((v) => v > 0);
+      const neg = values.filter((v) => v < 0);
+      return [
+        flags(pos, size, 1) ?? new Uint8Array(size),
+        flags(neg, size, -1) ?? new Uint8Array(size),
+      ];
+    };
+
+    let weekdays: Option<Uint8Array> = null;
+    let nth: Option<Weekday.Nth[]> = null;
+    let nthScope: Option<"year" | "month"> = null;
+    if (options?.bynthday && options.bynthday.length > 0) {
+      if (unit === "year" || unit === "month") {
+        nth = options.bynthday;
+        nthScope =
+          unit === "year" && !(options.bymonth && options.bymonth.length > 0)
+            ? "year"
+            : "month";
+      } else {
+        weekdays = flags(
+          options.bynthday.map((n) => n.weekday.dow),
+          8,
+          1,
+        );
+      }
+    } else if (options?.byday && options.byday.length > 0) {
+      weekdays = flags(
+        options.byday.map((d) => d.dow),
+        8,
+        1,
+      );
+    }
+
+    const [monthdays, negMonthdays] = split(options?.bymonthday, 32);
+    const [yeardays, negYeardays] = split(options?.byyearday, 367);
+    const [weeknos, negWeeknos] = split(options?.byweekno, 54);
+
+    return new RRulePlan(unit, {
+      months: flags(options?.bymonth, 13, 1),
+      weekdays,
+      nth,
+      nthScope,
+      monthdays,
+      negMonthdays,
+      yeardays,
+      negYeardays,
+      weeknos,
+      negWeeknos,
+      easter:
+        options?.byeaster && options.byeaster.length > 0
+          ? options.byeaster
+          : null,
+      setpos: withSetpos ? RRulePlan.positions(options?.bysetpos) : null,
+    });
+  }
+
+  /**
+   * Whether periods of `unit` are expanded into (potentially) many days or
+   * only yield the period's anniversary of DTSTART.
+   */
+  expands(unit: DateUnit.Type): boolean {
+    if (unit === "day") return false;
+    const r = this.rules;
+    return !!(
+      r.weekdays ||
+      r.nth ||
+      r.monthdays ||
+      r.yeardays ||
+      r.weeknos ||
+      r.easter
+    );
+  }
+
+  year(yr: number): RRulePlan.Year {
+    const existing = this.years.get(yr);
+    if (existing) return existing;
+
+    const dse = Year.dseFromYear(yr);
+    const leap = Year.isLeapYear(yr) ? 1 : 0;
+    const len = 365 + leap;
+    const r = this.rules;
+    const type = r.easter ? null : RRulePlan.yearType(yr, !!r.weeknos);
+    let occurrences = type != null ? this.types[type] : null;
+    if (!occurrences) {
+      const mask = this.#mask(yr);
+      occurrences = { mask, offsets: RRulePlan.offsets(mask) };
+      if (type != null) this.types[type] = occurrences;
+    }
+
+    if (this.years.size >= RRulePlan.MAX_CACHED_YEARS) this.years.clear();
+    const info = { yr, dse, len, ...occurrences };
+    this.years.set(yr, info);
+    return info;
+  }
+
+  #mask(yr: number): Uint8Array {
+    const dse = Year.dseFromYear(yr);
+    const leap = Year.isLeapYear(yr) ? 1 : 0;
+    const len = 365 + leap;
+    const mask = new Uint8Array(len);
+    const r = this.rules;
+
+    const mmask = RRulePlan.MONTH_MASK[leap];
+    const mdaymask = RRulePlan.MONTHDAY_MASK[leap];
+    const nmdaymask = RRulePlan.NEG_MONTHDAY_MASK[leap];
+    const wdaymask = RRulePlan.weekdayMask(dse);
+    const wnomask = r.weeknos ? RRulePlan.weeknoMask(yr, r) : null;
+    const nthmask = r.nth ? RRulePlan.nthMask(yr, r.nth, r.nthScope!) : null;
+    const eastermask = r.easter ? RRulePlan.easterMask(yr, r.easter) : null;
+
+    for (let doy = 0; doy < len; ++doy) {
+      if (r.months && !r.months[mmask[doy]]) continue;
+      if (r.weekdays && !r.weekdays[wdaymask[doy]]) continue;
+      if (nthmask && !nthmask[doy]) continue;
+      if (
+        r.monthdays &&
+        !r.monthdays[mdaymask[doy]] &&
+        !r.negMonthdays![nmdaymask[doy]]
+      )
+        continue;
+      if (r.yeardays && !r.yeardays[doy + 1] && !r.negYeardays![len - doy])
+        continue;
+      if (wnomask && !wnomask[doy]) continue;
+      if (eastermask && !eastermask[doy]) continue;
+      mask[doy] = 1;
+    }
+    return mask;
+  }
+
+  /**
+   * Occurrences of the period starting at `cand`, as sorted days since epoch.
+   */
+  expand(cand: YearMonthDay.MaybeValid, unit: DateUnit.Type): number[] {
+    const out = this.#candidates(cand, unit);
+    return this.rules.setpos ? Array.from(this.#select(out)) : out;
+  }
+
+  // the period's days that match the mask, before BYSETPOS
+  #candidates(cand: YearMonthDay.MaybeValid, unit: DateUnit.Type): number[] {
+    const out: number[] = [];
+    if (!this.expands(unit)) {
+      if (unit === "year" && this.rules.months) {
+        for (let mth = 1; mth <= 12; ++mth) {
+          if (!this.rules.months[mth]) continue;
+          this.#push(out, YearMonthDay.fromYmd1Unchecked(cand.yr, mth, cand.day));
+        }
+      } else {
+        this.#push(out, cand);
+      }
+      return out;
+    }
+
+    const [lo, hi] = this.#bounds(cand, unit);
+    this.#spans(lo, hi, (info, from, to) => {
+      for (let i = from; i < to; ++i) out.push(info.dse + info.offsets[i]);
+    });
+    return out;
+  }
+
+  // calls `fn` with each year overlapping [lo, hi) and the range of its
+  // `offsets` inside it
+  #spans(
+    lo: number,
+    hi: number,
+    fn: (info: RRulePlan.Year, from: number, to: number) => void,
+  ) {
+    let info = this.year(YearMonthDay.fromDse(lo as DaysSinceEpoch).yr);
+    for (;;) {
+      const end = Math.min(hi, info.dse + info.len);
+      const offsets = info.offsets;
+      fn(
+        info,
+        RRulePlan.lowerBound(offsets, lo - info.dse),
+        RRulePlan.lowerBound(offsets, end - info.dse),
+      );
+      if (end >= hi) return;
+      lo = end;
+      info = this.year(info.yr + 1);
+    }
+  }
+
+  /**
+   * Whether `dse` is one of the occurrences of the period starting at `cand`,
+   * without expanding the period.
+   */
+  includes(
+    cand: YearMonthDay.MaybeValid,
+    unit: DateUnit.Type,
+    dse: number,
+  ): boolean {
+    // at most one anniversary per month
+    if (!this.expands(unit)) return this.expand(cand, unit).includes(dse);
+
+    const [lo, hi] = this.#bounds(cand, unit);
+    if (dse < lo || dse >= hi) return false;
+    const info = this.year(YearMonthDay.fromDse(dse as DaysSinceEpoch).yr);
+    if (info.mask[dse - info.dse] !== 1) return false;
+
+    const setpos = this.rules.setpos;
+    if (!setpos) return true;
+    // its position among the period's candidates
+    const index = this.#tally(lo, dse);
+    const n = index + this.#tally(dse, hi);
+    return RRulePlan.SetPos.selects(setpos, index, n);
+  }
+
+  // days since epoch spanned by the period starting at `cand`, [lo, hi)
+  #bounds(
+    cand: YearMonthDay.MaybeValid,
+    unit: DateUnit.Type,
+  ): [number, number] {
+    let lo: number;
+    let hi: number;
+    switch (unit) {
+      case "year":
+        lo = Year.dseFromYear(cand.yr);
+        hi = lo + Year.length(cand.yr);
+        break;
+      case "month":
+        lo = YearMonthDay.fromYmd1Unchecked(cand.yr, cand.mth, 1).dse;
+        hi = lo + Month.DAYS_IN_MONTH[Year.isLeapYear(cand.yr) ? 1 : 0][
+          cand.mth - 1
+        ];
+        break;
+      case "week":
+        lo = cand.dse;
+        hi = lo + 7;
+        break;
+      case "day":
+        lo = cand.dse;
+        hi = lo + 1;
+        break;
+    }
+    return [lo, hi];
+  }
+
+  #push(out: number[], nd: YearMonthDay.MaybeValid) {
+    if (!nd.isValid()) return;
+    const info = this.year(nd.yr);
+    const dse = nd.dse;
+    if (info.mask[dse - info.dse]) out.push(dse);
+  }
+
+  /**
+   * Which years can have occurrences at all.
+   *
+   * The calendar repeats every 400 years, so looking at one such cycle is
+   * enough to prove that a rule is empty (eg. BYMONTH=2;BYMONTHDAY=30) or
+   * how rarely it matches (eg. BYMONTH=2;BYMONTHDAY=29, or BYWEEKNO=53).
+   */
+  analyze(): RRulePlan.Analysis {
+    if (this.analysis) return this.analysis;
+
+    const years = new Uint8Array(RRulePlan.CYCLE_YEARS);
+    let density = 0;
+    for (let i = 0; i < RRulePlan.CYCLE_YEARS; ++i) {
+      const { mask } = this.year(RRulePlan.CYCLE_BASE + i);
+      if (mask.indexOf(1) < 0) continue;
+      years[i] = 1;
+      density += 1;
+    }
+    return (this.analysis = {
+      empty: density === 0,
+      years,
+      period: RRulePlan.minimalCycle(years),
+      density,
+    });
+  }
+
+  /**
+   * Which periods of `step`, counting from `start`, can have occurrences.
+   *
+   * Null if every period can, or if the periods are days or weeks, which
+   * are only checked for the rule being empty.
+   */
+  cadence(
+    start: YearMonthDay.MaybeValid,
+    step: DateUnit,
+  ): Option<YearMonthDay.Cadence> {
+    if (this.analyze().empty) return RRulePlan.NEVER;
+
+    if (step.type !== "year" && step.type !== "month") return null;
+    // Easter doesn't repeat with the calendar
+    if (this.rules.easter) return null;
+    const periods = this.#periods(step.type);
+    if (!periods) return null;
+
+    // periods are whole years or months, so only where `start` falls in the
+    // cycle matters, not its day
+    const at = RRulePlan.cycleIndex(start, step.type);
+    const key = `${step.type}/${step.value}/${at}`;
+    const existing = this.cadences.get(key);
+    if (existing !== undefined) return existing;
+
+    const len = RRulePlan.cycleLength(step);
+    const flags = new Uint8Array(len);
+    for (let k = 0; k < len; ++k) {
+      flags[k] = periods[(at + k * step.value) % periods.length];
+    }
+    const cycle = RRulePlan.minimalCycle(flags);
+    const productive: number[] = [];
+    for (let k = 0; k < cycle; ++k) if (flags[k]) productive.push(k);
+
+    const cadence =
+      productive.length === cycle
+        ? null
+        : { cycle, productive: Int32Array.from(productive) };
+    if (this.cadences.size >= RRulePlan.MAX_CACHED_YEARS) this.cadences.clear();
+    this.cadences.set(key, cadence);
+    return cadence;
+  }
+
+  // which years or months of the calendar cycle can have occurrences,
+  // counted once per plan whatever the start and interval
+  #periods(unit: "year" | "month"): Option<Uint8Array> {
+    const existing = this.periods.get(unit);
+    if (existing !== undefined) return existing;
+
+    const len = RRulePlan.CYCLE_PERIODS[unit];
+    const flags = new Uint8Array(len);
+    let all = true;
+    for (let k = 0; k < len; ++k) {
+      const cand =
+        unit === "year"
+          ? YearMonthDay.fromYmd1Unchecked(RRulePlan.CYCLE_BASE + k, 1, 1)
+          : YearMonthDay.fromYmd1Unchecked(
+              RRulePlan.CYCLE_BASE + Math.floor(k / 12),
+              (k % 12) + 1,
+              1,
+            );
+      if (this.count(cand, unit) > 0) {
+        flags[RRulePlan.cycleIndex(cand, unit)] = 1;
+      } else {
+        all = false;
+      }
+    }
+    const periods = all ? null : flags;
+    this.periods.set(unit, periods);
+    return periods;
+  }
+
+  /**
+   * Number of occurrences of the period starting at `cand`, without
+   * expanding it.
+   */
+  count(cand: YearMonthDay.MaybeValid, unit: DateUnit.Type): number {
+    if (!this.expands(unit)) return this.expand(cand, unit).length;
+
+    const [lo, hi] = this.#bounds(cand, unit);
+    const count = this.#tally(lo, hi);
+    const setpos = this.rules.setpos;
+    return setpos ? RRulePlan.SetPos.count(setpos, count) : count;
+  }
+
+  // number of days in [lo, hi) that match the mask
+  #tally(lo: number, hi: number): number {
+    if (hi <= lo) return 0;
+    let count = 0;
+    this.#spans(lo, hi, (_, from, to) => (count += to - from));
+    return count;
+  }
+
+  /**
+   * Number of occurrences of periods `from` (inclusive) to `to` (exclusive)
+   * of `step` counting from `origin`.
+   *
+   * Short spans are counted period by period. Longer ones use a table of the
+   * counts over one calendar cycle, so whole cycles are counted
+   * arithmetically.
+   */
+  countPeriods(
+    origin: YearMonthDay.MaybeValid,
+    step: DateUnit,
+    from: number,
+    to: number,
+  ): number {
+    if (to <= from) return 0;
+    const uniform = this.#uniform(step.type);
+    if (uniform != null) return (to - from) * uniform;
+
+    if (to - from < RRulePlan.MIN_TALLY_PERIODS || this.rules.easter) {
+      let count = 0;
+      for (let k = from; k < to; ++k) {
+        count += this.count(YearMonthDay.ndnth(origin, step, k), step.type);
+      }
+      return count;
+    }
+
+    const key = RRulePlan.cycleKey(origin, step);
+    let tally = this.tallies.get(key);
+    if (!tally) {
+      const len = RRulePlan.cycleLength(step);
+      tally = new Int32Array(len + 1);
+      for (let k = 0; k < len; ++k) {
+        const cand = YearMonthDay.ndnth(origin, step, k);
+        tally[k + 1] = tally[k] + this.count(cand, step.type);
+      }
+      if (this.tallies.size >= RRulePlan.MAX_CACHED_TALLIES) {
+        this.tallies.clear();
+      }
+      this.tallies.set(key, tally);
+    }
+
+    const len = tally.length - 1;
+    const upTo = (n: number) =>
+      Math.floor(n / len) * tally[len] + tally[TentoMath.mod(n, len)];
+    return upTo(to) - upTo(from);
+  }
+
+  // occurrences per period, if it's the same for every period
+  #uniform(unit: DateUnit.Type): Option<number> {
+    const count = this.#uniformCandidates(unit);
+    const setpos = this.rules.setpos;
+    return count != null && setpos
+      ? RRulePlan.SetPos.count(setpos, count)
+      : count;
+  }
+
+  #uniformCandidates(unit: DateUnit.Type): Option<number> {
+    const r = this.rules;
+    if (r.months || r.nth || r.monthdays || r.yeardays || r.weeknos) {
+      return null;
+    }
+    if (r.easter) return null;
+    switch (unit) {
+      case "day":
+        return r.weekdays ? null : 1;
+      case "week": {
+        if (!r.weekdays) return 1;
+        let count = 0;
+        for (const flag of r.weekdays) count += flag;
+        return count;
+      }
+      default:
+        return null;
+    }
+  }
+
+  filter(): YearMonthDayFilter {
+    const r = this.rules;
+    if (!r.months && !r.setpos && !this.expands("year")) {
+      return YearMonthDayFilter.identity();
+    }
+    return ([cand, unit]: PartialDate.Tuple) => this.#filter(cand, unit);
+  }
+
+  *#filter(
+    cand: YearMonthDay.MaybeValid,
+    unit: DateUnit.Type,
+  ): Generator<PartialDate.Tuple> {
+    const candidates = this.#candidates(cand, unit);
+    const dses = this.rules.setpos ? this.#select(candidates) : candidates;
+    for (const dse of dses) {
+      yield [
+        YearMonthDay.fromDse(dse as DaysSinceEpoch) as YearMonthDay.MaybeValid,
+        "day",
+      ];
+    }
+  }
+
+  // the BYSETPOS picks among one period's candidates
+  *#select(candidates: Iterable<number>): Generator<number> {
+    const setpos = new RRulePlan.SetPos(this.rules.setpos!);
+    for (const dse of candidates) {
+      const picked = setpos.push(dse);
+      if (picked != null) yield picked;
+    }
+    yield* setpos.flush();
+  }
+}
+
+export namespace RRulePlan {
+  export const MAX_CACHED_YEARS = 64;
+  // the gregorian calendar repeats every 400 years
+  export const CYCLE_YEARS = 400;
+  export const CYCLE_BASE = 2000;
+  // periods of each unit in the 400 year cycle
+  export const CYCLE_PERIODS: Record<DateUnit.Type, number> = {
+    year: CYCLE_YEARS,
+    month: CYCLE_YEARS * 12,
+    week: 146_097 / 7,
+    day: 146_097,
+  };
+  export const MIN_TALLY_PERIODS = 64;
+  export const MAX_CACHED_TALLIES = 8;
+
+  export const NEVER: YearMonthDay.Cadence = {
+    cycle: 1,
+    productive: new Int32Array(0),
+  };
+
+  export type Analysis = {
+    // no year can have an occurrence
+    empty: boolean;
+    // 1 at `yr % CYCLE_YEARS` if year `yr` can have occurrences
+    years: Uint8Array;
+    // the years that can have occurrences repeat every `period` years
+    period: number;
+    // number of years per cycle that can have occurrences
+    density: number;
+  };
+
+  export type Rules = {
+    // indexed by Month1
+    months: Option<Uint8Array>;
+    // indexed by DayOfWeek1
+    weekdays: Option<Uint8Array>;
+    nth: Option<Weekday.Nth[]>;
+    nthScope: Option<"year" | "month">;
+    // indexed by |day|
+    monthdays: Option<Uint8Array>;
+    negMonthdays: Option<Uint8Array>;
+    yeardays: Option<Uint8Array>;
+    negYeardays: Option<Uint8Array>;
+    weeknos: Option<Uint8Array>;
+    negWeeknos: Option<Uint8Array>;
+    // BYEASTER, days from Easter Sunday
+    easter: Option<number[]>;
+    // BYSETPOS, 1-based from the start of the period or negative from its end
+    setpos: Option<number[]>;
+  };
+
+  /**
+   * The usable BYSETPOS positions, null if there are none.
+   */
+  export function positions(values: Option<number[]>): Option<number[]> {
+    const positions = values?.filter(
+      (v) => v !== 0 && Math.abs(v) <= MAX_SETPOS,
+    );
+    return positions && positions.length > 0 ? positions : null;
+  }
+
+  // BYSETPOS is in [-366, -1] or [1, 366]
+  export const MAX_SETPOS = 366;
+
+  /**
+   * Picks the BYSETPOS positions out of one period's candidates, fed in
+   * order.
+   *
+   * Positive positions are picked as soon as they're seen. Negative ones
+   * can only be told once the period ends, so the last `tail` candidates
+   * (the most negative position) are held in a ring buffer: a candidate
+   * leaving it can no longer be at a negative position. Nothing else about
+   * the period is kept, however many candidates it has.
+   */
+  export class SetPos {
+    private readonly ring: Float64Array;
+    private seen = 0;
+
+    constructor(readonly positions: number[]) {
+      let tail = 0;
+      for (const p of positions) if (p < 0) tail = Math.max(tail, -p);
+      this.ring = new Float64Array(tail);
+    }
+
+    /**
+     * Feeds the period's next candidate, returning the candidate it settles
+     * as picked, if any.
+     */
+    push(value: number): Option<number> {
+      const tail = this.ring.length;
+      const index = this.seen++;
+      if (tail === 0) {
+        return this.positions.includes(index + 1) ? value : null;
+      }
+
+      const slot = index % tail;
+      const leaving = index - tail;
+      const left = this.ring[slot];
+      this.ring[slot] = value;
+      return leaving >= 0 && this.positions.includes(leaving + 1) ? left : null;
+    }
+
+    /**
+     * Ends the period: the picks among the candidates still held, in order.
+     * The buffer is then ready for the next period.
+     */
+    *flush(): Generator<number> {
+      const tail = this.ring.length;
+      const n = this.seen;
+      this.seen = 0;
+      for (let index = Math.max(0, n - tail); index < n; ++index) {
+        if (SetPos.selects(this.positions, index, n)) {
+          yield this.ring[index % tail];
+        }
+      }
+    }
+
+    // whether the `index`th (0-based) of `n` candidates is picked
+    static selects(positions: number[], index: number, n: number): boolean {
+      return positions.includes(index + 1) || positions.includes(index - n);
+    }
+
+    // number of picks among `n` candidates
+    static count(positions: number[], n: number): number {
+      let count = 0;
+      for (let index = 0; index < n; ++index) {
+        if (SetPos.selects(positions, index, n)) ++count;
+      }
+      return count;
+    }
+  }
+
+  export type Occurrences = {
+    // 1 if the day of year (0-indexed) is an occurrence
+    mask: Uint8Array;
+    // the days of year that are, sorted
+    offsets: Uint16Array;
+  };
+
+  export type Year = Occurrences & {
+    yr: number;
+    // days since epoch of Jan 1
+    dse: number;
+    len: number;
+  };
+
+  // ISO week numbers also depend on whether the years around are leap years
+  export const NUM_YEAR_TYPES = Year.NUM_SHAPES * 4;
+
+  /**
+   * Years of the same type have the same occurrences on the same days of
+   * the year: their `Year.shape`, and for BYWEEKNO whether the previous and
+   * next years are leap years (which decides if the ISO weeks spilling over
+   * are numbered 52 or 53). Returns 0..<NUM_YEAR_TYPES.
+   */
+  export function yearType(yr: number, weeknos: boolean): number {
+    const shape = Year.shape(yr);
+    if (!weeknos) return shape;
+    const prev = Year.isLeapYear(yr - 1) ? 2 : 0;
+    const next = Year.isLeapYear(yr + 1) ? 1 : 0;
+    return shape * 4 + prev + next;
+  }
+
+  // the set days of a mask
+  export function offsets(mask: Uint8Array): Uint16Array {
+    let n = 0;
+    for (let i = 0; i < mask.length; ++i) n += mask[i];
+    const out = new Uint16Array(n);
+    for (let i = 0, j = 0; i < mask.length; ++i) if (mask[i]) out[j++] = i;
+    return out;
+  }
+
+  // index of the first of the sorted `values` that is at least `v`
+  export function lowerBound(values: ArrayLike<number>, v: number): number {
+    let lo = 0;
+    let hi = values.length;
+    while (lo < hi) {
+      const mid = (lo + hi) >>> 1;
+      if (values[mid] < v) lo = mid + 1;
+      else hi = mid;
+    }
+    return lo;
+  }
+
+  function yearMasks(leap: 0 | 1): [Uint8Array, Uint8Array, Uint8Array] {
+    const len = 365 + leap;
+    const mmask = new Uint8Array(len);
+    const mdaymask = new Uint8Array(len);
+    const nmdaymask = new Uint8Array(len);
+    for (let mth0 = 0; mth0 < 12; ++mth0) {
+      const start = Month.MONTH_START_OF_YEAR[leap][mth0];
+      const days = Month.DAYS_IN_MONTH[leap][mth0];
+      for (let day0 = 0; day0 < days; ++day0) {
+        mmask[start + day0] = mth0 + 1;
+        mdaymask[start + day0] = day0 + 1;
+        nmdaymask[start + day0] = days - day0;
+      }
+    }
+    return [mmask, mdaymask, nmdaymask];
+  }
+
+  const MASKS = [yearMasks(0), yearMasks(1)];
+  export const MONTH_MASK = [MASKS[0][0], MASKS[1][0]];
+  export const MONTHDAY_MASK = [MASKS[0][1], MASKS[1][1]];
+  export const NEG_MONTHDAY_MASK = [MASKS[0][2], MASKS[1][2]];
+
+  // DayOfWeek1 for each day, offset by the weekday of Jan 1
+  const WEEKDAY_MASK = Uint8Array.from(
+    { length: 366 + 7 },
+    (_, i) => (i % 7) + 1,
+  );
+
+  export function weekdayMask(jan1: number): Uint8Array {
+    const offset = Weekday.fromDse(jan1 as DaysSinceEpoch);
+    // fromDse returns 0 for saturday
+    const dow0 = offset === 0 ? 6 : offset - 1;
+    return WEEKDAY_MASK.subarray(dow0, dow0 + 366);
+  }
+
+  function isoWeek1Mon(yr: number): number {
+    const jan1 = Year.dseFromYear(yr);
+    // 0 = monday
+    const isoDow0 = (Weekday.fromDse(jan1 as DaysSinceEpoch) + 5) % 7;
+    return isoDow0 <= 3 ? jan1 - isoDow0 : jan1 + 7 - isoDow0;
+  }
+
+  function numIsoWeeks(yr: number): number {
+    return (isoWeek1Mon(yr + 1) - isoWeek1Mon(yr)) / 7;
+  }
+
+  /**
+   * Days of `yr` whose ISO week matches one of the rule's week numbers.
+   */
+  export function weeknoMask(yr: number, rules: Rules): Uint8Array {
+    const dse = Year.dseFromYear(yr);
+    const len = Year.length(yr);
+    const mask = new Uint8Array(len);
+    for (const isoYr of [yr - 1, yr, yr + 1]) {
+      const mon = isoWeek1Mon(isoYr);
+      const numWeeks = numIsoWeeks(isoYr);
+      for (let wno = 1; wno <= numWeeks; ++wno) {
+        const matches =
+          rules.weeknos![wno] || rules.negWeeknos![numWeeks - wno + 1];
+        if (!matches) continue;
+        const weekStart = mon + (wno - 1) * 7 - dse;
+        for (let i = 0; i < 7; ++i) {
+          const doy = weekStart + i;
+          if (doy >= 0 && doy < len) mask[doy] = 1;
+        }
+      }
+    }
+    return mask;
+  }
+
+  /**
+   * Days of `yr` that are `offsets` days from its Easter Sunday.
+   */
+  export function easterMask(yr: number, offsets: number[]): Uint8Array {
+    const len = Year.length(yr);
+    const mask = new Uint8Array(len);
+    const easter = Easter.doy(yr);
+    for (const offset of offsets) {
+      const doy = easter + offset;
+      if (doy >= 0 && doy < len) mask[doy] = 1;
+    }
+    return mask;
+  }
+
+  /**
+   * Number of periods of `step` after which they repeat, ie. once the steps
+   * have covered a whole number of calendar cycles.
+   */
+  export function cycleLength(step: DateUnit): number {
+    const len = CYCLE_PERIODS[step.type];
+    return len / TentoMath.gcd(len, step.value);
+  }
+
+  /**
+   * Position of the year or month containing `nd` in the calendar cycle.
+   */
+  export function cycleIndex(
+    nd: YearMonthDay.MaybeValid,
+    unit: "year" | "month",
+  ): number {
+    return unit === "year"
+      ? TentoMath.mod(nd.yr, CYCLE_YEARS)
+      : TentoMath.mod(nd.yr * 12 + nd.mth - 1, CYCLE_PERIODS.month);
+  }
+
+  /**
+   * Identifies the periods of `step` from `start` up to the calendar cycle:
+   * starts with the same key see the same sequence of periods.
+   */
+  export function cycleKey(
+    start: YearMonthDay.MaybeValid,
+    step: DateUnit,
+  ): string {
+    const prefix = `${step.type}/${step.value}`;
+    switch (step.type) {
+      case "year": {
+        const yr = TentoMath.mod(start.yr, CYCLE_YEARS);
+        return `${prefix}/${yr}/${start.mth}/${start.day}`;
+      }
+      case "month": {
+        const mth = TentoMath.mod(
+          start.yr * 12 + start.mth - 1,
+          CYCLE_PERIODS.month,
+        );
+        return `${prefix}/${mth}/${start.day}`;
+      }
+      default:
+        return `${prefix}/${TentoMath.mod(start.dse, CYCLE_PERIODS.day)}`;
+    }
+  }
+
+  /**
+   * Smallest divisor `d` of `flags.length` such that `flags` repeats every
+   * `d` entries.
+   */
+  export function minimalCycle(flags: Uint8Array): number {
+    const len = flags.length;
+    outer: for (let d = 1; d < len; ++d) {
+      if (len % d !== 0) continue;
+      for (let i = d; i < len; ++i) {
+        if (flags[i] !== flags[i - d]) continue outer;
+      }
+      return d;
+    }
+    return len;
+  }
+
+  /**
+   * Days of `yr` that are the nth weekday of their year or month.
+   */
+  export function nthMask(
+    yr: number,
+    nths: Weekday.Nth[],
+    scope: "year" | "month",
+  ): Uint8Array {
+    const dse = Year.dseFromYear(yr);
+    const leap = Year.isLeapYear(yr) ? 1 : 0;
+    const mask = new Uint8Array(365 + leap);
+    const wdaymask = weekdayMask(dse);
+
+    const mark = (start: number, len: number) => {
+      const first = wdaymask[start];
+      const last = wdaymask[start + len - 1];
+      for (const { weekday, n } of nths) {
+        let offset: number;
+        if (n > 0) {
+          offset = weekday.dow - first;
+          if (offset < 0) offset += 7;
+          offset += (n - 1) * 7;
+        } else {
+          offset = weekday.dow - last;
+          if (offset > 0) offset -= 7;
+          offset += len - 1 + (n + 1) * 7;
+        }
+        if (offset >= 0 && offset < len) mask[start + offset] = 1;
+      }
+    };
+
+    if (scope === "year") {
+      mark(0, 365 + leap);
+    } else {
+      for (let mth0 = 0; mth0 < 12; ++mth0) {
+        mark(
+          Month.MONTH_START_OF_YEAR[leap][mth0],
+          Month.DAYS_IN_MONTH[leap][mth0],
+        );
+      }
+    }
+    return mask;
+  }
+}
@@ -0,0 +1,254 @@
+import { Weekday } from "../units/weekday";
+import { Frequency } from "./frequency";
+import { IsoDate } from "./iso-date";
+import { RRuleLike } from "./rrule";
+
+/**
+ * A single pass scanner for RRULE values (eg. `FREQ=WEEKLY;BYDAY=MO,WE`).
+ *
+ * Parts are read in place by char code and written straight into the rule's
+ * options, instead of splitting the string into parts, key/value pairs and
+ * list items first. Only the option arrays and the part names (for
+ * `RRule.parameterOrder`) are allocated.
+ *
+ * Accepts what `RRule.Raw` accepts: part names are case insensitive, a later
+ * part overrides an earlier one, and list items that don't parse are left
+ * out.
+ */
+export namespace RRuleScanner {
+  export type Scanned = {
+    inner: RRuleLike;
+    // part names as they appear, upper case
+    order: string[];
+  };
+
+  const SEMICOLON = 59;
+  const EQUALS = 61;
+  const COMMA = 44;
+  const MINUS = 45;
+  const PLUS = 43;
+  const ZERO = 48;
+  const SPACE = 32;
+
+  const PREFIX = "RRULE:";
+
+  // weekdays by their two lower case letters, as `(c0 << 8) | c1`
+  let weekdays: Option<Map<number, Weekday>> = null;
+
+  /**
+   * Scans `s`, with or without its `RRULE:` prefix. Null if it has no valid
+   * FREQ.
+   */
+  export function scan(s: string): Option<Scanned> {
+    const n = s.length;
+    let i = s.startsWith(PREFIX) ? PREFIX.length : 0;
+
+    const order: string[] = [];
+    // every part unset, as `RRule.Raw.resolve` leaves them
+    const options: NonNullable<RRuleLike["options"]> = {
+      wkst: null,
+      interval: null,
+      count: null,
+      bysetpos: null,
+      byday: null,
+      bynthday: null,
+      bymonth: null,
+      bymonthday: null,
+      byweekno: null,
+      byyearday: null,
+      byeaster: null,
+      byhour: null,
+      byminute: null,
+      bysecond: null,
+      tzid: null,
+      until: null,
+    };
+    let freq: Option<Frequency> = null;
+    for (;;) {
+      let end = i;
+      while (end < n && !isSep(s, end)) ++end;
+      const key = s.slice(i, end).toUpperCase();
+      order.push(key);
+
+      // the value runs up to the next `=` or `;`, anything after a second
+      // `=` is ignored
+      let lo = end;
+      let hi = end;
+      if (end < n && s.charCodeAt(end) === EQUALS) {
+        lo = end + 1;
+        hi = lo;
+        while (hi < n && !isSep(s, hi)) ++hi;
+      }
+      let next = hi;
+      while (next < n && s.charCodeAt(next) !== SEMICOLON) ++next;
+
+      switch (key) {
+        case "FREQ":
+          freq = Frequency.parse(s.slice(lo, hi));
+          break;
+        case "WKST":
+          options.wkst = weekdayAt(s, lo, hi);
+          break;
+        case "INTERVAL":
+          options.interval = intAt(s, lo, hi);
+          break;
+        case "COUNT":
+          options.count = intAt(s, lo, hi);
+          break;
+        case "BYDAY":
+          options.byday = null;
+          options.bynthday = null;
+          if (lo < hi) scanByday(s, lo, hi, options);
+          break;
+        case "BYSETPOS":
+          options.bysetpos = lo < hi ? ints(s, lo, hi) : null;
+          break;
+        case "BYMONTH":
+          options.bymonth = lo < hi ? ints(s, lo, hi) : null;
+          break;
+        case "BYMONTHDAY":
+          options.bymonthday = lo < hi ? ints(s, lo, hi) : null;
+          break;
+        case "BYWEEKNO":
+          options.byweekno = lo < hi ? ints(s, lo, hi) : null;
+          break;
+        case "BYYEARDAY":
+          options.byyearday = lo < hi ? ints(s, lo, hi) : null;
+          break;
+        case "BYEASTER":
+          options.byeaster = lo < hi ? ints(s, lo, hi) : null;
+          break;
+        // unlike the other lists, these are unset when nothing parses
+        case "BYHOUR":
+          options.byhour = nonEmpty(ints(s, lo, hi));
+          break;
+        case "BYMINUTE":
+          options.byminute = nonEmpty(ints(s, lo, hi));
+          break;
+        case "BYSECOND":
+          options.bysecond = nonEmpty(ints(s, lo, hi));
+          break;
+        case "TZID":
+          options.tzid = lo < hi ? s.slice(lo, hi) : null;
+          break;
+        case "UNTIL":
+          options.until =
+            lo < hi ? IsoDate.parse(s.slice(lo, hi)).exp() : null;
+          break;
+      }
+
+      if (next >= n) break;
+      i = next + 1;
+    }
+
+    if (!freq) return null;
+    return { inner: { freq, options }, order };
+  }
+
+  function isSep(s: string, i: number): boolean {
+    const c = s.charCodeAt(i);
+    return c === SEMICOLON || c === EQUALS;
+  }
+
+  function scanByday(
+    s: string,
+    lo: number,
+    hi: number,
+    options: NonNullable<RRuleLike["options"]>,
+  ) {
+    // the first day decides whether they're all nth weekdays (eg. 2TU)
+    let first = lo;
+    while (first < hi && s.charCodeAt(first) !== COMMA) ++first;
+    const nth = nthAt(s, lo, first) != null;
+
+    const byday: Weekday[] = [];
+    const bynthday: Weekday.Nth[] = [];
+    for (let i = lo; i <= hi; ) {
+      let end = i;
+      while (end < hi && s.charCodeAt(end) !== COMMA) ++end;
+      if (nth) {
+        const day = nthAt(s, i, end);
+        if (day) bynthday.push(day);
+      } else {
+        const day = weekdayAt(s, i, end);
+        if (day) byday.push(day);
+      }
+      i = end + 1;
+    }
+    if (nth) options.bynthday = nonEmpty(bynthday);
+    else options.byday = nonEmpty(byday);
+  }
+
+  // like `Weekday.parseNthOpt`: an integer right before a weekday's two
+  // letters
+  function nthAt(s: string, lo: number, hi: number): Option<Weekday.Nth> {
+    if (hi - lo < 3) return null;
+    let i = lo;
+    if (s.charCodeAt(i) === MINUS) ++i;
+    const digits = i;
+    while (i < hi - 2 && isDigit(s.charCodeAt(i))) ++i;
+    if (i === digits || i !== hi - 2) return null;
+    const weekday = weekdayAt(s, i, hi);
+    if (!weekday) return null;
+    return { weekday, n: intAt(s, lo, i)! };
+  }
+
+  // like `Weekday.parseOpt`: the first two letters, in any case
+  function weekdayAt(s: string, lo: number, hi: number): Option<Weekday> {
+    if (hi - lo < 2) return null;
+    if (!weekdays) {
+      weekdays = new Map();
+      for (const [i, short] of Weekday.WEEKDAY_SHORT2.entries()) {
+        weekdays.set(
+          (short.charCodeAt(0) << 8) | short.charCodeAt(1),
+          Weekday.DOW1[i],
+        );
+      }
+    }
+    // ascii lower case
+    const c0 = s.charCodeAt(lo) | 0x20;
+    const c1 = s.charCodeAt(lo + 1) | 0x20;
+    return weekdays.get((c0 << 8) | c1) ?? null;
+  }
+
+  // like `TentoMath.parseOpt` on decimals: leading spaces, a sign, and the
+  // digits up to the first character that isn't one
+  function intAt(s: string, lo: number, hi: number): Option<number> {
+    let i = lo;
+    while (i < hi && s.charCodeAt(i) === SPACE) ++i;
+    let sign = 1;
+    const c = s.charCodeAt(i);
+    if (i < hi && (c === MINUS || c === PLUS)) {
+      if (c === MINUS) sign = -1;
+      ++i;
+    }
+    if (i >= hi || !isDigit(s.charCodeAt(i))) return null;
+    let value = 0;
+    for (; i < hi && isDigit(s.charCodeAt(i)); ++i) {
+      value = value * 10 + (s.charCodeAt(i) - ZERO);
+    }
+    return sign * value;
+  }
+
+  // the comma separated integers in [lo, hi), skipping those that don't
+  // parse
+  function ints(s: string, lo: number, hi: number): number[] {
+    const out: number[] = [];
+    for (let i = lo; i <= hi; ) {
+      let end = i;
+      while (end < hi && s.charCodeAt(end) !== COMMA) ++end;
+      const value = intAt(s, i, end);
+      if (value != null) out.push(value);
+      i = end + 1;
+    }
+    return out;
+  }
+
+  function isDigit(c: number): boolean {
+    return c >= ZERO && c <= ZERO + 9;
+  }
+
+  function nonEmpty<T>(values: T[]): Option<T[]> {
+    return values.length > 0 ? values : null;
+  }
+}
@@ -0,0 +1,155 @@
+import { NaiveTime } from "../naive-time";
+import { Time } from "../time";
+import { TentoMath } from "../utils";
+import { RRuleLike } from "./rrule";
+
+/**
+ * A compiled form of an RRULE's times of day: its BYHOUR, BYMINUTE and
+ * BYSECOND parts, and the slots of the HOURLY, MINUTELY and SECONDLY
+ * frequencies.
+ *
+ * The day generator picks the days, and each day's occurrences are read off
+ * a sorted table of ms offsets from midnight. A day's table only depends on
+ * where midnight falls on the rule's INTERVAL grid, so there are only a few
+ * distinct tables (one for DAILY and up), built on first use.
+ *
+ * Parts at or above the frequency limit the slots, finer parts expand them
+ * (eg. for HOURLY, BYHOUR keeps some hours and BYMINUTE fills them in).
+ */
+export class RRuleTimes {
+  // offsets by phase, the seconds from midnight to the first slot
+  private readonly tables = new Map<number, Int32Array>();
+
+  constructor(
+    // seconds between slots, null for DAILY and up
+    readonly stride: Option<number>,
+    // DTSTART's seconds from midnight
+    readonly start: number,
+    readonly rules: RRuleTimes.Rules,
+  ) {}
+
+  /**
+   * Compiles the times of day of a rule starting at `start`, or null if
+   * its occurrences are at DTSTART's time of day.
+   */
+  static compile(inner: RRuleLike, start: NaiveTime): Option<RRuleTimes> {
+    if (!RRuleTimes.applies(inner)) return null;
+    const options = inner.options;
+    const unit = RRuleTimes.UNIT_SECS[inner.freq] ?? null;
+
+    const flags = (values: Option<number[]>, size: number) => {
+      if (!values || values.length === 0) return null;
+      const mask = new Uint8Array(size);
+      for (const v of values) if (v >= 0 && v < size) mask[v] = 1;
+      return mask;
+    };
+    const stride = unit != null ? unit * (options?.interval ?? 1) : null;
+    const secs = Math.floor(start.toMs / Time.MS_PER_SEC);
+    return new RRuleTimes(stride, secs, {
+      unit: unit ?? RRuleTimes.SECS_PER_DAY,
+      hours: flags(options?.byhour, 24),
+      minutes: flags(options?.byminute, 60),
+      seconds: flags(options?.bysecond, 60),
+    });
+  }
+
+  /**
+   * Whether the rule's occurrences have their own times of day, rather
+   * than DTSTART's.
+   */
+  static applies(inner: RRuleLike): boolean {
+    const options = inner.options;
+    const parts = [options?.byhour, options?.byminute, options?.bysecond];
+    return (
+      RRuleTimes.UNIT_SECS[inner.freq] != null ||
+      parts.some((p) => p != null && p.length > 0)
+    );
+  }
+
+  /**
+   * Offsets in ms from midnight of the occurrences on the `day`th day from
+   * DTSTART's, sorted. Those before DTSTART on day 0 are left for the caller
+   * to skip.
+   */
+  offsets(day: number): Int32Array {
+    const phase =
+      this.stride == null
+        ? 0
+        : TentoMath.mod(
+            this.start - day * RRuleTimes.SECS_PER_DAY,
+            this.stride,
+          );
+    let table = this.tables.get(phase);
+    if (!table) {
+      if (this.tables.size >= RRuleTimes.MAX_CACHED_TABLES) {
+        this.tables.clear();
+      }
+      table = this.#table(phase);
+      this.tables.set(phase, table);
+    }
+    return table;
+  }
+
+  #table(phase: number): Int32Array {
+    const { unit, hours, minutes, seconds } = this.rules;
+    const h0 = Math.floor(this.start / 3600);
+    const m0 = Math.floor(this.start / 60) % 60;
+    const s0 = this.start % 60;
+    // the finer parts, which each slot expands into
+    const expand = (mask: Option<Uint8Array>, fallback: number) => {
+      if (!mask) return [fallback];
+      const out: number[] = [];
+      for (let i = 0; i < mask.length; ++i) if (mask[i]) out.push(i);
+      return out;
+    };
+
+    const slots: number[] = [];
+    if (this.stride == null) {
+      slots.push(0);
+    } else {
+      for (let t = phase; t < RRuleTimes.SECS_PER_DAY; t += this.stride) {
+        slots.push(t);
+      }
+    }
+
+    const out: number[] = [];
+    for (const slot of slots) {
+      const h = this.stride == null ? null : Math.floor(slot / 3600);
+      const m = unit <= 60 ? Math.floor(slot / 60) % 60 : null;
+      const s = unit <= 1 ? slot % 60 : null;
+      if (h != null && hours && !hours[h]) continue;
+      if (m != null && minutes && !minutes[m]) continue;
+      if (s != null && seconds && !seconds[s]) continue;
+
+      for (const hh of h != null ? [h] : expand(hours, h0)) {
+        for (const mm of m != null ? [m] : expand(minutes, m0)) {
+          for (const ss of s != null ? [s] : expand(seconds, s0)) {
+            out.push((hh * 3600 + mm * 60 + ss) * Time.MS_PER_SEC);
+          }
+        }
+      }
+    }
+    return Int32Array.from(out).sort();
+  }
+}
+
+export namespace RRuleTimes {
+  export const MAX_CACHED_TABLES = 64;
+  export const SECS_PER_DAY = 86_400;
+
+  // seconds per slot of the sub-daily frequencies
+  export const UNIT_SECS: Partial<Record<RRuleLike["freq"], number>> = {
+    hourly: 3600,
+    minutely: 60,
+    secondly: 1,
+  };
+
+  export type Rules = {
+    // seconds per slot, a day for DAILY and up
+    unit: number;
+    // indexed by hour, minute and second; null when not constrained
+    hours: Option<Uint8Array>;
+    minutes: Option<Uint8Array>;
+    seconds: Option<Uint8Array>;
+  };
+}
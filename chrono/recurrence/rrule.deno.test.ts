@@ -1,4 +1,7 @@
-import { assertEquals } from "@std/assert";
+import { assertEquals, assertThrows } from "@std/assert";
+import { naivedate } from "../mod.ts";
+import { NaiveDate } from "../naive-date.ts";
+import { IsoDate } from "./iso-date.ts";
 import { RRule } from "./rrule.ts";
 
 Deno.test("RRule toReadableDisplay - Daily frequencies", () => {
@@ -136,3 +139,95 @@ Deno.test("RRule toReadableDisplay - Complex patterns", () => {
     "Yearly in March, June, September and December, 20 times",
   );
 });
+
+Deno.test("RRule parse - Interns rules by string", () => {
+  const a = RRule.parse("FREQ=WEEKLY;BYDAY=MO,WE;COUNT=4").exp();
+  const b = RRule.parse("FREQ=WEEKLY;BYDAY=MO,WE;COUNT=4").exp();
+  // separate rules with their own EXDATEs, sharing their compiled plans
+  assertEquals(a === b, false);
+  assertEquals(a.inner === b.inner, true);
+  assertEquals(a.compile("week") === b.compile("week"), true);
+
+  a.addExdate(IsoDate.parse("20240101").exp());
+  assertEquals(b.exdates.length, 0);
+});
+
+Deno.test("RRule toFilterProps - Copies cached options", () => {
+  const rrule = RRule.parse("FREQ=MONTHLY;BYMONTHDAY=1,15").exp();
+  const first = rrule.toFilterProps(5);
+  first.options.budget = 1;
+  const second = rrule.toFilterProps(5);
+  assertEquals(second.options.budget, undefined);
+  assertEquals(second.options.limit, 5);
+  assertEquals(second.options.filter === first.options.filter, true);
+  assertEquals(rrule.toFilterProps(6).options.limit, 6);
+});
+
+Deno.test("RRule toFilterProps - Shares cadences across starts", () => {
+  const rrule = RRule.parse("FREQ=MONTHLY;BYMONTH=3").exp();
+  const cadence = (start: NaiveDate) =>
+    rrule.toFilterProps(null, null, false, null, start).options.cadence;
+  const jan = cadence(naivedate(2024, 1, 5));
+  assertEquals(jan?.cycle, 12);
+  assertEquals(Array.from(jan!.productive), [2]);
+  // the day of the start doesn't matter, only its month
+  assertEquals(cadence(naivedate(2024, 1, 20)) === jan, true);
+  assertEquals(Array.from(cadence(naivedate(2031, 5, 31))!.productive), [10]);
+});
+
+Deno.test("RRule parse - Scans like RRule.Raw", () => {
+  const rules = [
+    "RRULE:FREQ=WEEKLY;COUNT=20;BYDAY=MO,we,Fr;WKST=SU",
+    "FREQ=MONTHLY;BYDAY=2TU,-1FR;BYSETPOS=1,-1;INTERVAL=2",
+    "RRULE:FREQ=YEARLY;BYMONTH=3,x,6;BYMONTHDAY=-1;UNTIL=20300101T000000Z",
+    "RRULE:FREQ=DAILY;BYHOUR=9,17;BYMINUTE=0,30;BYSECOND=;BYEASTER=-2",
+    "RRULE:freq=hourly;byweekno=1,53;byyearday=100,-100,;COUNT=3;COUNT=4",
+    "RRULE:FREQ=MONTHLY;BYDAY=MO,2TU;UNTIL=20190419",
+  ];
+  for (const rule of rules) {
+    const scanned = RRule.parse(rule).exp();
+    const raw = RRule.Raw.parse(rule).resolve().exp();
+    assertEquals(scanned.toString(), raw.toString());
+    assertEquals(scanned.parameterOrder, raw.parameterOrder);
+    assertEquals(scanned.inner.options?.count, raw.inner.options?.count);
+    assertEquals(scanned.inner.options?.byday, raw.inner.options?.byday);
+    assertEquals(scanned.inner.options?.bynthday, raw.inner.options?.bynthday);
+    assertEquals(scanned.inner.options?.bysecond, raw.inner.options?.bysecond);
+    assertEquals(scanned.inner.options?.tzid, raw.inner.options?.tzid);
+    assertEquals(
+      Object.keys(scanned.inner.options!).sort(),
+      Object.keys(raw.inner.options!).sort(),
+    );
+  }
+
+  assertEquals(RRule.parse("RRULE:COUNT=3").isErr, true);
+  assertEquals(RRule.parse("RRULE:FREQ=FORTNIGHTLY").isErr, true);
+});
+
+Deno.test("RRule parse - Interned rules can't change each other", () => {
+  const ser = "RRULE:FREQ=MONTHLY;BYMONTHDAY=1,15;BYDAY=2TU";
+  const a = RRule.parse(ser).exp();
+  const b = RRule.parse(ser).exp();
+  assertThrows(() => {
+    a.inner.options!.count = 3;
+  });
+  assertThrows(() => a.inner.options!.bymonthday!.push(31));
+  assertThrows(() => {
+    a.inner.options!.bynthday![0].n = 3;
+  });
+  assertThrows(() => (a.parameterOrder as string[]).push("COUNT"));
+  assertEquals(b.toString(), RRule.Raw.parse(ser).resolve().exp().toString());
+  assertEquals(b.inner.options?.count, null);
+  assertEquals(b.inner.options?.bymonthday, [1, 15]);
+});
+
+Deno.test("RRule parseMany - Shares repeated rules", () => {
+  const [a, b, c] = RRule.parseMany([
+    "RRULE:FREQ=DAILY;INTERVAL=2",
+    "RRULE:FREQ=DAILY;INTERVAL=2",
+    "RRULE:INTERVAL=2",
+  ]);
+  assertEquals(a.exp() === b.exp(), false);
+  assertEquals(a.exp().compile("day") === b.exp().compile("day"), true);
+  assertEquals(c.isErr, true);
+});
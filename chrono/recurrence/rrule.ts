@@ -1,5 +1,6 @@
 import {
   DateUnit,
+  DseSet,
   Month,
   NaiveDate,
   PartialDate,
@@ -14,6 +15,9 @@ import { ExDate } from "./exdate";
 import { Frequency } from "./frequency";
 import { ICalAttributes } from "./ical-attributes";
 import { IsoDate } from "./iso-date";
+import { RRulePlan } from "./rrule-plan";
+import { RRuleScanner } from "./rrule-scanner";
+import { RRuleTimes } from "./rrule-times";
 
 export interface RRuleLike {
   freq: Frequency;
@@ -21,13 +25,15 @@ export interface RRuleLike {
     wkst: Weekday;
     interval: number;
     count: number;
-    bysetpos: number;
+    bysetpos: number[];
     byday: Weekday[];
     bynthday: Weekday.Nth[];
     bymonth: number[];
     bymonthday: number[];
     byweekno: number[];
     byyearday: number[];
+    // days from Easter Sunday, a dateutil extension
+    byeaster: number[];
     byhour: number[];
     byminute: number[];
     bysecond: number[];
@@ -41,11 +47,89 @@ export class RRule {
 
   constructor(
     readonly inner: RRuleLike,
-    readonly parameterOrder: Option<string[]> = null,
+    readonly parameterOrder: Option<readonly string[]> = null,
+    // shared by the rules parsed from the same string, see `RRule.parse`
+    private readonly compiled: RRule.Compiled = new RRule.Compiled(),
   ) {}
 
+  /**
+   * Compiles the BYxxx parts of this rule into a plan for periods of `unit`.
+   * Plans (and their per-year masks) are cached with the rule, and shared
+   * by every rule parsed from the same string.
+   *
+   * A rule with times of day applies BYSETPOS to its instants, so its plan
+   * leaves it out.
+   */
+  compile(unit: DateUnit.Type): RRulePlan {
+    const plans = this.compiled.plans;
+    let plan = plans.get(unit);
+    if (!plan) {
+      const timed = RRuleTimes.applies(this.inner);
+      plan = RRulePlan.compile(this.inner.options, unit, !timed);
+      plans.set(unit, plan);
+    }
+    return plan;
+  }
+
+  /**
+   * Statically checks which years this rule can have occurrences in, see
+   * `RRulePlan.analyze`.
+   */
+  analyze(): RRulePlan.Analysis {
+    return this.compile(this.toFilterProps().step.type).analyze();
+  }
+
+  /**
+   * Parses a rule, interning it by its string: rules parsed from the same
+   * string share their parts and compiled plans, so a calendar with many
+   * events but few distinct rules compiles each rule once. The shared parts
+   * are frozen, so one rule can't change another's.
+   */
   static parse(ser: string): Result<RRule> {
-    return RRule.Raw.parse(ser).resolve();
+    const interned = RRule.interned.get(ser);
+    if (interned) {
+      // most recently used goes last
+      RRule.interned.delete(ser);
+      RRule.interned.set(ser, interned);
+      const { inner, parameterOrder, compiled } = interned;
+      return ok(new RRule(inner, parameterOrder, compiled));
+    }
+
+    const scanned = RRuleScanner.scan(ser);
+    if (!scanned) return err(Error("no frequency"));
+    const rrule = new RRule(
+      RRule.freeze(scanned.inner),
+      Object.freeze(scanned.order),
+    );
+    if (RRule.interned.size >= RRule.MAX_INTERNED) {
+      RRule.interned.delete(RRule.interned.keys().next().value!);
+    }
+    RRule.interned.set(ser, rrule);
+    return ok(rrule);
+  }
+
+  /**
+   * Parses many rules, eg. every RRULE of a calendar export. Repeated rules
+   * share one parse within the batch, however many distinct rules it has.
+   */
+  static parseMany(sers: Iterable<string>): Result<RRule>[] {
+    const seen = new Map<string, Result<RRule>>();
+    const out: Result<RRule>[] = [];
+    for (const ser of sers) {
+      const parsed = seen.get(ser);
+      const rrule = parsed?.asOk();
+      if (rrule) {
+        const { inner, parameterOrder, compiled } = rrule;
+        out.push(ok(new RRule(inner, parameterOrder, compiled)));
+      } else if (parsed) {
+        out.push(parsed);
+      } else {
+        const result = RRule.parse(ser);
+        seen.set(ser, result);
+        out.push(result);
+      }
+    }
+    return out;
   }
 
   static parseWithRecurrence(recurrence: string[]): Result<RRule> {
@@ -108,6 +192,7 @@ export class RRule {
       "BYMONTHDAY",
       "BYWEEKNO",
       "BYYEARDAY",
+      "BYEASTER",
       "BYHOUR",
       "BYMINUTE",
       "BYSECOND",
@@ -134,8 +219,8 @@ export class RRule {
             rruleParts.push(`INTERVAL=${options.interval}`);
           break;
         case "BYSETPOS":
-          if (options?.bysetpos != null)
-            rruleParts.push(`BYSETPOS=${options.bysetpos}`);
+          if (options?.bysetpos != null && options.bysetpos.length > 0)
+            rruleParts.push(`BYSETPOS=${options.bysetpos.join(",")}`);
           break;
         case "BYDAY":
           if (options?.bynthday != null && options.bynthday.length > 0) {
@@ -169,6 +254,10 @@ export class RRule {
           if (options?.byyearday != null && options.byyearday.length > 0)
             rruleParts.push(`BYYEARDAY=${options.byyearday.join(",")}`);
           break;
+        case "BYEASTER":
+          if (options?.byeaster != null && options.byeaster.length > 0)
+            rruleParts.push(`BYEASTER=${options.byeaster.join(",")}`);
+          break;
         case "BYHOUR":
           if (options?.byhour != null && options.byhour.length > 0)
             rruleParts.push(`BYHOUR=${options.byhour.join(",")}`);
@@ -383,11 +472,50 @@ export class RRule {
     return description;
   }
 
+  /**
+   * How to expand this rule with `NaiveDate.rangeProps`. Everything but
+   * `seek` and `start` is compiled once per (limit, end, Google mode) and
+   * cached with the rule; each call gets its own copy of the options.
+   */
   toFilterProps(
     limit?: Option<number>,
     end?: Option<NaiveDate>,
     useGoogleCalendarBehavior?: boolean,
+    seek?: Option<NaiveDate>,
+    start?: Option<NaiveDate>,
   ): NaiveDate.FilterProps {
+    const props = this.compiled.props;
+    const google = useGoogleCalendarBehavior ? 1 : 0;
+    const key = `${limit ?? ""}|${end?.dse ?? ""}|${google}`;
+    let cached = props.get(key);
+    if (cached) {
+      props.delete(key);
+      props.set(key, cached);
+    } else {
+      cached = this.buildFilterProps(limit, end, useGoogleCalendarBehavior);
+      // without a plan, the BYWEEKNO filters remember the dates they've
+      // seen, so each expansion needs its own
+      if (cached.plan) {
+        if (props.size >= RRule.MAX_CACHED_PROPS) {
+          props.delete(props.keys().next().value!);
+        }
+        props.set(key, cached);
+      }
+    }
+
+    const { step, plan } = cached;
+    const options = { ...cached.options };
+    if (seek) options.seek = seek;
+    // skip the periods that can't have occurrences, if we know the start
+    if (plan && start) options.cadence = plan.cadence(start, step);
+    return { step, options };
+  }
+
+  private buildFilterProps(
+    limit?: Option<number>,
+    end?: Option<NaiveDate>,
+    useGoogleCalendarBehavior?: boolean,
+  ): RRule.CompiledProps {
     const options = this.inner.options;
 
     let step: DateUnit;
@@ -427,6 +555,97 @@ export class RRule {
       }
     }
 
+    // Google Calendar's BYWEEKNO quirks aren't expressible as a plan
+    const plan =
+      useGoogleCalendarBehavior && hasWeekNoFilter
+        ? null
+        : this.compile(step.type);
+    const filter = plan
+      ? plan.filter()
+      : this.composeFilters(true, !!shouldUseWeeklyStep);
+
+    // Build options
+    const filterOptions: NaiveDate.FilterPropsOptions = {};
+    if (options?.until) {
+      // Handle UNTIL based on whether it's date-only or datetime
+      const untilDate = options.until.trunc();
+
+      if (options.until.nt) {
+        // DateTime UNTIL: inclusive up to the exact datetime
+        // Use the date portion as the end date (filter will include events on this date)
+        filterOptions.end = untilDate;
+      } else {
+        // Date-only UNTIL: exclusive of the entire day (Google Calendar behavior)
+        // Use the day before as the end date (filter will exclude events on UNTIL date)
+        filterOptions.end = untilDate.addDays(-1);
+      }
+    }
+    // Override end if it's explicitly passed in, but respect UNTIL date restrictions
+    if (end) {
+      if (filterOptions.end && filterOptions.end.dse < end.dse) {
+        // Keep the UNTIL date if it's earlier than the query end
+        // This preserves the exclusive date-only UNTIL behavior
+      } else {
+        filterOptions.end = end;
+      }
+    }
+
+    if (options?.count) {
+      // For Google Calendar consecutive weekly BYWEEKNO behavior,
+      // we manage COUNT manually in the recurrence generator
+      const isYearlyMultiEvent =
+        useGoogleCalendarBehavior &&
+        hasWeekNoFilter &&
+        this.inner.freq === "yearly" &&
+        options?.byday &&
+        options.byday.length > 1;
+      const isYearlyByWeekNo =
+        useGoogleCalendarBehavior &&
+        hasWeekNoFilter &&
+        this.inner.freq === "yearly";
+      if (
+        useGoogleCalendarBehavior &&
+        (shouldUseWeeklyStep || isYearlyMultiEvent || isYearlyByWeekNo)
+      ) {
+        // Don't set a limit at all, we'll handle COUNT in the recurrence generator
+        // This allows the generator to produce enough events for the post-processor to apply COUNT correctly
+      } else {
+        filterOptions.limit = options.count;
+      }
+    }
+    if (options?.wkst) filterOptions.weekStart = options.wkst;
+    filterOptions.filter = filter;
+    if (plan) {
+      filterOptions.tally = (origin, step, from, to) =>
+        plan.countPeriods(origin, step, from, to);
+    }
+
+    // For Google Calendar yearly BYWEEKNO patterns, ensure we don't limit the generator prematurely
+    if (
+      useGoogleCalendarBehavior &&
+      hasWeekNoFilter &&
+      this.inner.freq === "yearly"
+    ) {
+      // Don't override the limit if it's already unset for Google Calendar patterns
+      if (filterOptions.limit === undefined) {
+        filterOptions.limit = limit;
+      }
+    } else {
+      filterOptions.limit = limit ?? filterOptions.limit;
+    }
+
+    return {
+      step,
+      options: filterOptions,
+      plan,
+    };
+  }
+
+  private composeFilters(
+    useGoogleCalendarBehavior: boolean,
+    shouldUseWeeklyStep: boolean,
+  ): NaiveDate.Filter {
+    const options = this.inner.options;
     // Build filters array
     const filters: NaiveDate.Filter[] = [];
     // Apply BYMONTH first for yearly frequency to get the right months, then apply weekday filters
@@ -444,9 +663,10 @@ export class RRule {
     if (hasYearlyByweekno && hasByday && useGoogleCalendarBehavior) {
       // Special handling for yearly BYWEEKNO + BYDAY patterns
       // Apply BYWEEKNO first, then BYDAY to fix the 2026 missing event issue
+      const seenDates = new DseSet();
       const yearlyByweeknoFilter = (partialdate: PartialDate.Tuple) => {
         return (function* () {
-          const seenDates = new Set<string>();
+          seenDates.clear();
           for (const weekno of options.byweekno!) {
             // Apply BYWEEKNO filter first
             const useCalendarYear = useGoogleCalendarBehavior;
@@ -460,11 +680,8 @@ export class RRule {
             for (const [weekDate, _weekUnit] of singleWeekFilter(partialdate)) {
               const bydayFilter = NaiveDate.Filter.byWeekday(options.byday!);
               for (const [dayDate, dayUnit] of bydayFilter([weekDate, "day"])) {
-                const dateKey = dayDate.toString();
-                if (!seenDates.has(dateKey)) {
-                  seenDates.add(dateKey);
+                if (seenDates.add(dayDate.dse))
                   yield [dayDate, dayUnit] as PartialDate.Tuple;
-                }
               }
             }
           }
@@ -481,9 +698,10 @@ export class RRule {
         // Skip BYWEEKNO filter for Google Calendar consecutive behavior
         if (!(useGoogleCalendarBehavior && shouldUseWeeklyStep)) {
           // Create a single filter that handles multiple week numbers with OR logic
+          const seenDates = new DseSet();
           const byWeekNoFilter = (partialdate: PartialDate.Tuple) => {
             return (function* () {
-              const seenDates = new Set<string>();
+              seenDates.clear();
               for (const weekno of options.byweekno!) {
                 // For Google Calendar behavior:
                 // - Positive week numbers: use calendar year mode
@@ -497,11 +715,7 @@ export class RRule {
                   : NaiveDate.Filter.byWeekNo(weekno, useCalendarYear);
 
                 for (const result of singleWeekFilter(partialdate)) {
-                  const dateKey = result[0].toString();
-                  if (!seenDates.has(dateKey)) {
-                    seenDates.add(dateKey);
-                    yield result;
-                  }
+                  if (seenDates.add(result[0].dse)) yield result;
                 }
               }
             })();
@@ -514,89 +728,57 @@ export class RRule {
     }
     if (options?.byyearday && options.byyearday.length > 0)
       filters.push(NaiveDate.Filter.byDayOfYear(options.byyearday));
+    if (options?.byeaster && options.byeaster.length > 0)
+      filters.push(NaiveDate.Filter.byEaster(options.byeaster));
+
+    return filters.length > 0
+      ? filters.length === 1
+        ? filters[0]
+        : NaiveDate.Filter.compose(filters)
+      : NaiveDate.Filter.identity();
+  }
+}
 
-    const filter =
-      filters.length > 0
-        ? filters.length === 1
-          ? filters[0]
-          : NaiveDate.Filter.compose(filters)
-        : NaiveDate.Filter.identity();
-
-    // Build options
-    const filterOptions: NaiveDate.FilterPropsOptions = {};
-    if (options?.until) {
-      // Handle UNTIL based on whether it's date-only or datetime
-      const untilDate = options.until.trunc();
-
-      if (options.until.nt) {
-        // DateTime UNTIL: inclusive up to the exact datetime
-        // Use the date portion as the end date (filter will include events on this date)
-        filterOptions.end = untilDate;
-      } else {
-        // Date-only UNTIL: exclusive of the entire day (Google Calendar behavior)
-        // Use the day before as the end date (filter will exclude events on UNTIL date)
-        filterOptions.end = untilDate.addDays(-1);
-      }
-    }
-    // Override end if it's explicitly passed in, but respect UNTIL date restrictions
-    if (end) {
-      if (filterOptions.end && filterOptions.end.dse < end.dse) {
-        // Keep the UNTIL date if it's earlier than the query end
-        // This preserves the exclusive date-only UNTIL behavior
-      } else {
-        filterOptions.end = end;
-      }
-    }
-
-    if (options?.count) {
-      // For Google Calendar consecutive weekly BYWEEKNO behavior,
-      // we manage COUNT manually in the recurrence generator
-      const isYearlyMultiEvent =
-        useGoogleCalendarBehavior &&
-        hasWeekNoFilter &&
-        this.inner.freq === "yearly" &&
-        options?.byday &&
-        options.byday.length > 1;
-      const isYearlyByWeekNo =
-        useGoogleCalendarBehavior &&
-        hasWeekNoFilter &&
-        this.inner.freq === "yearly";
-      if (
-        useGoogleCalendarBehavior &&
-        (shouldUseWeeklyStep || isYearlyMultiEvent || isYearlyByWeekNo)
-      ) {
-        // Don't set a limit at all, we'll handle COUNT in the recurrence generator
-        // This allows the generator to produce enough events for the post-processor to apply COUNT correctly
-      } else {
-        filterOptions.limit = options.count;
-      }
-    }
-    if (options?.wkst) filterOptions.weekStart = options.wkst;
-    filterOptions.filter = filter;
-    filterOptions.recurLimit = 1000;
+export namespace RRule {
+  export import Plan = RRulePlan;
+  export import Times = RRuleTimes;
+  export import Scanner = RRuleScanner;
+
+  export const MAX_INTERNED = 512;
+  // (limit, end, Google mode) combinations kept per rule
+  export const MAX_CACHED_PROPS = 16;
+
+  // parsed rules by their string, least recently used first
+  export const interned = new Map<string, RRule>();
+
+  export type CompiledProps = NaiveDate.FilterProps & {
+    plan: Option<RRulePlan>;
+  };
+
+  /**
+   * What a rule compiles to, shared by the rules interned under one string.
+   */
+  export class Compiled {
+    readonly plans = new Map<DateUnit.Type, RRulePlan>();
+    readonly props = new Map<string, CompiledProps>();
+  }
 
-    // For Google Calendar yearly BYWEEKNO patterns, ensure we don't limit the generator prematurely
-    if (
-      useGoogleCalendarBehavior &&
-      hasWeekNoFilter &&
-      this.inner.freq === "yearly"
-    ) {
-      // Don't override the limit if it's already unset for Google Calendar patterns
-      if (filterOptions.limit === undefined) {
-        filterOptions.limit = limit;
+  /**
+   * Freezes `inner`, its options and their lists in place. Weekdays and
+   * dates are immutable already.
+   */
+  export function freeze(inner: RRuleLike): RRuleLike {
+    const options = inner.options;
+    if (options) {
+      for (const nth of options.bynthday ?? []) Object.freeze(nth);
+      for (const value of Object.values(options)) {
+        if (Array.isArray(value)) Object.freeze(value);
       }
-    } else {
-      filterOptions.limit = limit ?? filterOptions.limit;
+      Object.freeze(options);
     }
-
-    return {
-      step,
-      options: filterOptions,
-    };
+    return Object.freeze(inner);
   }
-}
 
-export namespace RRule {
   export class Raw {
     constructor(readonly attributes: ICalAttributes) {}
 
@@ -688,7 +870,13 @@ export namespace RRule {
               wkst: Weekday.parseOpt(rules.get("WKST")),
               interval: TentoMath.parseOpt(rules.get("INTERVAL")),
               count: TentoMath.parseOpt(rules.get("COUNT")),
-              bysetpos: TentoMath.parseOpt(rules.get("BYSETPOS")),
+              bysetpos: rules.get("BYSETPOS")
+                ? (rules
+                    .get("BYSETPOS")!
+                    .split(",")
+                    .map((p) => TentoMath.parseOpt(p))
+                    .filter((p) => p !== null) as number[])
+                : null,
               byday: byday,
               bynthday: bynthday,
               bymonth: rules.get("BYMONTH")
@@ -719,10 +907,17 @@ export namespace RRule {
                     .map((y) => TentoMath.parseOpt(y))
                     .filter((y) => y !== null) as number[])
                 : null,
+              byeaster: rules.get("BYEASTER")
+                ? (rules
+                    .get("BYEASTER")!
+                    .split(",")
+                    .map((e) => TentoMath.parseOpt(e))
+                    .filter((e) => e !== null) as number[])
+                : null,
               byhour: byhour,
               byminute: byminute,
               bysecond: bysecond,
-              tzid: rules.get("TZID"),
+              tzid: rules.get("TZID") ?? null,
               until: until ? IsoDate.parse(until).exp() : null,
             },
           },
@@ -12,6 +12,7 @@ import {
   Tzname,
   Utc,
 } from "./timezone";
+import { Time } from "./time";
 import { Epoch } from "./units/epoch";
 import { TimeOfDay } from "./units/time-of-day";
 import { MsSinceEpoch } from "./units/units";
@@ -181,54 +182,11 @@ export class TimezoneRegion {
       end: transitionEnd.mse,
     });
 
-    // No DST transitions found - use original timezone
-    if (transitions.length === 0) {
-      return new DateTime(ndt, originalDateTime.tz);
-    }
-
-    const lastTransition = transitions[transitions.length - 1];
-    const transitionDate = lastTransition.after.time.ndt.date;
-
-    // Current date is after transition date - use post-transition timezone
-    if (currentDate.dse > transitionDate.dse) {
-      return new DateTime(ndt, lastTransition.after.time.tz);
-    }
-
-    // Current date is before transition date - use original timezone
-    if (currentDate.dse < transitionDate.dse) {
-      return new DateTime(ndt, originalDateTime.tz);
-    }
-
-    // Current date equals transition date - check time-specific rules
-    const transitionTime = lastTransition.before.time.ndt.time;
-    const currentTime = ndt.time;
-
-    const beforeOffset = lastTransition.before.time.tz.info.offset.toHrsF;
-    const afterOffset = lastTransition.after.time.tz.info.offset.toHrsF;
-    const isFallBack = afterOffset < beforeOffset;
-    const isSpringForward = afterOffset > beforeOffset;
-
-    if (isFallBack) {
-      // Fall back: use post-transition timezone if at or after transition time
-      if (currentTime.toMs >= transitionTime.toMs) {
-        return new DateTime(ndt, lastTransition.after.time.tz);
-      }
-      return new DateTime(ndt, originalDateTime.tz);
-    }
-
-    if (isSpringForward) {
-      // Spring forward: use post-transition timezone if >=60 minutes after transition
-      const timeGapMs = currentTime.toMs - transitionTime.toMs;
-      const hourInMs = 60 * 60 * 1000;
-
-      if (timeGapMs >= hourInMs) {
-        return new DateTime(ndt, lastTransition.after.time.tz);
-      }
-      return new DateTime(ndt, originalDateTime.tz);
-    }
-
-    // Default case - use original timezone
-    return new DateTime(ndt, originalDateTime.tz);
+    return TimezoneRegion.googleResolved(
+      ndt,
+      originalDateTime,
+      transitions[transitions.length - 1],
+    );
   }
 
   /**
@@ -422,10 +380,243 @@ export namespace TimezoneRegion {
     }
   }
 
+  /**
+   * The region of `tzname` if it's already loaded, without loading it.
+   */
+  export function cached(tzname: Tzname): Option<TimezoneRegion> {
+    return defaultCache.get(tzname) ?? null;
+  }
+
+  /**
+   * Loads the regions of `tznames` that aren't loaded yet, concurrently and
+   * each once, so they can then be looked up synchronously with `cached`.
+   * Like `get`, a region that can't be loaded is logged and left out.
+   */
+  export async function prefetch(tznames: Iterable<Tzname>): Promise<void> {
+    const missing = new Set<Tzname>();
+    for (const tzname of tznames) {
+      if (!defaultCache.has(tzname)) missing.add(tzname);
+    }
+    await Promise.all([...missing].map((tzname) => get(tzname)));
+  }
+
   export function setLoader(l: Loader) {
     loader = l;
   }
 
+  /**
+   * Resolves wall clock times to UTC offsets the same way as `toWallClock`,
+   * without allocating per lookup.
+   *
+   * Lookups are expected to be (mostly) non-decreasing: the active transition
+   * is tracked with a cursor that only moves forward, and is reset if a
+   * lookup goes backwards.
+   */
+  export class WallClockCursor {
+    private readonly table: TransitionTable;
+    private idx = -1;
+    private last = -Infinity;
+
+    constructor(readonly region: TimezoneRegion) {
+      this.table = transitionTable(region);
+    }
+
+    /**
+     * Offset in ms of the wall clock time `localMs` (a naive ms since epoch).
+     */
+    offsetMs(localMs: number): number {
+      const { beforeMse, dse, threshold, beforeOffset, afterOffset } =
+        this.table;
+      const n = beforeMse.length;
+      if (localMs < this.last) this.idx = -1;
+      this.last = localMs;
+      while (this.idx + 1 < n && beforeMse[this.idx + 1] <= localMs) {
+        ++this.idx;
+      }
+
+      // a transition on the same wall clock day takes precedence
+      const day = Math.floor(localMs / Time.MS_PER_DAY);
+      const lo = localMs - 2 * Time.MS_PER_DAY;
+      const hi = localMs + 2 * Time.MS_PER_DAY;
+      let i = Math.max(this.idx, 0);
+      while (i > 0 && beforeMse[i - 1] >= lo) --i;
+      for (; i < n && beforeMse[i] <= hi; ++i) {
+        if (dse[i] !== day || Number.isNaN(threshold[i])) continue;
+        return localMs - day * Time.MS_PER_DAY >= threshold[i]
+          ? afterOffset[i]
+          : beforeOffset[i];
+      }
+
+      return this.idx < 0 ? 0 : afterOffset[this.idx];
+    }
+  }
+
+  /**
+   * Transitions of a region as parallel typed arrays, for cursors.
+   */
+  export type TransitionTable = {
+    beforeMse: Float64Array;
+    // date (of the wall clock after the transition) the transition is on
+    dse: Int32Array;
+    // ms of day at or after which the after offset applies, NaN if the
+    // transition doesn't change the offset
+    threshold: Float64Array;
+    beforeOffset: Float64Array;
+    afterOffset: Float64Array;
+  };
+
+  const tables = new WeakMap<TimezoneRegion, TransitionTable>();
+
+  export function transitionTable(region: TimezoneRegion): TransitionTable {
+    const existing = tables.get(region);
+    if (existing) return existing;
+
+    const transitions = region.transitions;
+    const n = transitions.length;
+    const table: TransitionTable = {
+      beforeMse: new Float64Array(n),
+      dse: new Int32Array(n),
+      threshold: new Float64Array(n),
+      beforeOffset: new Float64Array(n),
+      afterOffset: new Float64Array(n),
+    };
+
+    for (const [i, { before, after }] of transitions.entries()) {
+      const beforeOffset = before.time.tz.info.offset.toMs;
+      const afterOffset = after.time.tz.info.offset.toMs;
+      const wall = before.time.ndt.time.toMs;
+
+      table.beforeMse[i] = before.mse;
+      table.dse[i] = after.time.ndt.date.dse;
+      table.beforeOffset[i] = beforeOffset;
+      table.afterOffset[i] = afterOffset;
+      if (afterOffset > beforeOffset) {
+        // spring forward: from the start of the gap
+        table.threshold[i] = wall;
+      } else if (afterOffset < beforeOffset) {
+        // fall back: from the start of the overlap
+        table.threshold[i] = wall - (beforeOffset - afterOffset);
+      } else {
+        table.threshold[i] = NaN;
+      }
+    }
+
+    tables.set(region, table);
+    return table;
+  }
+
+  /**
+   * The resolution step of `googleDatetimeResolved`, given the last
+   * transition between the original date and the end of `ndt`'s date.
+   */
+  export function googleResolved(
+    ndt: NaiveDateTime,
+    originalDateTime: DateTime<any>,
+    lastTransition: Option<Transition>,
+  ): DateTime<FixedOffset> {
+    const currentDate = ndt.date;
+
+    // No DST transitions found - use original timezone
+    if (!lastTransition) {
+      return new DateTime(ndt, originalDateTime.tz);
+    }
+
+    const transitionDate = lastTransition.after.time.ndt.date;
+
+    // Current date is after transition date - use post-transition timezone
+    if (currentDate.dse > transitionDate.dse) {
+      return new DateTime(ndt, lastTransition.after.time.tz);
+    }
+
+    // Current date is before transition date - use original timezone
+    if (currentDate.dse < transitionDate.dse) {
+      return new DateTime(ndt, originalDateTime.tz);
+    }
+
+    // Current date equals transition date - check time-specific rules
+    const transitionTime = lastTransition.before.time.ndt.time;
+    const currentTime = ndt.time;
+
+    const beforeOffset = lastTransition.before.time.tz.info.offset.toHrsF;
+    const afterOffset = lastTransition.after.time.tz.info.offset.toHrsF;
+    const isFallBack = afterOffset < beforeOffset;
+    const isSpringForward = afterOffset > beforeOffset;
+
+    if (isFallBack) {
+      // Fall back: use post-transition timezone if at or after transition time
+      if (currentTime.toMs >= transitionTime.toMs) {
+        return new DateTime(ndt, lastTransition.after.time.tz);
+      }
+      return new DateTime(ndt, originalDateTime.tz);
+    }
+
+    if (isSpringForward) {
+      // Spring forward: use post-transition timezone if >=60 minutes after transition
+      const timeGapMs = currentTime.toMs - transitionTime.toMs;
+      const hourInMs = 60 * 60 * 1000;
+
+      if (timeGapMs >= hourInMs) {
+        return new DateTime(ndt, lastTransition.after.time.tz);
+      }
+      return new DateTime(ndt, originalDateTime.tz);
+    }
+
+    // Default case - use original timezone
+    return new DateTime(ndt, originalDateTime.tz);
+  }
+
+  /**
+   * `googleDatetimeResolved` against a fixed original datetime, for
+   * non-decreasing dates.
+   *
+   * The last transition up to each date is tracked with a cursor that only
+   * moves forward (and restarts if a date goes backwards), instead of
+   * slicing the transitions since the original date for every occurrence.
+   */
+  export class GoogleCursor {
+    private readonly table: TransitionTable;
+    // first transition considered, see `transitionsBetween`
+    private readonly startIdx: number;
+    private endIdx = -1;
+    private lastEnd = -Infinity;
+
+    constructor(
+      readonly region: TimezoneRegion,
+      readonly originalDateTime: DateTime<any>,
+    ) {
+      this.table = transitionTable(region);
+      const start = originalDateTime.ndt.date.dse * Time.MS_PER_DAY;
+      let idx = -1;
+      while (
+        idx + 1 < this.table.beforeMse.length &&
+        this.table.beforeMse[idx + 1] <= start
+      ) {
+        ++idx;
+      }
+      this.startIdx = Math.max(idx, 0);
+    }
+
+    resolve(ndt: NaiveDateTime): DateTime<FixedOffset> {
+      const { beforeMse } = this.table;
+      const n = beforeMse.length;
+
+      // end of the day, as in `googleDatetimeResolved`
+      const end = ndt.date.dse * Time.MS_PER_DAY + Time.MS_PER_DAY - 1000;
+      if (end < this.lastEnd) this.endIdx = -1;
+      this.lastEnd = end;
+      while (this.endIdx + 1 < n && beforeMse[this.endIdx + 1] <= end) {
+        ++this.endIdx;
+      }
+
+      const last = this.endIdx > 0 ? this.endIdx : n - 1;
+      return googleResolved(
+        ndt,
+        this.originalDateTime,
+        last >= this.startIdx ? this.region.transitions[last] : null,
+      );
+    }
+  }
+
   /**
    * Transitions
    */
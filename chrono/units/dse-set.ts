@@ -0,0 +1,84 @@
+import { DaysSinceEpoch } from "./units";
+
+/**
+ * A set of days since epoch, stored as a bitset over the window of days seen
+ * so far.
+ *
+ * Used to deduplicate candidate dates without formatting them into strings.
+ * The window grows to cover any day that is added, so it's meant for dates
+ * that are close together (e.g. a period, or a single recurrence stream).
+ */
+export class DseSet {
+  // days since epoch of bit 0, always a multiple of 32
+  private base: number = 0;
+  private words: Uint32Array = DseSet.EMPTY;
+  // cleared, so the next day added places the window
+  private cleared = false;
+
+  add(dse: DaysSinceEpoch | number): boolean {
+    if (this.cleared) {
+      this.cleared = false;
+      this.base = DseSet.align(dse);
+    }
+    let idx = dse - this.base;
+    if (idx < 0 || idx >= this.words.length * 32) {
+      this.grow(dse);
+      idx = dse - this.base;
+    }
+    const word = idx >>> 5;
+    const bit = 1 << (idx & 31);
+    if (this.words[word] & bit) return false;
+    this.words[word] |= bit;
+    return true;
+  }
+
+  has(dse: DaysSinceEpoch | number): boolean {
+    const idx = dse - this.base;
+    if (idx < 0 || idx >= this.words.length * 32) return false;
+    return (this.words[idx >>> 5] & (1 << (idx & 31))) !== 0;
+  }
+
+  /**
+   * Empties the set for the next period. The window goes back to its
+   * initial size and moves to the next day added, so a set reused over a
+   * long series costs the same per period however far it has come.
+   */
+  clear() {
+    if (this.words.length > DseSet.INITIAL_WORDS) {
+      this.words = new Uint32Array(DseSet.INITIAL_WORDS);
+    } else {
+      this.words.fill(0);
+    }
+    this.cleared = this.words.length > 0;
+  }
+
+  private grow(dse: number) {
+    if (this.words.length === 0) {
+      this.base = DseSet.align(dse);
+      this.words = new Uint32Array(DseSet.INITIAL_WORDS);
+      return;
+    }
+
+    const lo = Math.min(this.base, dse);
+    const hi = Math.max(this.base + this.words.length * 32, dse + 1);
+    const base = DseSet.align(lo);
+    let len = this.words.length;
+    while (base + len * 32 < hi) len *= 2;
+
+    const words = new Uint32Array(len);
+    words.set(this.words, (this.base - base) >>> 5);
+    this.base = base;
+    this.words = words;
+  }
+}
+
+export namespace DseSet {
+  export const EMPTY = new Uint32Array(0);
+  // 512 days, enough for a yearly period plus the iso weeks around it
+  export const INITIAL_WORDS = 16;
+
+  // the multiple of 32 at or below `dse`
+  export function align(dse: number): number {
+    return dse - (((dse % 32) + 32) % 32);
+  }
+}
@@ -0,0 +1,79 @@
+import { DaysSinceEpoch } from "./units";
+import { Year } from "./year";
+
+/**
+ * Easter Sunday in the Gregorian calendar.
+ *
+ * Recurrence rules look up Easter once per year they touch, so the years
+ * `FIRST_YEAR` to `LAST_YEAR` come from a precomputed table, and only years
+ * outside it run the computus.
+ */
+export namespace Easter {
+  export const FIRST_YEAR = 1900;
+  export const LAST_YEAR = 2299;
+
+  // days from March 22 (the earliest Easter) to Easter, in base 36, for each
+  // year from FIRST_YEAR
+  const OFFSETS =
+    "og8lcwo9sk5pg1ldwh9td5patldqh9te5paul6qi2meyiauf6q" +
+    "i3merjauf7qbvn7rj4nf7kbvn8rj4ofskcvg8sc4o9skcpg8ld" +
+    "wo9tk5ph1ldxh9te5pauldqi9te6paum6qi3meyjauf7qi3ner" +
+    "jbuf7rbvn8rj4of7kcvn8sj4ogskcwg8sd4o9tkcph8ldxo9tl" +
+    "6qi3merjauf7qbvn7rj4nf7kbvn8rj4ofskcvg8sc4o9skcpg8" +
+    "ldwo9tk5ph1ldxh9te5pauldqi9te6paum6qi3meyjauf7qi3n" +
+    "fskcvg8sc4o9sk5pg8ldwo9tk5ph1ldxh9te5pauldqi9me6pa" +
+    "um6qi3meyjauf7qb3nerjbuf7rbvn8rj4of0kcvg8sj4ogskcp";
+
+  // decoded on first use
+  let table: Option<Int32Array> = null;
+
+  /**
+   * Easter Sunday of `yr`, in days since epoch.
+   */
+  export function dse(yr: number): DaysSinceEpoch {
+    if (yr < FIRST_YEAR || yr > LAST_YEAR) return computus(yr);
+    table ??= decode();
+    return table[yr - FIRST_YEAR] as DaysSinceEpoch;
+  }
+
+  /**
+   * Easter Sunday of `yr`, as a 0-based day of the year.
+   */
+  export function doy(yr: number): number {
+    return dse(yr) - Year.dseFromYear(yr);
+  }
+
+  /**
+   * Easter Sunday of `yr`, computed with the anonymous Gregorian algorithm
+   * (Meeus/Jones/Butcher).
+   */
+  export function computus(yr: number): DaysSinceEpoch {
+    const a = yr % 19;
+    const b = Math.floor(yr / 100);
+    const c = yr % 100;
+    const d = Math.floor(b / 4);
+    const e = b % 4;
+    const f = Math.floor((b + 8) / 25);
+    const g = Math.floor((b - f + 1) / 3);
+    const h = (19 * a + b - d - g + 15) % 30;
+    const i = Math.floor(c / 4);
+    const k = c % 4;
+    const l = (32 + 2 * e + 2 * i - h - k) % 7;
+    const m = Math.floor((a + 11 * h + 22 * l) / 451);
+    // days from March 22
+    const offset = h + l - 7 * m;
+    return (march22(yr) + offset) as DaysSinceEpoch;
+  }
+
+  function march22(yr: number): number {
+    return Year.dseFromYear(yr) + 80 + (Year.isLeapYear(yr) ? 1 : 0);
+  }
+
+  function decode(): Int32Array {
+    const out = new Int32Array(OFFSETS.length);
+    for (let i = 0; i < OFFSETS.length; ++i) {
+      out[i] = march22(FIRST_YEAR + i) + parseInt(OFFSETS[i], 36);
+    }
+    return out;
+  }
+}
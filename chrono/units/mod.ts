@@ -12,8 +12,10 @@ export * from "./units";
 export * from "./weekday";
 export * from "./month";
 export * from "./year";
+export * from "./easter";
 export * from "./year-month";
 export * from "./year-month-day";
 export * from "./partial-date";
+export * from "./dse-set";
 export * from "./time-of-day";
 export * from "./ms";
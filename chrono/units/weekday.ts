@@ -85,27 +85,43 @@ export class Weekday {
     end: YearMonthDay,
     endDay: number,
   ): DayOfYear1[] {
-    const startWkday = start.dayOfWeek;
-    const endWkday = end.dayOfWeek;
+    return Weekday.nthOffsets(
+      ndows,
+      start.dayOfWeek.dow,
+      end.dayOfWeek.dow,
+      endDay,
+    ) as DayOfYear1[];
+  }
 
+  /**
+   * Sorted offsets from the start of a period of `len` days of each nth
+   * weekday. Only depends on the period's shape, so it can be cached by
+   * `Year.shape` / `YearMonth.shape`.
+   */
+  static nthOffsets(
+    ndows: Weekday.Nth[],
+    startDow: DayOfWeek1,
+    endDow: DayOfWeek1,
+    len: number,
+  ): number[] {
     const ndowsByDay = ndows
       .map((dow) => {
         if (dow.n > 0) {
-          let offset = dow.weekday.dow - startWkday.dow;
+          let offset = dow.weekday.dow - startDow;
           if (offset < 0) offset += 7;
           offset += (dow.n - 1) * 7;
           return offset;
         } else {
-          let offset = dow.weekday.dow - endWkday.dow;
+          let offset = dow.weekday.dow - endDow;
           if (offset > 0) offset -= 7;
           offset += (dow.n + 1) * 7;
-          return endDay + offset - 1;
+          return len + offset - 1;
         }
       })
-      .filter((offset) => offset >= 0 && offset < endDay);
+      .filter((offset) => offset >= 0 && offset < len);
 
     ndowsByDay.sort((a, b) => a - b);
-    return ndowsByDay as DayOfYear1[];
+    return ndowsByDay;
   }
 
   /**
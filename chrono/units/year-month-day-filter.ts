@@ -1,10 +1,19 @@
-import { GenericRangeLike, range } from "../range";
+import { GenericRangeLike } from "../range";
 
 import { NaiveDate } from "../naive-date";
 import { DateUnit } from "./date-unit";
 import { Month } from "./month";
 import { PartialDate } from "./partial-date";
-import { DayOfMonth1, DayOfYear1, Month1, WeekOfYear1 } from "./units";
+import { DseSet } from "./dse-set";
+import { Easter } from "./easter";
+import {
+  DayOfMonth1,
+  DayOfWeek1,
+  DayOfYear1,
+  DaysSinceEpoch,
+  Month1,
+  WeekOfYear1,
+} from "./units";
 import { Weekday } from "./weekday";
 import { Year } from "./year";
 import { YearMonth, Ym1Like } from "./year-month";
@@ -17,8 +26,14 @@ export type YearMonthDayFilter = (
 export namespace YearMonthDayFilter {
   type Filter = YearMonthDayFilter;
 
+  const IDENTITY: Filter = ([nd]) => _identity(nd);
+
   export function identity(): Filter {
-    return ([nd]) => _identity(nd);
+    return IDENTITY;
+  }
+
+  export function isIdentity(filter: Filter): boolean {
+    return filter === IDENTITY;
   }
 
   function* _identity(
@@ -40,7 +55,7 @@ export namespace YearMonthDayFilter {
     filters: Filter[],
   ): Generator<PartialDate.Tuple> {
     const generators: Generator<PartialDate.Tuple>[] = [];
-    const uniqueDates = new Set<string>(); // To deduplicate final dates
+    const uniqueDates = new DseSet(); // To deduplicate final dates
 
     let curr: PartialDate.Tuple = partialdate;
     for (const [idx, f] of filters.entries()) {
@@ -50,11 +65,8 @@ export namespace YearMonthDayFilter {
       generators.push(gen);
       curr = next.value;
       if (idx === filters.length - 1) {
-        const dateKey = curr[0].toString();
-        if (!uniqueDates.has(dateKey)) {
-          uniqueDates.add(dateKey);
-          yield curr;
-        }
+        // invalid dates share a dse with a valid one, and are dropped later
+        if (!curr[0].isValid() || uniqueDates.add(curr[0].dse)) yield curr;
       }
     }
 
@@ -63,11 +75,8 @@ export namespace YearMonthDayFilter {
         const leaf = generators.pop();
         if (!leaf) return;
         for (const value of leaf) {
-          const dateKey = value[0].toString();
-          if (!uniqueDates.has(dateKey)) {
-            uniqueDates.add(dateKey);
+          if (!value[0].isValid() || uniqueDates.add(value[0].dse))
             yield value;
-          }
         }
       }
 
@@ -97,30 +106,52 @@ export namespace YearMonthDayFilter {
     [cand, unit]: PartialDate.Tuple,
     dow1: Option<boolean>[],
   ): Generator<PartialDate.Tuple> {
+    let lo: number;
+    let len: number;
     switch (unit) {
       case "year":
-        // TODO: we can use a better generator for this instead of checking
-        // each day
-        for (const day of range(Year.length(cand.yr))) {
-          const nd = cand.addDays(day - 1);
-          if (dow1[nd.dayOfWeek.dow]) yield [nd, "day"];
-        }
+        lo = cand.dse - 1;
+        len = Year.length(cand.yr);
         break;
       case "month":
-        for (const day of YearMonth.dom(cand)) {
-          const nd = YearMonthDay.fromYmd1Unchecked(cand.yr, cand.mth, day);
-          if (dow1[nd.dayOfWeek.dow]) yield [nd, "day"];
-        }
+        lo = YearMonthDay.fromYmd1Unchecked(cand.yr, cand.mth, 1).dse;
+        len = YearMonth.daysInMonth(cand);
         break;
       case "week":
-        for (let i = 0; i < 7; ++i) {
-          const day = cand.addDays(i);
-          if (dow1[day.dayOfWeek.dow]) yield [day, "day"];
-        }
+        lo = cand.dse;
+        len = 7;
         break;
       case "day":
         if (dow1[cand.dayOfWeek.dow]) yield [cand, "day"];
-        break;
+        return;
+    }
+
+    for (const dse of _strideWeekdays(lo, lo + len, dow1)) {
+      yield [YearMonthDay.fromDse(dse as DaysSinceEpoch), "day"];
+    }
+  }
+
+  /**
+   * Days in [lo, hi) whose weekday is in `dow1`, in order. Jumps from the
+   * first matching day of the first week in 7 day strides.
+   */
+  function* _strideWeekdays(
+    lo: number,
+    hi: number,
+    dow1: Option<boolean>[],
+  ): Generator<number> {
+    const offsets: number[] = [];
+    const first = Weekday.fromDse(lo as DaysSinceEpoch) || 7;
+    for (let i = 0; i < 7; ++i) {
+      if (dow1[((first - 1 + i) % 7) + 1]) offsets.push(i);
+    }
+    if (offsets.length === 0) return;
+
+    for (let week = lo; week < hi; week += 7) {
+      for (const offset of offsets) {
+        if (week + offset >= hi) return;
+        yield week + offset;
+      }
     }
   }
 
@@ -163,15 +194,18 @@ export namespace YearMonthDayFilter {
     const domsNeg = dayOfMonths.filter((doy) => doy < 0);
     domsNeg.sort((a, b) => b - a);
 
-    // todo: memo this
+    // keyed by month length, the only part of the month's shape that matters
+    const domsByLen: Option<DayOfMonth1[]>[] = [];
     const makeDoms = (ym1: Ym1Like): DayOfMonth1[] => {
       const monthLen = YearMonth.daysInMonth(ym1);
+      const cached = domsByLen[monthLen];
+      if (cached) return cached;
       const doms = [
         ...domsPos,
         ...domsNeg.map((dom) => monthLen + dom + 1),
       ] as DayOfMonth1[];
-      doms.sort();
-      return doms;
+      doms.sort((a, b) => a - b);
+      return (domsByLen[monthLen] = doms);
     };
     return (partialdate: PartialDate.Tuple) =>
       _byDayOfMonth(partialdate, makeDoms);
@@ -218,9 +252,9 @@ export namespace YearMonthDayFilter {
     const doysNeg = dayOfYears.filter((doy) => doy < 0);
 
     const doys365 = [...doysPos, ...doysNeg.map((doy) => 365 + doy + 1)];
-    doys365.sort();
+    doys365.sort((a, b) => a - b);
     const doys366 = [...doysPos, ...doysNeg.map((doy) => 366 + doy + 1)];
-    doys366.sort();
+    doys366.sort((a, b) => a - b);
 
     return (partialdate: PartialDate.Tuple) =>
       _byDayOfYear(partialdate, doys365, doys366);
@@ -234,20 +268,27 @@ export namespace YearMonthDayFilter {
     // Handle years, months, and days cases normally with current year
     if (unit !== "week") {
       const yr = cand.yr;
-      const doys = Year.isLeapYear(yr) ? doys366 : doys365;
+      const leap = Year.isLeapYear(yr) ? 1 : 0;
+      const doys = leap ? doys366 : doys365;
+      // days of the year (0-indexed) that are in the period
+      let lo = 0;
+      let hi = 365 + leap;
+      switch (unit) {
+        case "month":
+          lo = Month.MONTH_START_OF_YEAR[leap][cand.mth - 1];
+          hi = Month.MONTH_START_OF_YEAR[leap][cand.mth];
+          break;
+        case "day":
+          if (!cand.isValid()) return;
+          lo = YearMonth.doyForMonthStart(cand) + cand.day - 1;
+          hi = lo + 1;
+          break;
+      }
+
+      const jan1 = Year.dseFromYear(yr);
       for (const doy of doys) {
-        const date = YearMonthDay.fromYmd1Exp(yr, 1, 1).addDays(doy - 1);
-        switch (unit) {
-          case "year":
-            if (date.yr === cand.yr) yield [date, "day"];
-            break;
-          case "month":
-            if (date.mth === cand.mth) yield [date, "day"];
-            break;
-          case "day":
-            if (date.cmpInvalid(cand) === 0) yield [date, "day"];
-            break;
-        }
+        if (doy - 1 < lo || doy - 1 >= hi) continue;
+        yield [YearMonthDay.fromDse((jan1 + doy - 1) as DaysSinceEpoch), "day"];
       }
       return;
     }
@@ -285,6 +326,56 @@ export namespace YearMonthDayFilter {
     }
   }
 
+  /**
+   * Days `offsets` days from Easter Sunday (BYEASTER), within the year of
+   * that Easter.
+   */
+  export function byEaster(offsets: number[]): Filter {
+    const sorted = [...new Set(offsets)].sort((a, b) => a - b);
+    return (partialdate: PartialDate.Tuple) => _byEaster(partialdate, sorted);
+  }
+
+  function* _byEaster(
+    [cand, unit]: PartialDate.Tuple,
+    offsets: number[],
+  ): Generator<PartialDate.Tuple> {
+    let lo: number;
+    let hi: number;
+    switch (unit) {
+      case "year":
+        lo = Year.dseFromYear(cand.yr);
+        hi = lo + Year.length(cand.yr);
+        break;
+      case "month":
+        lo = YearMonthDay.fromYmd1Unchecked(cand.yr, cand.mth, 1).dse;
+        hi = lo + YearMonth.daysInMonth(cand);
+        break;
+      case "week":
+        lo = cand.dse;
+        hi = lo + 7;
+        break;
+      case "day":
+        if (!cand.isValid()) return;
+        lo = cand.dse;
+        hi = lo + 1;
+        break;
+    }
+
+    // a week can straddle two years, each with its own Easter
+    const first = YearMonthDay.fromDse(lo as DaysSinceEpoch).yr;
+    const last = YearMonthDay.fromDse((hi - 1) as DaysSinceEpoch).yr;
+    for (let yr = first; yr <= last; ++yr) {
+      const jan1 = Year.dseFromYear(yr);
+      const easter = Easter.dse(yr);
+      for (const offset of offsets) {
+        const dse = easter + offset;
+        if (dse < lo || dse >= hi) continue;
+        if (dse < jan1 || dse >= jan1 + Year.length(yr)) continue;
+        yield [YearMonthDay.fromDse(dse as DaysSinceEpoch), "day"];
+      }
+    }
+  }
+
   export function byWeekNo(
     weekno1: number,
     useCalendarYear: boolean = false,
@@ -316,7 +407,7 @@ export namespace YearMonthDayFilter {
     weekno1: WeekOfYear1,
     useCalendarYear: boolean = false,
   ): Generator<PartialDate.Tuple> {
-    const weeknoCache = new Set<string>();
+    const weeknoCache = new DseSet();
     let bounds: NaiveDate.Range;
     
     switch (unit) {
@@ -363,11 +454,7 @@ export namespace YearMonthDayFilter {
             const d = targetMonday.addDays(i);
             if (!bounds.contains(d)) continue;
             
-            const cacheKey = `${targetYear}_${d.toString()}`;
-            if (!weeknoCache.has(cacheKey)) {
-              weeknoCache.add(cacheKey);
-              yield [d, "day"];
-            }
+            if (weeknoCache.add(d.dse)) yield [d, "day"];
           }
         }
       } else {
@@ -387,11 +474,7 @@ export namespace YearMonthDayFilter {
             const d = targetMonday.addDays(i);
             if (!bounds.contains(d)) continue;
             
-            const cacheKey = `${targetYear}_${d.toString()}`;
-            if (!weeknoCache.has(cacheKey)) {
-              weeknoCache.add(cacheKey);
-              yield [d, "day"];
-            }
+            if (weeknoCache.add(d.dse)) yield [d, "day"];
           }
         }
       }
@@ -408,17 +491,13 @@ export namespace YearMonthDayFilter {
           : Math.abs(weekno1) <= numWeeks;
       });
 
-      const seenDates = new Set<string>();
+      const seenDates = new DseSet();
       for (const year of yearsToCheck) {
         for (let i = 0; i < 7; ++i) {
           if (weekno1 > 0) {
             const d = year.addDays((weekno1 - 1) * 7 + i);
             if (!bounds.contains(d)) continue;
-            const dateKey = d.toString();
-            if (!seenDates.has(dateKey)) {
-              seenDates.add(dateKey);
-              yield [d, "day"];
-            }
+            if (seenDates.add(d.dse)) yield [d, "day"];
           } else {
             // For negative week numbers, calculate from the end of the year
             const isoYear = year.isoYw1.yr;
@@ -426,11 +505,7 @@ export namespace YearMonthDayFilter {
             const targetWeekFromStart = numWeeks + weekno1 + 1; // Convert negative to positive
             const d = year.addDays((targetWeekFromStart - 1) * 7 + i);
             if (!bounds.contains(d)) continue;
-            const dateKey = d.toString();
-            if (!seenDates.has(dateKey)) {
-              seenDates.add(dateKey);
-              yield [d, "day"];
-            }
+            if (seenDates.add(d.dse)) yield [d, "day"];
           }
         }
       }
@@ -441,38 +516,81 @@ export namespace YearMonthDayFilter {
     dayOfWeeks: Weekday.Nth[],
     simpleEqForDays: boolean = true,
   ): Filter {
+    const shapes: NthShapes = {
+      year: new Array(Year.NUM_SHAPES),
+      month: new Array(YearMonth.NUM_SHAPES),
+    };
     return (partialdate: PartialDate.Tuple) =>
-      _byNthWeekday(partialdate, dayOfWeeks, simpleEqForDays);
+      _byNthWeekday(partialdate, dayOfWeeks, simpleEqForDays, shapes);
+  }
+
+  /**
+   * Offsets of the nth weekdays from the start of a period, by the period's
+   * shape. A repeated shape is just a lookup plus the period's start.
+   */
+  type NthShapes = {
+    year: Option<number[]>[];
+    month: Option<number[]>[];
+  };
+
+  function _nthOffsets(
+    cache: Option<number[]>[],
+    shape: number,
+    dayOfWeeks: Weekday.Nth[],
+    start: number,
+    len: number,
+  ): number[] {
+    const cached = cache[shape];
+    if (cached) return cached;
+    const startDow = Weekday.fromDse(start as DaysSinceEpoch) || 7;
+    const endDow = Weekday.fromDse((start + len - 1) as DaysSinceEpoch) || 7;
+    return (cache[shape] = Weekday.nthOffsets(
+      dayOfWeeks,
+      startDow as DayOfWeek1,
+      endDow as DayOfWeek1,
+      len,
+    ));
   }
 
   function* _byNthWeekday(
     [cand, unit]: PartialDate.Tuple,
     dayOfWeeks: Weekday.Nth[],
     simpleEqForDays: boolean = true,
+    shapes: NthShapes = { year: [], month: [] },
   ): Generator<PartialDate.Tuple> {
     switch (unit) {
       case "year":
         {
-          const wrap = Year.length(cand.yr);
-          const start = YearMonthDay.fromYmd1Exp(cand.yr, 1, 1);
-          const end = YearMonthDay.fromYmd1Exp(cand.yr, 12, 31);
-          const days = Weekday.nthForYear(dayOfWeeks, start, end, wrap);
-
-          for (const ndow of days) {
-            yield [start.add({ days: ndow }), "day"];
+          const start = Year.dseFromYear(cand.yr);
+          const offsets = _nthOffsets(
+            shapes.year,
+            Year.shape(cand.yr),
+            dayOfWeeks,
+            start,
+            Year.length(cand.yr),
+          );
+
+          for (const offset of offsets) {
+            const dse = (start + offset) as DaysSinceEpoch;
+            yield [YearMonthDay.fromDse(dse), "day"];
           }
         }
         break;
       case "month":
         {
-          const wrap = YearMonth.daysInMonth(cand);
-          const start = YearMonthDay.fromYmd1Exp(cand.yr, cand.mth, 1);
-          const end = YearMonthDay.fromYmd1Exp(cand.yr, cand.mth, wrap);
-          const days = Weekday.nthForYear(dayOfWeeks, start, end, wrap);
-
-          for (const ndow of days) {
-            const resultDate = start.add({ days: ndow });
-            yield [resultDate, "day"];
+          const start =
+            Year.dseFromYear(cand.yr) + YearMonth.doyForMonthStart(cand);
+          const offsets = _nthOffsets(
+            shapes.month,
+            YearMonth.shape(cand),
+            dayOfWeeks,
+            start,
+            YearMonth.daysInMonth(cand),
+          );
+
+          for (const offset of offsets) {
+            const dse = (start + offset) as DaysSinceEpoch;
+            yield [YearMonthDay.fromDse(dse), "day"];
           }
         }
         break;
@@ -499,14 +617,19 @@ export namespace YearMonthDayFilter {
 
           // NOTE: represents Nth of every month
           //
-          const wrap = YearMonth.daysInMonth(cand);
-          const start = YearMonthDay.fromYmd1Exp(cand.yr, cand.mth, 1);
-          const end = YearMonthDay.fromYmd1Exp(cand.yr, cand.mth, wrap);
-          const days = Weekday.nthForYear(dayOfWeeks, start, end, wrap);
-
-          const ndowDays = days.map((days) => start.add({ days }));
-          for (const ndow of ndowDays) {
-            if (ndow.cmpInvalid(cand) === 0) yield [ndow, "day"];
+          if (!cand.isValid()) return;
+          const start =
+            Year.dseFromYear(cand.yr) + YearMonth.doyForMonthStart(cand);
+          const offsets = _nthOffsets(
+            shapes.month,
+            YearMonth.shape(cand),
+            dayOfWeeks,
+            start,
+            YearMonth.daysInMonth(cand),
+          );
+
+          for (const offset of offsets) {
+            if (offset === cand.day - 1) yield [cand, "day"];
           }
         }
         break;
@@ -518,7 +641,7 @@ export namespace YearMonthDayFilter {
     weekno1: WeekOfYear1,
     useCalendarYear: boolean = false,
   ): Generator<PartialDate.Tuple> {
-    const weeknoCache = new Set<string>();
+    const weeknoCache = new DseSet();
     let bounds: NaiveDate.Range;
     
     // Google Calendar behavior: BYWEEKNO with monthly frequency spans entire year
@@ -570,11 +693,7 @@ export namespace YearMonthDayFilter {
             }
             if (!bounds.contains(d)) continue;
             
-            const cacheKey = `${targetYear}_${d.toString()}`;
-            if (!weeknoCache.has(cacheKey)) {
-              weeknoCache.add(cacheKey);
-              yield [d, "day"];
-            }
+            if (weeknoCache.add(d.dse)) yield [d, "day"];
           }
         }
       } else {
@@ -603,11 +722,7 @@ export namespace YearMonthDayFilter {
             }
             if (!bounds.contains(d)) continue;
             
-            const cacheKey = `${targetYear}_${d.toString()}`;
-            if (!weeknoCache.has(cacheKey)) {
-              weeknoCache.add(cacheKey);
-              yield [d, "day"];
-            }
+            if (weeknoCache.add(d.dse)) yield [d, "day"];
           }
         }
       }
@@ -624,17 +739,13 @@ export namespace YearMonthDayFilter {
           : Math.abs(weekno1) <= numWeeks;
       });
 
-      const seenDates = new Set<string>();
+      const seenDates = new DseSet();
       for (const year of yearsToCheck) {
         for (let i = 0; i < 7; ++i) {
           if (weekno1 > 0) {
             const d = year.addDays((weekno1 - 1) * 7 + i);
             if (!bounds.contains(d)) continue;
-            const dateKey = d.toString();
-            if (!seenDates.has(dateKey)) {
-              seenDates.add(dateKey);
-              yield [d, "day"];
-            }
+            if (seenDates.add(d.dse)) yield [d, "day"];
           } else {
             // For negative week numbers, calculate from the end of the year
             const isoYear = year.isoYw1.yr;
@@ -642,11 +753,7 @@ export namespace YearMonthDayFilter {
             const targetWeekFromStart = numWeeks + weekno1 + 1;
             const d = year.addDays((targetWeekFromStart - 1) * 7 + i);
             if (!bounds.contains(d)) continue;
-            const dateKey = d.toString();
-            if (!seenDates.has(dateKey)) {
-              seenDates.add(dateKey);
-              yield [d, "day"];
-            }
+            if (seenDates.add(d.dse)) yield [d, "day"];
           }
         }
       }
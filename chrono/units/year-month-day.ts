@@ -3,6 +3,7 @@ import { GenericRange } from "../range";
 import { Result, erm, ok } from "../result";
 
 import { err } from "../result";
+import { TentoMath } from "../utils";
 import { DateUnit } from "./date-unit";
 import { Month } from "./month";
 import {
@@ -425,23 +426,27 @@ class _YearMonthDay implements Ymd1Like {
     return YearMonthDay.ndsucc(this.castMaybeInValid(), step, recurLimit);
   }
 
-  rangeProps(props: YearMonthDay.FilterProps): Generator<YearMonthDay> {
+  rangeProps(
+    props: YearMonthDay.FilterProps,
+  ): Generator<YearMonthDay, Option<YearMonthDay.Continuation>> {
     return this.range(props.step, props.options);
   }
 
+  /**
+   * Generates the dates matching `filter` in each period of `step` from this
+   * date onwards.
+   *
+   * Ranges with an `end` run until they pass it. Open-ended ranges examine
+   * at most `budget` periods (`DEFAULT_BUDGET` by default, `Infinity` for no
+   * cap); if that runs out before the range finishes, the generator returns
+   * a `Continuation` that can be passed back as `resume` to pick up where it
+   * left off.
+   */
   range(
     step: DateUnit = DateUnit.days(1),
-    options: Option<
-      Optional<{
-        end: YearMonthDay; // inclusive
-        limit: number;
-        recurLimit: number;
-        filter: YearMonthDay.Filter | YearMonthDay.Filter[];
-        weekStart: Weekday;
-      }>
-    > = null,
-  ): Generator<YearMonthDay> {
-    const recurLimit = options?.recurLimit ?? 5_000;
+    options: Option<YearMonthDay.FilterPropsOptions> = null,
+  ): Generator<YearMonthDay, Option<YearMonthDay.Continuation>> {
+    const recurLimit = options?.recurLimit ?? Infinity;
     const start = this.castMaybeInValid();
     const filterr = options?.filter ?? YearMonthDay.Filter.identity();
     const filter = Array.isArray(filterr)
@@ -455,6 +460,13 @@ class _YearMonthDay implements Ymd1Like {
       end: options?.end,
       limit: options?.limit,
       weekStart: options?.weekStart ?? start.dayOfWeek,
+      seek: options?.seek,
+      budget:
+        options?.budget ?? (options?.end ? null : YearMonthDay.DEFAULT_BUDGET),
+      resume: options?.resume,
+      cadence: options?.cadence,
+      track: options?.track,
+      tally: options?.tally,
     });
   }
 
@@ -509,6 +521,15 @@ export namespace YearMonthDay {
     recurLimit: number;
     filter: YearMonthDay.Filter | YearMonthDay.Filter[];
     weekStart: Weekday;
+    seek: YearMonthDay; // inclusive
+    // maximum number of periods to examine
+    budget: number;
+    resume: YearMonthDay.Continuation;
+    cadence: Option<YearMonthDay.Cadence>;
+    // kept at the position after the last date yielded
+    track: YearMonthDay.Continuation;
+    // counts the dates `filter` produces, for seeking under a `limit`
+    tally: YearMonthDay.Tally;
   }>;
 
   export type FilterProps = {
@@ -701,6 +722,212 @@ export namespace YearMonthDay {
     }
   }
 
+  /**
+   * Closed-form equivalent of advancing `curr` by `step` `n` times with
+   * `ndsucc`, ie. the start of the nth period.
+   */
+  export function ndnth(
+    curr: YearMonthDay.MaybeValid,
+    step: DateUnit,
+    n: number,
+  ): YearMonthDay.MaybeValid {
+    if (n === 0) return curr;
+    return curr.addOpt(step.mult(n));
+  }
+
+  /**
+   * Index of the period (as generated by `ndsucc(origin, step)`) that
+   * contains `date`. Negative if `date` is before `origin`.
+   */
+  export function ndindex(
+    origin: YearMonthDay.MaybeValid,
+    step: DateUnit,
+    date: YearMonthDay.MaybeValid,
+  ): number {
+    switch (step.type) {
+      case "year":
+        return TentoMath.floorDiv(date.yr - origin.yr, step.value);
+      case "month":
+        return TentoMath.floorDiv(date.differenceInMonths(origin), step.value);
+      case "week":
+        return TentoMath.floorDiv(date.dse - origin.dse, step.value * 7);
+      case "day":
+        return TentoMath.floorDiv(date.dse - origin.dse, step.value);
+    }
+  }
+
+  export function ndorigin(
+    start: YearMonthDay.MaybeValid,
+    step: DateUnit,
+    weekStart: Weekday,
+  ): YearMonthDay.MaybeValid {
+    if (step.type !== "week") return start;
+    let diff = start.dayOfWeek.dow - weekStart.dow;
+    if (diff < 0) diff += 7;
+    return diff !== 0 ? start.addDays(-diff) : start;
+  }
+
+  export type Seek = {
+    // start of the first period that may contain an occurrence >= target
+    period: YearMonthDay.MaybeValid;
+    // number of periods skipped
+    index: number;
+    // occurrences emitted by the skipped periods, null if not counted
+    used: Option<number>;
+  };
+
+  /**
+   * Finds the first period that can produce an occurrence on or after
+   * `target` without walking the periods before it.
+   *
+   * The period is computed in closed form from `origin` and `step`. We back
+   * off by one period since some filters (eg. BYWEEKNO, BYYEARDAY in weekly
+   * periods) emit dates that spill past their period's end.
+   *
+   * If `countUsed` is set, also returns the number of occurrences the skipped
+   * periods would have emitted so that COUNT can be honoured. This is O(1)
+   * for rules that produce exactly one occurrence per period. Otherwise the
+   * first period is expanded (it may have dates before `start`) and the rest
+   * are counted with `tally`; only filters without one (eg. Google's BYWEEKNO
+   * quirks) expand every skipped period.
+   */
+  export function ndseek({
+    origin,
+    start,
+    step,
+    filter,
+    end,
+    target,
+    countUsed,
+    tally,
+  }: {
+    origin: YearMonthDay.MaybeValid;
+    start: YearMonthDay.MaybeValid;
+    step: DateUnit;
+    filter: YearMonthDay.Filter;
+    end: Option<YearMonthDay>;
+    target: YearMonthDay.MaybeValid;
+    countUsed: boolean;
+    tally?: Option<YearMonthDay.Tally>;
+  }): Seek {
+    const index = Math.max(0, YearMonthDay.ndindex(origin, step, target) - 1);
+    const period = YearMonthDay.ndnth(origin, step, index);
+    if (!countUsed || index === 0) {
+      return { period, index, used: countUsed ? 0 : null };
+    }
+
+    const oneEach =
+      YearMonthDayFilter.isIdentity(filter) &&
+      origin === start &&
+      (step.type === "day" ||
+        step.type === "week" ||
+        (step.type === "month" && start.day <= 28) ||
+        (step.type === "year" && (start.mth !== 2 || start.day <= 28)));
+    if (oneEach) return { period, index, used: index };
+
+    // only the first period can have dates before `start`
+    const expanded = tally ? 1 : index;
+    let used = 0;
+    let curr = origin;
+    for (let i = 0; i < expanded; ++i) {
+      for (const [ndu, _] of filter([curr, step.type])) {
+        const nd = ndu.toResult().asOk();
+        if (!nd) continue;
+        if (nd.cmpInvalid(start) < 0) continue;
+        if (end && nd.cmpInvalid(end) > 0) continue;
+        used += 1;
+      }
+      curr = curr.addOpt(step);
+    }
+    if (tally) used += tally(origin, step, expanded, index);
+    return { period, index, used };
+  }
+
+  /**
+   * Number of dates a filter produces in periods `from` (inclusive) to `to`
+   * (exclusive) of `step` counting from `origin`, without expanding them.
+   */
+  export type Tally = (
+    origin: YearMonthDay.MaybeValid,
+    step: DateUnit,
+    from: number,
+    to: number,
+  ) => number;
+
+  // periods examined by an open-ended `range` before it hands back a
+  // continuation
+  export const DEFAULT_BUDGET = 10_000;
+
+  export type Continuation = {
+    // start of the next period to examine
+    period: YearMonthDay.MaybeValid;
+    // index of that period in the series
+    index: number;
+    // occurrences counted towards the limit so far
+    used: number;
+    // dates of `period` the filter has already produced, 0 if not given
+    offset?: number;
+  };
+
+  /**
+   * The periods of a recurrence that can have occurrences: period `index`
+   * can iff `index % cycle` is in `productive`.
+   */
+  export type Cadence = {
+    cycle: number;
+    // sorted
+    productive: Int32Array;
+  };
+
+  /**
+   * Index of the first period on or after `index` that can have occurrences,
+   * null if there is none.
+   */
+  export function ndproductive(
+    cadence: Cadence,
+    index: number,
+  ): Option<number> {
+    const { cycle, productive } = cadence;
+    if (productive.length === 0) return null;
+    const base = index - TentoMath.mod(index, cycle);
+    for (const offset of productive) {
+      if (base + offset >= index) return base + offset;
+    }
+    return base + cycle + productive[0];
+  }
+
+  /**
+   * Index of the last period on or before `index` that can have occurrences,
+   * null if there is none.
+   */
+  export function ndproductiveBack(
+    cadence: Cadence,
+    index: number,
+  ): Option<number> {
+    const { cycle, productive } = cadence;
+    if (productive.length === 0) return null;
+    const base = index - TentoMath.mod(index, cycle);
+    for (let i = productive.length - 1; i >= 0; --i) {
+      if (base + productive[i] <= index) return base + productive[i];
+    }
+    return base - cycle + productive[productive.length - 1];
+  }
+
+  /**
+   * Generates the dates of a recurrence, period by period.
+   *
+   * Stops once `limit` dates have been counted, `recurLimit` dates have been
+   * yielded, or the periods have moved past `end`. Otherwise it is unbounded
+   * unless a `budget` of periods is given, in which case it returns the
+   * `Continuation` to resume from after examining that many periods.
+   *
+   * With a `cadence`, periods that can't have occurrences are jumped over
+   * and don't count towards the budget.
+   *
+   * A `track`ed continuation is updated before each date is yielded, so that
+   * resuming from a copy of it (including its `offset` into the period)
+   * carries on right after that date.
+   */
   export function* ndrange({
     start,
     step,
@@ -709,6 +936,12 @@ export namespace YearMonthDay {
     end,
     limit,
     weekStart,
+    seek,
+    budget,
+    resume,
+    cadence,
+    track,
+    tally,
   }: {
     start: YearMonthDay.MaybeValid;
     step: DateUnit;
@@ -717,29 +950,145 @@ export namespace YearMonthDay {
     end: Option<YearMonthDay>;
     limit: Option<number>;
     weekStart: Weekday;
-  }) {
+    seek?: Option<YearMonthDay.MaybeValid>;
+    budget?: Option<number>;
+    resume?: Option<YearMonthDay.Continuation>;
+    cadence?: Option<YearMonthDay.Cadence>;
+    track?: Option<YearMonthDay.Continuation>;
+    tally?: Option<YearMonthDay.Tally>;
+  }): Generator<YearMonthDay, Option<YearMonthDay.Continuation>> {
     let recurCnt = 0;
     let cnt = 0;
-
-    let iterStart = start;
-    if (step.type === "week") {
-      let diff = start.dayOfWeek.dow - weekStart.dow;
-      if (diff < 0) diff += 7;
-      if (diff !== 0) iterStart = start.addDays(-diff);
+    let index = 0;
+    // dates of the resumed period that were produced before
+    let skip = 0;
+
+    const origin = YearMonthDay.ndorigin(start, step, weekStart);
+    let iterStart = origin;
+    if (!seek || seek.cmpInvalid(start) <= 0) seek = null;
+    if (resume) {
+      iterStart = resume.period;
+      index = resume.index;
+      cnt = resume.used;
+      skip = resume.offset ?? 0;
+    } else if (seek) {
+      const found = YearMonthDay.ndseek({
+        origin: iterStart,
+        start,
+        step,
+        filter,
+        end,
+        target: seek,
+        countUsed: !!limit,
+        tally,
+      });
+      iterStart = found.period;
+      index = found.index;
+      cnt = found.used ?? 0;
     }
+    if (limit && cnt >= limit) return null;
+
+    let i = iterStart;
+    let pastEnd = false;
+    for (let examined = 0; ; ++examined) {
+      if (cadence) {
+        const next = YearMonthDay.ndproductive(cadence, index);
+        if (next == null) return null;
+        if (next !== index) {
+          index = next;
+          i = YearMonthDay.ndnth(origin, step, index);
+        }
+      }
+      if (end && i.cmpInvalid(end) > 0) {
+        // a period starting past the end may still spill dates into it (eg.
+        // ISO week 1 starting in late December), but the next one can't
+        if (pastEnd) return null;
+        pastEnd = true;
+      }
+      if (budget != null && examined >= budget) {
+        return { period: i, index, used: cnt };
+      }
 
-    for (const i of YearMonthDay.ndsucc(iterStart, step, recurLimit)) {
+      let produced = 0;
       for (const [ndu, _] of filter([i, step.type])) {
+        if (produced++ < skip) continue;
         const nd = ndu.toResult().asOk();
         if (!nd) continue;
         if (nd.cmpInvalid(start) < 0) continue;
         if (end && nd.cmpInvalid(end) > 0) continue;
+        if (seek && nd.cmpInvalid(seek) < 0) {
+          // occurrences before the seek target still count towards COUNT
+          cnt += 1;
+          if (limit && cnt >= limit) return null;
+          continue;
+        }
+        if (track) {
+          track.period = i;
+          track.index = index;
+          track.used = cnt + 1;
+          track.offset = produced;
+        }
         yield nd;
         cnt += 1;
         recurCnt += 1;
-        if (limit && cnt >= limit) return;
-        if (recurCnt >= recurLimit) return;
+        if (limit && cnt >= limit) return null;
+        if (recurCnt >= recurLimit) return null;
+      }
+
+      skip = 0;
+      i = i.addOpt(step);
+      ++index;
+    }
+  }
+
+  /**
+   * Generates the dates of a recurrence on or before `anchor`, latest first.
+   *
+   * The mirror image of `ndrange`: periods are walked back from the one
+   * containing `anchor` (or `end`, if earlier) down to the first. `limit`
+   * can't be applied from this end, so callers bound `anchor` instead.
+   */
+  export function* ndrangeReverse({
+    start,
+    step,
+    filter,
+    end,
+    weekStart,
+    anchor,
+    cadence,
+  }: {
+    start: YearMonthDay.MaybeValid;
+    step: DateUnit;
+    filter: YearMonthDay.Filter;
+    end: Option<YearMonthDay>;
+    weekStart: Weekday;
+    anchor: YearMonthDay.MaybeValid;
+    cadence?: Option<YearMonthDay.Cadence>;
+  }): Generator<YearMonthDay> {
+    const last = end && end.cmpInvalid(anchor) < 0 ? end : anchor;
+    if (last.cmpInvalid(start) < 0) return;
+
+    const origin = YearMonthDay.ndorigin(start, step, weekStart);
+    // start one period later, some filters spill dates into the previous one
+    let index = YearMonthDay.ndindex(origin, step, last) + 1;
+    for (; index >= 0; --index) {
+      if (cadence) {
+        const prev = YearMonthDay.ndproductiveBack(cadence, index);
+        if (prev == null || prev < 0) return;
+        index = prev;
+      }
+
+      const period = YearMonthDay.ndnth(origin, step, index);
+      const dates: YearMonthDay[] = [];
+      for (const [ndu, _] of filter([period, step.type])) {
+        const nd = ndu.toResult().asOk();
+        if (!nd) continue;
+        if (nd.cmpInvalid(start) < 0) continue;
+        if (nd.cmpInvalid(last) > 0) continue;
+        dates.push(nd);
       }
+      dates.sort((a, b) => b.dse - a.dse);
+      yield* dates;
     }
   }
 
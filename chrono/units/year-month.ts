@@ -6,9 +6,11 @@ import {
   DayOfMonth0,
   DayOfMonth1,
   DayOfYear0,
+  DaysSinceEpoch,
   Month1,
   MonthOfYear,
 } from "./units";
+import { Weekday } from "./weekday";
 import { Year } from "./year";
 import { YearMonthDay } from "./year-month-day";
 
@@ -115,6 +117,18 @@ export namespace YearMonth {
     return Month.DAYS_IN_MONTH[Year.isLeapYear(yr) ? 1 : 0][mth - 1];
   }
 
+  export const NUM_SHAPES = 28;
+
+  /**
+   * Months with the same shape (weekday of the 1st, length) have identical
+   * calendars. Returns 0..<28.
+   */
+  export function shape(ym1: Ym1Like): number {
+    const dse = Year.dseFromYear(ym1.yr) + doyForMonthStart(ym1);
+    const dow0 = (Weekday.fromDse(dse as DaysSinceEpoch) + 6) % 7;
+    return dow0 * 4 + daysInMonth(ym1) - 28;
+  }
+
   export function dom({ yr, mth }: Ym1Like): Generator<DayOfMonth0> {
     const leapYearIdx = Year.isLeapYear(yr) ? 1 : 0;
     const monthNumDays = Month.DAYS_IN_MONTH[leapYearIdx][mth - 1];
@@ -21,6 +21,17 @@ export namespace Year {
     return Year.isLeapYear(year) ? 366 : 365;
   }
 
+  export const NUM_SHAPES = 14;
+
+  /**
+   * Years with the same shape (weekday of Jan 1, leap or not) have identical
+   * calendars. Returns 0..<14.
+   */
+  export function shape(year: number): number {
+    const dow0 = (Weekday.fromDse(dseFromYear(year)) + 6) % 7;
+    return dow0 * 2 + (isLeapYear(year) ? 1 : 0);
+  }
+
   export function doy(year: number): Generator<DayOfYear0> {
     return range(Year.length(year)) as Generator<DayOfYear0>;
   }
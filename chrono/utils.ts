@@ -13,6 +13,13 @@ export namespace TentoMath {
     return (mod - (-n % mod)) % mod;
   }
 
+  export function gcd(a: number, b: number): number {
+    a = Math.abs(a);
+    b = Math.abs(b);
+    while (b !== 0) [a, b] = [b, a % b];
+    return a;
+  }
+
   export function numberOrNull(n: Option<number>): Option<number> {
     if (n == null || n === undefined) return null;
     if (Number.isNaN(n)) return null;
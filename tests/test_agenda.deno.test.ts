@@ -0,0 +1,78 @@
+import { assertEquals } from "@std/assert";
+import { DateTime } from "../chrono/datetime.ts";
+import { naivedate } from "../chrono/mod.ts";
+import { Agenda } from "../chrono/recurrence/agenda.ts";
+import { Recurrence } from "../chrono/recurrence/recurrence.ts";
+import { installTimezoneLoader } from "./utils.deno.ts";
+
+installTimezoneLoader();
+
+async function recurrences(): Promise<Recurrence[]> {
+  const series = [
+    ["DTSTART:20240101T090000Z", "RRULE:FREQ=DAILY;INTERVAL=3"],
+    [
+      "DTSTART;TZID=America/New_York:20240105T083000",
+      "RRULE:FREQ=WEEKLY;BYDAY=MO,FR",
+    ],
+    ["DTSTART:20240115T070000Z", "RRULE:FREQ=MONTHLY;COUNT=4"],
+    ["DTSTART:20240102T090000Z", "RRULE:FREQ=DAILY;COUNT=2"],
+  ];
+  return await Promise.all(
+    series.map(async (lines) => (await Recurrence.parse(lines)).exp()),
+  );
+}
+
+Deno.test({
+  name: "agenda/merges_in_time_order",
+  async fn() {
+    const series = await recurrences();
+    const from = naivedate(2024, 1, 10);
+    const end = naivedate(2024, 6, 1);
+
+    const expected: [number, number][] = [];
+    series.forEach((recurrence, index) => {
+      for (const mse of recurrence.instants(from)) {
+        if (mse >= end.dse * 86_400_000) break;
+        expected.push([mse, index]);
+      }
+    });
+    expected.sort((a, b) => a[0] - b[0] || a[1] - b[1]);
+
+    const agenda = new Agenda(series, from);
+    const first = agenda.take(20);
+    const rest = agenda.take(expected.length - 20);
+    assertEquals(
+      [...first, ...rest].map((entry) => [entry.mse, entry.index]),
+      expected,
+    );
+    assertEquals(first[0].source, series[0]);
+  },
+});
+
+Deno.test({
+  name: "agenda/google_generators_and_exhaustion",
+  async fn() {
+    const [daily, , , twice] = await recurrences();
+    const google = await twice.generateGoogleEvents(
+      DateTime.fromRfc3339("2024-01-02T09:00:00Z").exp(),
+      null,
+    );
+
+    const agenda = new Agenda([google, daily]);
+    assertEquals(
+      agenda.take(4).map((entry) => new Date(entry.mse).toISOString()),
+      [
+        "2024-01-01T09:00:00.000Z",
+        "2024-01-02T09:00:00.000Z",
+        "2024-01-03T09:00:00.000Z",
+        "2024-01-04T09:00:00.000Z",
+      ],
+    );
+
+    // A finite series runs dry
+    const finite = new Agenda([twice]);
+    assertEquals(finite.take(5).length, 2);
+    assertEquals(finite.next(), null);
+    assertEquals(finite.isEmpty, true);
+  },
+});
@@ -1,175 +1,196 @@
-// TODO: no easter
-// testRecurring(
-//   'testYearlyByEaster',
-//   new RRule({ count: 3, byeaster: 0, dtstart: parse('19970902T090000') }),
-//   [
-//     datetime(1998, 4, 12, 9, 0),
-//     datetime(1999, 4, 4, 9, 0),
-//     datetime(2000, 4, 23, 9, 0),
-//   ]
-// )
+import { assertEquals } from "@std/assert";
+import { Easter } from "../chrono/units/easter.ts";
+import { Recurrence } from "../chrono/recurrence/recurrence.ts";
+import { installTimezoneLoader } from "./utils.deno.ts";
 
-// testRecurring(
-//   'testYearlyByEasterPos',
-//   new RRule({
-//     freq: RRule.YEARLY,
-//     count: 3,
-//     byeaster: 1,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 4, 13, 9, 0),
-//     datetime(1999, 4, 5, 9, 0),
-//     datetime(2000, 4, 24, 9, 0),
-//   ]
-// )
+installTimezoneLoader();
 
-// testRecurring(
-//   'testYearlyByEasterNeg',
-//   new RRule({
-//     freq: RRule.YEARLY,
-//     count: 3,
-//     byeaster: -1,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 4, 11, 9, 0),
-//     datetime(1999, 4, 3, 9, 0),
-//     datetime(2000, 4, 22, 9, 0),
-//   ]
-// )
+// Ported from rrule.js, which has times of day in UTC
+async function assertRecurring(lines: string[], expected: string[]) {
+  const recurrence = (await Recurrence.parse(lines)).exp();
+  assertEquals(
+    Array.from(recurrence.instants(), (mse) => new Date(mse).toISOString()),
+    expected,
+  );
+}
 
-// testRecurring(
-//   'testMonthlyByEaster',
-//   new RRule({
-//     freq: RRule.MONTHLY,
-//     count: 3,
-//     byeaster: 0,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 4, 12, 9, 0),
-//     datetime(1999, 4, 4, 9, 0),
-//     datetime(2000, 4, 23, 9, 0),
-//   ]
-// )
+Deno.test({
+  name: "easter/table_matches_computus",
+  fn() {
+    for (let yr = Easter.FIRST_YEAR; yr <= Easter.LAST_YEAR; ++yr) {
+      assertEquals(Easter.dse(yr), Easter.computus(yr), `${yr}`);
+    }
+    // 1998-04-12, 2285-03-22 (the earliest possible) and 2400-04-16
+    assertEquals(Easter.dse(1998), 10328);
+    assertEquals(Easter.dse(2285), 115132);
+    assertEquals(Easter.dse(2400), 157160);
+  },
+});
 
-// testRecurring(
-//   'testMonthlyByEasterPos',
-//   new RRule({
-//     freq: RRule.MONTHLY,
-//     count: 3,
-//     byeaster: 1,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 4, 13, 9, 0),
-//     datetime(1999, 4, 5, 9, 0),
-//     datetime(2000, 4, 24, 9, 0),
-//   ]
-// )
+Deno.test({
+  name: "easter/testYearlyByEaster",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=YEARLY;COUNT=3;BYEASTER=0"],
+      [
+        "1998-04-12T09:00:00.000Z",
+        "1999-04-04T09:00:00.000Z",
+        "2000-04-23T09:00:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testMonthlyByEasterNeg',
-//   new RRule({
-//     freq: RRule.MONTHLY,
-//     count: 3,
-//     byeaster: -1,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 4, 11, 9, 0),
-//     datetime(1999, 4, 3, 9, 0),
-//     datetime(2000, 4, 22, 9, 0),
-//   ]
-// )
+Deno.test({
+  name: "easter/testYearlyByEasterPos",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=YEARLY;COUNT=3;BYEASTER=1"],
+      [
+        "1998-04-13T09:00:00.000Z",
+        "1999-04-05T09:00:00.000Z",
+        "2000-04-24T09:00:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testWeeklyByEaster',
-//   new RRule({
-//     freq: RRule.WEEKLY,
-//     count: 3,
-//     byeaster: 0,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 4, 12, 9, 0),
-//     datetime(1999, 4, 4, 9, 0),
-//     datetime(2000, 4, 23, 9, 0),
-//   ]
-// )
+Deno.test({
+  name: "easter/testYearlyByEasterNeg",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=YEARLY;COUNT=3;BYEASTER=-1"],
+      [
+        "1998-04-11T09:00:00.000Z",
+        "1999-04-03T09:00:00.000Z",
+        "2000-04-22T09:00:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testWeeklyByEasterPos',
-//   new RRule({
-//     freq: RRule.WEEKLY,
-//     count: 3,
-//     byeaster: 1,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 4, 13, 9, 0),
-//     datetime(1999, 4, 5, 9, 0),
-//     datetime(2000, 4, 24, 9, 0),
-//   ]
-// )
+Deno.test({
+  name: "easter/testMonthlyByEaster",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=MONTHLY;COUNT=3;BYEASTER=0"],
+      [
+        "1998-04-12T09:00:00.000Z",
+        "1999-04-04T09:00:00.000Z",
+        "2000-04-23T09:00:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testWeeklyByEasterNeg',
-//   new RRule({
-//     freq: RRule.WEEKLY,
-//     count: 3,
-//     byeaster: -1,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 4, 11, 9, 0),
-//     datetime(1999, 4, 3, 9, 0),
-//     datetime(2000, 4, 22, 9, 0),
-//   ]
-// )
+Deno.test({
+  name: "easter/testMonthlyByEasterPos",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=MONTHLY;COUNT=3;BYEASTER=1"],
+      [
+        "1998-04-13T09:00:00.000Z",
+        "1999-04-05T09:00:00.000Z",
+        "2000-04-24T09:00:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testDailyByEaster',
-//   new RRule({
-//     freq: RRule.DAILY,
-//     count: 3,
-//     byeaster: 0,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 4, 12, 9, 0),
-//     datetime(1999, 4, 4, 9, 0),
-//     datetime(2000, 4, 23, 9, 0),
-//   ]
-// )
+Deno.test({
+  name: "easter/testMonthlyByEasterNeg",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=MONTHLY;COUNT=3;BYEASTER=-1"],
+      [
+        "1998-04-11T09:00:00.000Z",
+        "1999-04-03T09:00:00.000Z",
+        "2000-04-22T09:00:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testDailyByEasterPos',
-//   new RRule({
-//     freq: RRule.DAILY,
-//     count: 3,
-//     byeaster: 1,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 4, 13, 9, 0),
-//     datetime(1999, 4, 5, 9, 0),
-//     datetime(2000, 4, 24, 9, 0),
-//   ]
-// )
+Deno.test({
+  name: "easter/testWeeklyByEaster",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=WEEKLY;COUNT=3;BYEASTER=0"],
+      [
+        "1998-04-12T09:00:00.000Z",
+        "1999-04-04T09:00:00.000Z",
+        "2000-04-23T09:00:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testDailyByEasterNeg',
-//   new RRule({
-//     freq: RRule.DAILY,
-//     count: 3,
-//     byeaster: -1,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 4, 11, 9, 0),
-//     datetime(1999, 4, 3, 9, 0),
-//     datetime(2000, 4, 22, 9, 0),
-//   ]
-// )
+Deno.test({
+  name: "easter/testWeeklyByEasterPos",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=WEEKLY;COUNT=3;BYEASTER=1"],
+      [
+        "1998-04-13T09:00:00.000Z",
+        "1999-04-05T09:00:00.000Z",
+        "2000-04-24T09:00:00.000Z",
+      ],
+    );
+  },
+});
+
+Deno.test({
+  name: "easter/testWeeklyByEasterNeg",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=WEEKLY;COUNT=3;BYEASTER=-1"],
+      [
+        "1998-04-11T09:00:00.000Z",
+        "1999-04-03T09:00:00.000Z",
+        "2000-04-22T09:00:00.000Z",
+      ],
+    );
+  },
+});
+
+Deno.test({
+  name: "easter/testDailyByEaster",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=DAILY;COUNT=3;BYEASTER=0"],
+      [
+        "1998-04-12T09:00:00.000Z",
+        "1999-04-04T09:00:00.000Z",
+        "2000-04-23T09:00:00.000Z",
+      ],
+    );
+  },
+});
+
+Deno.test({
+  name: "easter/testDailyByEasterPos",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=DAILY;COUNT=3;BYEASTER=1"],
+      [
+        "1998-04-13T09:00:00.000Z",
+        "1999-04-05T09:00:00.000Z",
+        "2000-04-24T09:00:00.000Z",
+      ],
+    );
+  },
+});
+
+Deno.test({
+  name: "easter/testDailyByEasterNeg",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=DAILY;COUNT=3;BYEASTER=-1"],
+      [
+        "1998-04-11T09:00:00.000Z",
+        "1999-04-03T09:00:00.000Z",
+        "2000-04-22T09:00:00.000Z",
+      ],
+    );
+  },
+});
@@ -1,1939 +1,1990 @@
-import { assert } from "@std/assert";
+import { assertEquals } from "@std/assert";
+import { Recurrence } from "../chrono/recurrence/recurrence.ts";
+import { installTimezoneLoader } from "./utils.deno.ts";
+
+installTimezoneLoader();
+
+// Ported from rrule.js, which has times of day in UTC
+async function assertRecurring(lines: string[], expected: string[]) {
+  const recurrence = (await Recurrence.parse(lines)).exp();
+  assertEquals(
+    Array.from(recurrence.instants(), (mse) => new Date(mse).toISOString()),
+    expected,
+  );
+}
 
 Deno.test({
-  name: "generator-hms",
-  fn() {
-    assert(false, "generator-hms, not yet implemented");
+  name: "generator-hms/testYearlyByHour",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=YEARLY;COUNT=3;BYHOUR=6,18"],
+      [
+        "1997-09-02T18:00:00.000Z",
+        "1998-09-02T06:00:00.000Z",
+        "1998-09-02T18:00:00.000Z",
+      ],
+    );
   },
 });
 
-// testRecurring(
-//   'testYearlyByHour',
-//   new RRule({
-//     freq: RRule.YEARLY,
-//     count: 3,
-//     byhour: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 18, 0),
-//     datetime(1998, 9, 2, 6, 0),
-//     datetime(1998, 9, 2, 18, 0),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testYearlyByMinute",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=YEARLY;COUNT=3;BYMINUTE=6,18"],
+      [
+        "1997-09-02T09:06:00.000Z",
+        "1997-09-02T09:18:00.000Z",
+        "1998-09-02T09:06:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testYearlyByMinute',
-//   new RRule({
-//     freq: RRule.YEARLY,
-//     count: 3,
-//     byminute: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 9, 6),
-//     datetime(1997, 9, 2, 9, 18),
-//     datetime(1998, 9, 2, 9, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testYearlyBySecond",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=YEARLY;COUNT=3;BYSECOND=6,18"],
+      [
+        "1997-09-02T09:00:06.000Z",
+        "1997-09-02T09:00:18.000Z",
+        "1998-09-02T09:00:06.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testYearlyBySecond',
-//   new RRule({
-//     freq: RRule.YEARLY,
-//     count: 3,
-//     bysecond: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 9, 0, 6),
-//     datetime(1997, 9, 2, 9, 0, 18),
-//     datetime(1998, 9, 2, 9, 0, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testYearlyByHourAndMinute",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=YEARLY;COUNT=3;BYHOUR=6,18;BYMINUTE=6,18",
+      ],
+      [
+        "1997-09-02T18:06:00.000Z",
+        "1997-09-02T18:18:00.000Z",
+        "1998-09-02T06:06:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testYearlyByHourAndMinute',
-//   new RRule({
-//     freq: RRule.YEARLY,
-//     count: 3,
-//     byhour: [6, 18],
-//     byminute: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 18, 6),
-//     datetime(1997, 9, 2, 18, 18),
-//     datetime(1998, 9, 2, 6, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testYearlyByHourAndSecond",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=YEARLY;COUNT=3;BYHOUR=6,18;BYSECOND=6,18",
+      ],
+      [
+        "1997-09-02T18:00:06.000Z",
+        "1997-09-02T18:00:18.000Z",
+        "1998-09-02T06:00:06.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testYearlyByHourAndSecond',
-//   new RRule({
-//     freq: RRule.YEARLY,
-//     count: 3,
-//     byhour: [6, 18],
-//     bysecond: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 18, 0, 6),
-//     datetime(1997, 9, 2, 18, 0, 18),
-//     datetime(1998, 9, 2, 6, 0, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testYearlyByMinuteAndSecond",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=YEARLY;COUNT=3;BYMINUTE=6,18;BYSECOND=6,18",
+      ],
+      [
+        "1997-09-02T09:06:06.000Z",
+        "1997-09-02T09:06:18.000Z",
+        "1997-09-02T09:18:06.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testYearlyByMinuteAndSecond',
-//   new RRule({
-//     freq: RRule.YEARLY,
-//     count: 3,
-//     byminute: [6, 18],
-//     bysecond: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 9, 6, 6),
-//     datetime(1997, 9, 2, 9, 6, 18),
-//     datetime(1997, 9, 2, 9, 18, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testYearlyByHourAndMinuteAndSecond",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=YEARLY;COUNT=3;BYHOUR=6,18;BYMINUTE=6,18;BYSECOND=6,18",
+      ],
+      [
+        "1997-09-02T18:06:06.000Z",
+        "1997-09-02T18:06:18.000Z",
+        "1997-09-02T18:18:06.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testYearlyByHourAndMinuteAndSecond',
-//   new RRule({
-//     freq: RRule.YEARLY,
-//     count: 3,
-//     byhour: [6, 18],
-//     byminute: [6, 18],
-//     bysecond: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 18, 6, 6),
-//     datetime(1997, 9, 2, 18, 6, 18),
-//     datetime(1997, 9, 2, 18, 18, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMonthlyByHour",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=MONTHLY;COUNT=3;BYHOUR=6,18"],
+      [
+        "1997-09-02T18:00:00.000Z",
+        "1997-10-02T06:00:00.000Z",
+        "1997-10-02T18:00:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testMonthlyByHour',
-//   new RRule({
-//     freq: RRule.MONTHLY,
-//     count: 3,
-//     byhour: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 18, 0),
-//     datetime(1997, 10, 2, 6, 0),
-//     datetime(1997, 10, 2, 18, 0),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMonthlyByMinute",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=MONTHLY;COUNT=3;BYMINUTE=6,18"],
+      [
+        "1997-09-02T09:06:00.000Z",
+        "1997-09-02T09:18:00.000Z",
+        "1997-10-02T09:06:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testMonthlyByMinute',
-//   new RRule({
-//     freq: RRule.MONTHLY,
-//     count: 3,
-//     byminute: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 9, 6),
-//     datetime(1997, 9, 2, 9, 18),
-//     datetime(1997, 10, 2, 9, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMonthlyBySecond",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=MONTHLY;COUNT=3;BYSECOND=6,18"],
+      [
+        "1997-09-02T09:00:06.000Z",
+        "1997-09-02T09:00:18.000Z",
+        "1997-10-02T09:00:06.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testMonthlyBySecond',
-//   new RRule({
-//     freq: RRule.MONTHLY,
-//     count: 3,
-//     bysecond: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 9, 0, 6),
-//     datetime(1997, 9, 2, 9, 0, 18),
-//     datetime(1997, 10, 2, 9, 0, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMonthlyByHourAndMinute",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=MONTHLY;COUNT=3;BYHOUR=6,18;BYMINUTE=6,18",
+      ],
+      [
+        "1997-09-02T18:06:00.000Z",
+        "1997-09-02T18:18:00.000Z",
+        "1997-10-02T06:06:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testMonthlyByHourAndMinute',
-//   new RRule({
-//     freq: RRule.MONTHLY,
-//     count: 3,
-//     byhour: [6, 18],
-//     byminute: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 18, 6),
-//     datetime(1997, 9, 2, 18, 18),
-//     datetime(1997, 10, 2, 6, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMonthlyByHourAndSecond",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=MONTHLY;COUNT=3;BYHOUR=6,18;BYSECOND=6,18",
+      ],
+      [
+        "1997-09-02T18:00:06.000Z",
+        "1997-09-02T18:00:18.000Z",
+        "1997-10-02T06:00:06.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testMonthlyByHourAndSecond',
-//   new RRule({
-//     freq: RRule.MONTHLY,
-//     count: 3,
-//     byhour: [6, 18],
-//     bysecond: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 18, 0, 6),
-//     datetime(1997, 9, 2, 18, 0, 18),
-//     datetime(1997, 10, 2, 6, 0, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMonthlyByMinuteAndSecond",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=MONTHLY;COUNT=3;BYMINUTE=6,18;BYSECOND=6,18",
+      ],
+      [
+        "1997-09-02T09:06:06.000Z",
+        "1997-09-02T09:06:18.000Z",
+        "1997-09-02T09:18:06.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testMonthlyByMinuteAndSecond',
-//   new RRule({
-//     freq: RRule.MONTHLY,
-//     count: 3,
-//     byminute: [6, 18],
-//     bysecond: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 9, 6, 6),
-//     datetime(1997, 9, 2, 9, 6, 18),
-//     datetime(1997, 9, 2, 9, 18, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMonthlyByHourAndMinuteAndSecond",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=MONTHLY;COUNT=3;BYHOUR=6,18;BYMINUTE=6,18;BYSECOND=6,18",
+      ],
+      [
+        "1997-09-02T18:06:06.000Z",
+        "1997-09-02T18:06:18.000Z",
+        "1997-09-02T18:18:06.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testMonthlyByHourAndMinuteAndSecond',
-//   new RRule({
-//     freq: RRule.MONTHLY,
-//     count: 3,
-//     byhour: [6, 18],
-//     byminute: [6, 18],
-//     bysecond: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 18, 6, 6),
-//     datetime(1997, 9, 2, 18, 6, 18),
-//     datetime(1997, 9, 2, 18, 18, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testWeeklyByHour",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=WEEKLY;COUNT=3;BYHOUR=6,18"],
+      [
+        "1997-09-02T18:00:00.000Z",
+        "1997-09-09T06:00:00.000Z",
+        "1997-09-09T18:00:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testWeeklyByHour',
-//   new RRule({
-//     freq: RRule.WEEKLY,
-//     count: 3,
-//     byhour: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 18, 0),
-//     datetime(1997, 9, 9, 6, 0),
-//     datetime(1997, 9, 9, 18, 0),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testWeeklyByMinute",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=WEEKLY;COUNT=3;BYMINUTE=6,18"],
+      [
+        "1997-09-02T09:06:00.000Z",
+        "1997-09-02T09:18:00.000Z",
+        "1997-09-09T09:06:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testWeeklyByMinute',
-//   new RRule({
-//     freq: RRule.WEEKLY,
-//     count: 3,
-//     byminute: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 9, 6),
-//     datetime(1997, 9, 2, 9, 18),
-//     datetime(1997, 9, 9, 9, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testWeeklyBySecond",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=WEEKLY;COUNT=3;BYSECOND=6,18"],
+      [
+        "1997-09-02T09:00:06.000Z",
+        "1997-09-02T09:00:18.000Z",
+        "1997-09-09T09:00:06.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testWeeklyBySecond',
-//   new RRule({
-//     freq: RRule.WEEKLY,
-//     count: 3,
-//     bysecond: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 9, 0, 6),
-//     datetime(1997, 9, 2, 9, 0, 18),
-//     datetime(1997, 9, 9, 9, 0, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testWeeklyByHourAndMinute",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=WEEKLY;COUNT=3;BYHOUR=6,18;BYMINUTE=6,18",
+      ],
+      [
+        "1997-09-02T18:06:00.000Z",
+        "1997-09-02T18:18:00.000Z",
+        "1997-09-09T06:06:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testWeeklyByHourAndMinute',
-//   new RRule({
-//     freq: RRule.WEEKLY,
-//     count: 3,
-//     byhour: [6, 18],
-//     byminute: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 18, 6),
-//     datetime(1997, 9, 2, 18, 18),
-//     datetime(1997, 9, 9, 6, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testWeeklyByHourAndSecond",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=WEEKLY;COUNT=3;BYHOUR=6,18;BYSECOND=6,18",
+      ],
+      [
+        "1997-09-02T18:00:06.000Z",
+        "1997-09-02T18:00:18.000Z",
+        "1997-09-09T06:00:06.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testWeeklyByHourAndSecond',
-//   new RRule({
-//     freq: RRule.WEEKLY,
-//     count: 3,
-//     byhour: [6, 18],
-//     bysecond: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 18, 0, 6),
-//     datetime(1997, 9, 2, 18, 0, 18),
-//     datetime(1997, 9, 9, 6, 0, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testWeeklyByMinuteAndSecond",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=WEEKLY;COUNT=3;BYMINUTE=6,18;BYSECOND=6,18",
+      ],
+      [
+        "1997-09-02T09:06:06.000Z",
+        "1997-09-02T09:06:18.000Z",
+        "1997-09-02T09:18:06.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testWeeklyByMinuteAndSecond',
-//   new RRule({
-//     freq: RRule.WEEKLY,
-//     count: 3,
-//     byminute: [6, 18],
-//     bysecond: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 9, 6, 6),
-//     datetime(1997, 9, 2, 9, 6, 18),
-//     datetime(1997, 9, 2, 9, 18, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testWeeklyByHourAndMinuteAndSecond",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=WEEKLY;COUNT=3;BYHOUR=6,18;BYMINUTE=6,18;BYSECOND=6,18",
+      ],
+      [
+        "1997-09-02T18:06:06.000Z",
+        "1997-09-02T18:06:18.000Z",
+        "1997-09-02T18:18:06.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testWeeklyByHourAndMinuteAndSecond',
-//   new RRule({
-//     freq: RRule.WEEKLY,
-//     count: 3,
-//     byhour: [6, 18],
-//     byminute: [6, 18],
-//     bysecond: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 18, 6, 6),
-//     datetime(1997, 9, 2, 18, 6, 18),
-//     datetime(1997, 9, 2, 18, 18, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testDailyByHour",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=DAILY;COUNT=3;BYHOUR=6,18"],
+      [
+        "1997-09-02T18:00:00.000Z",
+        "1997-09-03T06:00:00.000Z",
+        "1997-09-03T18:00:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testDailyByHour',
-//   new RRule({
-//     freq: RRule.DAILY,
-//     count: 3,
-//     byhour: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 18, 0),
-//     datetime(1997, 9, 3, 6, 0),
-//     datetime(1997, 9, 3, 18, 0),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testDailyByMinute",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=DAILY;COUNT=3;BYMINUTE=6,18"],
+      [
+        "1997-09-02T09:06:00.000Z",
+        "1997-09-02T09:18:00.000Z",
+        "1997-09-03T09:06:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testDailyByMinute',
-//   new RRule({
-//     freq: RRule.DAILY,
-//     count: 3,
-//     byminute: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 9, 6),
-//     datetime(1997, 9, 2, 9, 18),
-//     datetime(1997, 9, 3, 9, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testDailyBySecond",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=DAILY;COUNT=3;BYSECOND=6,18"],
+      [
+        "1997-09-02T09:00:06.000Z",
+        "1997-09-02T09:00:18.000Z",
+        "1997-09-03T09:00:06.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testDailyBySecond',
-//   new RRule({
-//     freq: RRule.DAILY,
-//     count: 3,
-//     bysecond: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 9, 0, 6),
-//     datetime(1997, 9, 2, 9, 0, 18),
-//     datetime(1997, 9, 3, 9, 0, 6),
-//   ]
-// )
-
-// testRecurring(
-//   'testDailyByHourAndMinute',
-//   new RRule({
-//     freq: RRule.DAILY,
-//     count: 3,
-//     byhour: [6, 18],
-//     byminute: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 18, 6),
-//     datetime(1997, 9, 2, 18, 18),
-//     datetime(1997, 9, 3, 6, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testDailyByHourAndMinute",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=DAILY;COUNT=3;BYHOUR=6,18;BYMINUTE=6,18",
+      ],
+      [
+        "1997-09-02T18:06:00.000Z",
+        "1997-09-02T18:18:00.000Z",
+        "1997-09-03T06:06:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testDailyByHourAndSecond',
-//   new RRule({
-//     freq: RRule.DAILY,
-//     count: 3,
-//     byhour: [6, 18],
-//     bysecond: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 18, 0, 6),
-//     datetime(1997, 9, 2, 18, 0, 18),
-//     datetime(1997, 9, 3, 6, 0, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testDailyByHourAndSecond",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=DAILY;COUNT=3;BYHOUR=6,18;BYSECOND=6,18",
+      ],
+      [
+        "1997-09-02T18:00:06.000Z",
+        "1997-09-02T18:00:18.000Z",
+        "1997-09-03T06:00:06.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testDailyByMinuteAndSecond',
-//   new RRule({
-//     freq: RRule.DAILY,
-//     count: 3,
-//     byminute: [6, 18],
-//     bysecond: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 9, 6, 6),
-//     datetime(1997, 9, 2, 9, 6, 18),
-//     datetime(1997, 9, 2, 9, 18, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testDailyByMinuteAndSecond",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=DAILY;COUNT=3;BYMINUTE=6,18;BYSECOND=6,18",
+      ],
+      [
+        "1997-09-02T09:06:06.000Z",
+        "1997-09-02T09:06:18.000Z",
+        "1997-09-02T09:18:06.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testDailyByHourAndMinuteAndSecond',
-//   new RRule({
-//     freq: RRule.DAILY,
-//     count: 3,
-//     byhour: [6, 18],
-//     byminute: [6, 18],
-//     bysecond: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 18, 6, 6),
-//     datetime(1997, 9, 2, 18, 6, 18),
-//     datetime(1997, 9, 2, 18, 18, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testDailyByHourAndMinuteAndSecond",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=DAILY;COUNT=3;BYHOUR=6,18;BYMINUTE=6,18;BYSECOND=6,18",
+      ],
+      [
+        "1997-09-02T18:06:06.000Z",
+        "1997-09-02T18:06:18.000Z",
+        "1997-09-02T18:18:06.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testHourly',
-//   new RRule({
-//     freq: RRule.HOURLY,
-//     count: 3,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 9, 0),
-//     datetime(1997, 9, 2, 10, 0),
-//     datetime(1997, 9, 2, 11, 0),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testHourly",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=HOURLY;COUNT=3"],
+      [
+        "1997-09-02T09:00:00.000Z",
+        "1997-09-02T10:00:00.000Z",
+        "1997-09-02T11:00:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testHourlyInterval',
-//   new RRule({
-//     freq: RRule.HOURLY,
-//     count: 3,
-//     interval: 2,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 9, 0),
-//     datetime(1997, 9, 2, 11, 0),
-//     datetime(1997, 9, 2, 13, 0),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testHourlyInterval",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=HOURLY;COUNT=3;INTERVAL=2"],
+      [
+        "1997-09-02T09:00:00.000Z",
+        "1997-09-02T11:00:00.000Z",
+        "1997-09-02T13:00:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testHourlyIntervalLarge',
-//   new RRule({
-//     freq: RRule.HOURLY,
-//     count: 3,
-//     interval: 769,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 9, 0),
-//     datetime(1997, 10, 4, 10, 0),
-//     datetime(1997, 11, 5, 11, 0),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testHourlyIntervalLarge",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=HOURLY;COUNT=3;INTERVAL=769"],
+      [
+        "1997-09-02T09:00:00.000Z",
+        "1997-10-04T10:00:00.000Z",
+        "1997-11-05T11:00:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testHourlyByMonth',
-//   new RRule({
-//     freq: RRule.HOURLY,
-//     count: 3,
-//     bymonth: [1, 3],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 1, 1, 0, 0),
-//     datetime(1998, 1, 1, 1, 0),
-//     datetime(1998, 1, 1, 2, 0),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testHourlyByMonth",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=HOURLY;COUNT=3;BYMONTH=1,3"],
+      [
+        "1998-01-01T00:00:00.000Z",
+        "1998-01-01T01:00:00.000Z",
+        "1998-01-01T02:00:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testHourlyByMonthDay',
-//   new RRule({
-//     freq: RRule.HOURLY,
-//     count: 3,
-//     bymonthday: [1, 3],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 3, 0, 0),
-//     datetime(1997, 9, 3, 1, 0),
-//     datetime(1997, 9, 3, 2, 0),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testHourlyByMonthDay",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=HOURLY;COUNT=3;BYMONTHDAY=1,3"],
+      [
+        "1997-09-03T00:00:00.000Z",
+        "1997-09-03T01:00:00.000Z",
+        "1997-09-03T02:00:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testHourlyByMonthAndMonthDay',
-//   new RRule({
-//     freq: RRule.HOURLY,
-//     count: 3,
-//     bymonth: [1, 3],
-//     bymonthday: [5, 7],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 1, 5, 0, 0),
-//     datetime(1998, 1, 5, 1, 0),
-//     datetime(1998, 1, 5, 2, 0),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testHourlyByMonthAndMonthDay",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=HOURLY;COUNT=3;BYMONTH=1,3;BYMONTHDAY=5,7",
+      ],
+      [
+        "1998-01-05T00:00:00.000Z",
+        "1998-01-05T01:00:00.000Z",
+        "1998-01-05T02:00:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testHourlyByWeekDay',
-//   new RRule({
-//     freq: RRule.HOURLY,
-//     count: 3,
-//     byweekday: [RRule.TU, RRule.TH],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 9, 0),
-//     datetime(1997, 9, 2, 10, 0),
-//     datetime(1997, 9, 2, 11, 0),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testHourlyByWeekDay",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=HOURLY;COUNT=3;BYDAY=TU,TH"],
+      [
+        "1997-09-02T09:00:00.000Z",
+        "1997-09-02T10:00:00.000Z",
+        "1997-09-02T11:00:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testHourlyByNWeekDay',
-//   new RRule({
-//     freq: RRule.HOURLY,
-//     count: 3,
-//     byweekday: [RRule.TU.nth(1), RRule.TH.nth(-1)],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 9, 0),
-//     datetime(1997, 9, 2, 10, 0),
-//     datetime(1997, 9, 2, 11, 0),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testHourlyByNWeekDay",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=HOURLY;COUNT=3;BYDAY=1TU,-1TH"],
+      [
+        "1997-09-02T09:00:00.000Z",
+        "1997-09-02T10:00:00.000Z",
+        "1997-09-02T11:00:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testHourlyByMonthAndWeekDay',
-//   new RRule({
-//     freq: RRule.HOURLY,
-//     count: 3,
-//     bymonth: [1, 3],
-//     byweekday: [RRule.TU, RRule.TH],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 1, 1, 0, 0),
-//     datetime(1998, 1, 1, 1, 0),
-//     datetime(1998, 1, 1, 2, 0),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testHourlyByMonthAndWeekDay",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=HOURLY;COUNT=3;BYMONTH=1,3;BYDAY=TU,TH",
+      ],
+      [
+        "1998-01-01T00:00:00.000Z",
+        "1998-01-01T01:00:00.000Z",
+        "1998-01-01T02:00:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testHourlyByMonthAndNWeekDay',
-//   new RRule({
-//     freq: RRule.HOURLY,
-//     count: 3,
-//     bymonth: [1, 3],
-//     byweekday: [RRule.TU.nth(1), RRule.TH.nth(-1)],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 1, 1, 0, 0),
-//     datetime(1998, 1, 1, 1, 0),
-//     datetime(1998, 1, 1, 2, 0),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testHourlyByMonthAndNWeekDay",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=HOURLY;COUNT=3;BYMONTH=1,3;BYDAY=1TU,-1TH",
+      ],
+      [
+        "1998-01-01T00:00:00.000Z",
+        "1998-01-01T01:00:00.000Z",
+        "1998-01-01T02:00:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testHourlyByMonthDayAndWeekDay',
-//   new RRule({
-//     freq: RRule.HOURLY,
-//     count: 3,
-//     bymonthday: [1, 3],
-//     byweekday: [RRule.TU, RRule.TH],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 1, 1, 0, 0),
-//     datetime(1998, 1, 1, 1, 0),
-//     datetime(1998, 1, 1, 2, 0),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testHourlyByMonthDayAndWeekDay",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=HOURLY;COUNT=3;BYMONTHDAY=1,3;BYDAY=TU,TH",
+      ],
+      [
+        "1998-01-01T00:00:00.000Z",
+        "1998-01-01T01:00:00.000Z",
+        "1998-01-01T02:00:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testHourlyByMonthAndMonthDayAndWeekDay',
-//   new RRule({
-//     freq: RRule.HOURLY,
-//     count: 3,
-//     bymonth: [1, 3],
-//     bymonthday: [1, 3],
-//     byweekday: [RRule.TU, RRule.TH],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 1, 1, 0, 0),
-//     datetime(1998, 1, 1, 1, 0),
-//     datetime(1998, 1, 1, 2, 0),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testHourlyByMonthAndMonthDayAndWeekDay",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=HOURLY;COUNT=3;BYMONTH=1,3;BYMONTHDAY=1,3;BYDAY=TU,TH",
+      ],
+      [
+        "1998-01-01T00:00:00.000Z",
+        "1998-01-01T01:00:00.000Z",
+        "1998-01-01T02:00:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testHourlyByYearDay',
-//   new RRule({
-//     freq: RRule.HOURLY,
-//     count: 4,
-//     byyearday: [1, 100, 200, 365],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 12, 31, 0, 0),
-//     datetime(1997, 12, 31, 1, 0),
-//     datetime(1997, 12, 31, 2, 0),
-//     datetime(1997, 12, 31, 3, 0),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testHourlyByYearDay",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=HOURLY;COUNT=4;BYYEARDAY=1,100,200,365",
+      ],
+      [
+        "1997-12-31T00:00:00.000Z",
+        "1997-12-31T01:00:00.000Z",
+        "1997-12-31T02:00:00.000Z",
+        "1997-12-31T03:00:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testHourlyByYearDayNeg',
-//   new RRule({
-//     freq: RRule.HOURLY,
-//     count: 4,
-//     byyearday: [-365, -266, -166, -1],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 12, 31, 0, 0),
-//     datetime(1997, 12, 31, 1, 0),
-//     datetime(1997, 12, 31, 2, 0),
-//     datetime(1997, 12, 31, 3, 0),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testHourlyByYearDayNeg",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=HOURLY;COUNT=4;BYYEARDAY=-365,-266,-166,-1",
+      ],
+      [
+        "1997-12-31T00:00:00.000Z",
+        "1997-12-31T01:00:00.000Z",
+        "1997-12-31T02:00:00.000Z",
+        "1997-12-31T03:00:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testHourlyByMonthAndYearDay',
-//   new RRule({
-//     freq: RRule.HOURLY,
-//     count: 4,
-//     bymonth: [4, 7],
-//     byyearday: [1, 100, 200, 365],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 4, 10, 0, 0),
-//     datetime(1998, 4, 10, 1, 0),
-//     datetime(1998, 4, 10, 2, 0),
-//     datetime(1998, 4, 10, 3, 0),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testHourlyByMonthAndYearDay",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=HOURLY;COUNT=4;BYMONTH=4,7;BYYEARDAY=1,100,200,365",
+      ],
+      [
+        "1998-04-10T00:00:00.000Z",
+        "1998-04-10T01:00:00.000Z",
+        "1998-04-10T02:00:00.000Z",
+        "1998-04-10T03:00:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testHourlyByMonthAndYearDayNeg',
-//   new RRule({
-//     freq: RRule.HOURLY,
-//     count: 4,
-//     bymonth: [4, 7],
-//     byyearday: [-365, -266, -166, -1],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 4, 10, 0, 0),
-//     datetime(1998, 4, 10, 1, 0),
-//     datetime(1998, 4, 10, 2, 0),
-//     datetime(1998, 4, 10, 3, 0),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testHourlyByMonthAndYearDayNeg",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=HOURLY;COUNT=4;BYMONTH=4,7;BYYEARDAY=-365,-266,-166,-1",
+      ],
+      [
+        "1998-04-10T00:00:00.000Z",
+        "1998-04-10T01:00:00.000Z",
+        "1998-04-10T02:00:00.000Z",
+        "1998-04-10T03:00:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testHourlyByWeekNo',
-//   new RRule({
-//     freq: RRule.HOURLY,
-//     count: 3,
-//     byweekno: 20,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 5, 11, 0, 0),
-//     datetime(1998, 5, 11, 1, 0),
-//     datetime(1998, 5, 11, 2, 0),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testHourlyByWeekNo",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=HOURLY;COUNT=3;BYWEEKNO=20"],
+      [
+        "1998-05-11T00:00:00.000Z",
+        "1998-05-11T01:00:00.000Z",
+        "1998-05-11T02:00:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testHourlyByWeekNoAndWeekDay',
-//   new RRule({
-//     freq: RRule.HOURLY,
-//     count: 3,
-//     byweekno: 1,
-//     byweekday: RRule.MO,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 12, 29, 0, 0),
-//     datetime(1997, 12, 29, 1, 0),
-//     datetime(1997, 12, 29, 2, 0),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testHourlyByWeekNoAndWeekDay",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=HOURLY;COUNT=3;BYWEEKNO=1;BYDAY=MO",
+      ],
+      [
+        "1997-12-29T00:00:00.000Z",
+        "1997-12-29T01:00:00.000Z",
+        "1997-12-29T02:00:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testHourlyByWeekNoAndWeekDayLarge',
-//   new RRule({
-//     freq: RRule.HOURLY,
-//     count: 3,
-//     byweekno: 52,
-//     byweekday: RRule.SU,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 12, 28, 0, 0),
-//     datetime(1997, 12, 28, 1, 0),
-//     datetime(1997, 12, 28, 2, 0),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testHourlyByWeekNoAndWeekDayLarge",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=HOURLY;COUNT=3;BYWEEKNO=52;BYDAY=SU",
+      ],
+      [
+        "1997-12-28T00:00:00.000Z",
+        "1997-12-28T01:00:00.000Z",
+        "1997-12-28T02:00:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testHourlyByWeekNoAndWeekDayLast',
-//   new RRule({
-//     freq: RRule.HOURLY,
-//     count: 3,
-//     byweekno: -1,
-//     byweekday: RRule.SU,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 12, 28, 0, 0),
-//     datetime(1997, 12, 28, 1, 0),
-//     datetime(1997, 12, 28, 2, 0),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testHourlyByWeekNoAndWeekDayLast",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=HOURLY;COUNT=3;BYWEEKNO=-1;BYDAY=SU",
+      ],
+      [
+        "1997-12-28T00:00:00.000Z",
+        "1997-12-28T01:00:00.000Z",
+        "1997-12-28T02:00:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testHourlyByWeekNoAndWeekDay53',
-//   new RRule({
-//     freq: RRule.HOURLY,
-//     count: 3,
-//     byweekno: 53,
-//     byweekday: RRule.MO,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 12, 28, 0, 0),
-//     datetime(1998, 12, 28, 1, 0),
-//     datetime(1998, 12, 28, 2, 0),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testHourlyByWeekNoAndWeekDay53",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=HOURLY;COUNT=3;BYWEEKNO=53;BYDAY=MO",
+      ],
+      [
+        "1998-12-28T00:00:00.000Z",
+        "1998-12-28T01:00:00.000Z",
+        "1998-12-28T02:00:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring.skip(
-//   'testHourlyByEaster',
-//   new RRule({
-//     freq: RRule.HOURLY,
-//     count: 3,
-//     byeaster: 0,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 4, 12, 0, 0),
-//     datetime(1998, 4, 12, 1, 0),
-//     datetime(1998, 4, 12, 2, 0),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testHourlyByHour",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=HOURLY;COUNT=3;BYHOUR=6,18"],
+      [
+        "1997-09-02T18:00:00.000Z",
+        "1997-09-03T06:00:00.000Z",
+        "1997-09-03T18:00:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring.skip(
-//   'testHourlyByEasterPos',
-//   new RRule({
-//     freq: RRule.HOURLY,
-//     count: 3,
-//     byeaster: 1,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 4, 13, 0, 0),
-//     datetime(1998, 4, 13, 1, 0),
-//     datetime(1998, 4, 13, 2, 0),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testHourlyByMinute",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=HOURLY;COUNT=3;BYMINUTE=6,18"],
+      [
+        "1997-09-02T09:06:00.000Z",
+        "1997-09-02T09:18:00.000Z",
+        "1997-09-02T10:06:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring.skip(
-//   'testHourlyByEasterNeg',
-//   new RRule({
-//     freq: RRule.HOURLY,
-//     count: 3,
-//     byeaster: -1,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 4, 11, 0, 0),
-//     datetime(1998, 4, 11, 1, 0),
-//     datetime(1998, 4, 11, 2, 0),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testHourlyBySecond",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=HOURLY;COUNT=3;BYSECOND=6,18"],
+      [
+        "1997-09-02T09:00:06.000Z",
+        "1997-09-02T09:00:18.000Z",
+        "1997-09-02T10:00:06.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testHourlyByHour',
-//   new RRule({
-//     freq: RRule.HOURLY,
-//     count: 3,
-//     byhour: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 18, 0),
-//     datetime(1997, 9, 3, 6, 0),
-//     datetime(1997, 9, 3, 18, 0),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testHourlyByHourAndMinute",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=HOURLY;COUNT=3;BYHOUR=6,18;BYMINUTE=6,18",
+      ],
+      [
+        "1997-09-02T18:06:00.000Z",
+        "1997-09-02T18:18:00.000Z",
+        "1997-09-03T06:06:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testHourlyByMinute',
-//   new RRule({
-//     freq: RRule.HOURLY,
-//     count: 3,
-//     byminute: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 9, 6),
-//     datetime(1997, 9, 2, 9, 18),
-//     datetime(1997, 9, 2, 10, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testHourlyByHourAndSecond",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=HOURLY;COUNT=3;BYHOUR=6,18;BYSECOND=6,18",
+      ],
+      [
+        "1997-09-02T18:00:06.000Z",
+        "1997-09-02T18:00:18.000Z",
+        "1997-09-03T06:00:06.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testHourlyBySecond',
-//   new RRule({
-//     freq: RRule.HOURLY,
-//     count: 3,
-//     bysecond: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 9, 0, 6),
-//     datetime(1997, 9, 2, 9, 0, 18),
-//     datetime(1997, 9, 2, 10, 0, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testHourlyByMinuteAndSecond",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=HOURLY;COUNT=3;BYMINUTE=6,18;BYSECOND=6,18",
+      ],
+      [
+        "1997-09-02T09:06:06.000Z",
+        "1997-09-02T09:06:18.000Z",
+        "1997-09-02T09:18:06.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testHourlyByHourAndMinute',
-//   new RRule({
-//     freq: RRule.HOURLY,
-//     count: 3,
-//     byhour: [6, 18],
-//     byminute: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 18, 6),
-//     datetime(1997, 9, 2, 18, 18),
-//     datetime(1997, 9, 3, 6, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testHourlyByHourAndMinuteAndSecond",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=HOURLY;COUNT=3;BYHOUR=6,18;BYMINUTE=6,18;BYSECOND=6,18",
+      ],
+      [
+        "1997-09-02T18:06:06.000Z",
+        "1997-09-02T18:06:18.000Z",
+        "1997-09-02T18:18:06.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testHourlyByHourAndSecond',
-//   new RRule({
-//     freq: RRule.HOURLY,
-//     count: 3,
-//     byhour: [6, 18],
-//     bysecond: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 18, 0, 6),
-//     datetime(1997, 9, 2, 18, 0, 18),
-//     datetime(1997, 9, 3, 6, 0, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMinutely",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=MINUTELY;COUNT=3"],
+      [
+        "1997-09-02T09:00:00.000Z",
+        "1997-09-02T09:01:00.000Z",
+        "1997-09-02T09:02:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testHourlyByMinuteAndSecond',
-//   new RRule({
-//     freq: RRule.HOURLY,
-//     count: 3,
-//     byminute: [6, 18],
-//     bysecond: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 9, 6, 6),
-//     datetime(1997, 9, 2, 9, 6, 18),
-//     datetime(1997, 9, 2, 9, 18, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMinutelyInterval",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=MINUTELY;COUNT=3;INTERVAL=2"],
+      [
+        "1997-09-02T09:00:00.000Z",
+        "1997-09-02T09:02:00.000Z",
+        "1997-09-02T09:04:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testHourlyByHourAndMinuteAndSecond',
-//   new RRule({
-//     freq: RRule.HOURLY,
-//     count: 3,
-//     byhour: [6, 18],
-//     byminute: [6, 18],
-//     bysecond: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 18, 6, 6),
-//     datetime(1997, 9, 2, 18, 6, 18),
-//     datetime(1997, 9, 2, 18, 18, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMinutelyIntervalLarge",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=MINUTELY;COUNT=3;INTERVAL=1501"],
+      [
+        "1997-09-02T09:00:00.000Z",
+        "1997-09-03T10:01:00.000Z",
+        "1997-09-04T11:02:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testHourlyBySetPos',
-//   new RRule({
-//     freq: RRule.HOURLY,
-//     count: 3,
-//     byminute: [15, 45],
-//     bysecond: [15, 45],
-//     bysetpos: [3, -3],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 9, 15, 45),
-//     datetime(1997, 9, 2, 9, 45, 15),
-//     datetime(1997, 9, 2, 10, 15, 45),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMinutelyByMonth",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=MINUTELY;COUNT=3;BYMONTH=1,3"],
+      [
+        "1998-01-01T00:00:00.000Z",
+        "1998-01-01T00:01:00.000Z",
+        "1998-01-01T00:02:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testMinutely',
-//   new RRule({
-//     freq: RRule.MINUTELY,
-//     count: 3,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 9, 0),
-//     datetime(1997, 9, 2, 9, 1),
-//     datetime(1997, 9, 2, 9, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMinutelyByMonthDay",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=MINUTELY;COUNT=3;BYMONTHDAY=1,3",
+      ],
+      [
+        "1997-09-03T00:00:00.000Z",
+        "1997-09-03T00:01:00.000Z",
+        "1997-09-03T00:02:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testMinutelyInterval',
-//   new RRule({
-//     freq: RRule.MINUTELY,
-//     count: 3,
-//     interval: 2,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 9, 0),
-//     datetime(1997, 9, 2, 9, 2),
-//     datetime(1997, 9, 2, 9, 4),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMinutelyByMonthAndMonthDay",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=MINUTELY;COUNT=3;BYMONTH=1,3;BYMONTHDAY=5,7",
+      ],
+      [
+        "1998-01-05T00:00:00.000Z",
+        "1998-01-05T00:01:00.000Z",
+        "1998-01-05T00:02:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testMinutelyIntervalLarge',
-//   new RRule({
-//     freq: RRule.MINUTELY,
-//     count: 3,
-//     interval: 1501,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 9, 0),
-//     datetime(1997, 9, 3, 10, 1),
-//     datetime(1997, 9, 4, 11, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMinutelyByWeekDay",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=MINUTELY;COUNT=3;BYDAY=TU,TH"],
+      [
+        "1997-09-02T09:00:00.000Z",
+        "1997-09-02T09:01:00.000Z",
+        "1997-09-02T09:02:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testMinutelyByMonth',
-//   new RRule({
-//     freq: RRule.MINUTELY,
-//     count: 3,
-//     bymonth: [1, 3],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 1, 1, 0, 0),
-//     datetime(1998, 1, 1, 0, 1),
-//     datetime(1998, 1, 1, 0, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMinutelyByNWeekDay",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=MINUTELY;COUNT=3;BYDAY=1TU,-1TH",
+      ],
+      [
+        "1997-09-02T09:00:00.000Z",
+        "1997-09-02T09:01:00.000Z",
+        "1997-09-02T09:02:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testMinutelyByMonthDay',
-//   new RRule({
-//     freq: RRule.MINUTELY,
-//     count: 3,
-//     bymonthday: [1, 3],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 3, 0, 0),
-//     datetime(1997, 9, 3, 0, 1),
-//     datetime(1997, 9, 3, 0, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMinutelyByMonthAndWeekDay",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=MINUTELY;COUNT=3;BYMONTH=1,3;BYDAY=TU,TH",
+      ],
+      [
+        "1998-01-01T00:00:00.000Z",
+        "1998-01-01T00:01:00.000Z",
+        "1998-01-01T00:02:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testMinutelyByMonthAndMonthDay',
-//   new RRule({
-//     freq: RRule.MINUTELY,
-//     count: 3,
-//     bymonth: [1, 3],
-//     bymonthday: [5, 7],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 1, 5, 0, 0),
-//     datetime(1998, 1, 5, 0, 1),
-//     datetime(1998, 1, 5, 0, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMinutelyByMonthAndNWeekDay",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=MINUTELY;COUNT=3;BYMONTH=1,3;BYDAY=1TU,-1TH",
+      ],
+      [
+        "1998-01-01T00:00:00.000Z",
+        "1998-01-01T00:01:00.000Z",
+        "1998-01-01T00:02:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testMinutelyByWeekDay',
-//   new RRule({
-//     freq: RRule.MINUTELY,
-//     count: 3,
-//     byweekday: [RRule.TU, RRule.TH],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 9, 0),
-//     datetime(1997, 9, 2, 9, 1),
-//     datetime(1997, 9, 2, 9, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMinutelyByMonthDayAndWeekDay",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=MINUTELY;COUNT=3;BYMONTHDAY=1,3;BYDAY=TU,TH",
+      ],
+      [
+        "1998-01-01T00:00:00.000Z",
+        "1998-01-01T00:01:00.000Z",
+        "1998-01-01T00:02:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testMinutelyByNWeekDay',
-//   new RRule({
-//     freq: RRule.MINUTELY,
-//     count: 3,
-//     byweekday: [RRule.TU.nth(1), RRule.TH.nth(-1)],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 9, 0),
-//     datetime(1997, 9, 2, 9, 1),
-//     datetime(1997, 9, 2, 9, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMinutelyByMonthAndMonthDayAndWeekDay",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=MINUTELY;COUNT=3;BYMONTH=1,3;BYMONTHDAY=1,3;BYDAY=TU,TH",
+      ],
+      [
+        "1998-01-01T00:00:00.000Z",
+        "1998-01-01T00:01:00.000Z",
+        "1998-01-01T00:02:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testMinutelyByMonthAndWeekDay',
-//   new RRule({
-//     freq: RRule.MINUTELY,
-//     count: 3,
-//     bymonth: [1, 3],
-//     byweekday: [RRule.TU, RRule.TH],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 1, 1, 0, 0),
-//     datetime(1998, 1, 1, 0, 1),
-//     datetime(1998, 1, 1, 0, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMinutelyByYearDay",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=MINUTELY;COUNT=4;BYYEARDAY=1,100,200,365",
+      ],
+      [
+        "1997-12-31T00:00:00.000Z",
+        "1997-12-31T00:01:00.000Z",
+        "1997-12-31T00:02:00.000Z",
+        "1997-12-31T00:03:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testMinutelyByMonthAndNWeekDay',
-//   new RRule({
-//     freq: RRule.MINUTELY,
-//     count: 3,
-//     bymonth: [1, 3],
-//     byweekday: [RRule.TU.nth(1), RRule.TH.nth(-1)],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 1, 1, 0, 0),
-//     datetime(1998, 1, 1, 0, 1),
-//     datetime(1998, 1, 1, 0, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMinutelyByYearDayNeg",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=MINUTELY;COUNT=4;BYYEARDAY=-365,-266,-166,-1",
+      ],
+      [
+        "1997-12-31T00:00:00.000Z",
+        "1997-12-31T00:01:00.000Z",
+        "1997-12-31T00:02:00.000Z",
+        "1997-12-31T00:03:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testMinutelyByMonthDayAndWeekDay',
-//   new RRule({
-//     freq: RRule.MINUTELY,
-//     count: 3,
-//     bymonthday: [1, 3],
-//     byweekday: [RRule.TU, RRule.TH],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 1, 1, 0, 0),
-//     datetime(1998, 1, 1, 0, 1),
-//     datetime(1998, 1, 1, 0, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMinutelyByMonthAndYearDay",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=MINUTELY;COUNT=4;BYMONTH=4,7;BYYEARDAY=1,100,200,365",
+      ],
+      [
+        "1998-04-10T00:00:00.000Z",
+        "1998-04-10T00:01:00.000Z",
+        "1998-04-10T00:02:00.000Z",
+        "1998-04-10T00:03:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testMinutelyByMonthAndMonthDayAndWeekDay',
-//   new RRule({
-//     freq: RRule.MINUTELY,
-//     count: 3,
-//     bymonth: [1, 3],
-//     bymonthday: [1, 3],
-//     byweekday: [RRule.TU, RRule.TH],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 1, 1, 0, 0),
-//     datetime(1998, 1, 1, 0, 1),
-//     datetime(1998, 1, 1, 0, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMinutelyByMonthAndYearDayNeg",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=MINUTELY;COUNT=4;BYMONTH=4,7;BYYEARDAY=-365,-266,-166,-1",
+      ],
+      [
+        "1998-04-10T00:00:00.000Z",
+        "1998-04-10T00:01:00.000Z",
+        "1998-04-10T00:02:00.000Z",
+        "1998-04-10T00:03:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testMinutelyByYearDay',
-//   new RRule({
-//     freq: RRule.MINUTELY,
-//     count: 4,
-//     byyearday: [1, 100, 200, 365],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 12, 31, 0, 0),
-//     datetime(1997, 12, 31, 0, 1),
-//     datetime(1997, 12, 31, 0, 2),
-//     datetime(1997, 12, 31, 0, 3),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMinutelyByWeekNo",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=MINUTELY;COUNT=3;BYWEEKNO=20"],
+      [
+        "1998-05-11T00:00:00.000Z",
+        "1998-05-11T00:01:00.000Z",
+        "1998-05-11T00:02:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testMinutelyByYearDayNeg',
-//   new RRule({
-//     freq: RRule.MINUTELY,
-//     count: 4,
-//     byyearday: [-365, -266, -166, -1],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 12, 31, 0, 0),
-//     datetime(1997, 12, 31, 0, 1),
-//     datetime(1997, 12, 31, 0, 2),
-//     datetime(1997, 12, 31, 0, 3),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMinutelyByWeekNoAndWeekDay",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=MINUTELY;COUNT=3;BYWEEKNO=1;BYDAY=MO",
+      ],
+      [
+        "1997-12-29T00:00:00.000Z",
+        "1997-12-29T00:01:00.000Z",
+        "1997-12-29T00:02:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testMinutelyByMonthAndYearDay',
-//   new RRule({
-//     freq: RRule.MINUTELY,
-//     count: 4,
-//     bymonth: [4, 7],
-//     byyearday: [1, 100, 200, 365],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 4, 10, 0, 0),
-//     datetime(1998, 4, 10, 0, 1),
-//     datetime(1998, 4, 10, 0, 2),
-//     datetime(1998, 4, 10, 0, 3),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMinutelyByWeekNoAndWeekDayLarge",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=MINUTELY;COUNT=3;BYWEEKNO=52;BYDAY=SU",
+      ],
+      [
+        "1997-12-28T00:00:00.000Z",
+        "1997-12-28T00:01:00.000Z",
+        "1997-12-28T00:02:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testMinutelyByMonthAndYearDayNeg',
-//   new RRule({
-//     freq: RRule.MINUTELY,
-//     count: 4,
-//     bymonth: [4, 7],
-//     byyearday: [-365, -266, -166, -1],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 4, 10, 0, 0),
-//     datetime(1998, 4, 10, 0, 1),
-//     datetime(1998, 4, 10, 0, 2),
-//     datetime(1998, 4, 10, 0, 3),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMinutelyByWeekNoAndWeekDayLast",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=MINUTELY;COUNT=3;BYWEEKNO=-1;BYDAY=SU",
+      ],
+      [
+        "1997-12-28T00:00:00.000Z",
+        "1997-12-28T00:01:00.000Z",
+        "1997-12-28T00:02:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testMinutelyByWeekNo',
-//   new RRule({
-//     freq: RRule.MINUTELY,
-//     count: 3,
-//     byweekno: 20,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 5, 11, 0, 0),
-//     datetime(1998, 5, 11, 0, 1),
-//     datetime(1998, 5, 11, 0, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMinutelyByWeekNoAndWeekDay53",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=MINUTELY;COUNT=3;BYWEEKNO=53;BYDAY=MO",
+      ],
+      [
+        "1998-12-28T00:00:00.000Z",
+        "1998-12-28T00:01:00.000Z",
+        "1998-12-28T00:02:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testMinutelyByWeekNoAndWeekDay',
-//   new RRule({
-//     freq: RRule.MINUTELY,
-//     count: 3,
-//     byweekno: 1,
-//     byweekday: RRule.MO,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 12, 29, 0, 0),
-//     datetime(1997, 12, 29, 0, 1),
-//     datetime(1997, 12, 29, 0, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMinutelyByHour",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=MINUTELY;COUNT=3;BYHOUR=6,18"],
+      [
+        "1997-09-02T18:00:00.000Z",
+        "1997-09-02T18:01:00.000Z",
+        "1997-09-02T18:02:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testMinutelyByWeekNoAndWeekDayLarge',
-//   new RRule({
-//     freq: RRule.MINUTELY,
-//     count: 3,
-//     byweekno: 52,
-//     byweekday: RRule.SU,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 12, 28, 0, 0),
-//     datetime(1997, 12, 28, 0, 1),
-//     datetime(1997, 12, 28, 0, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMinutelyByMinute",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=MINUTELY;COUNT=3;BYMINUTE=6,18"],
+      [
+        "1997-09-02T09:06:00.000Z",
+        "1997-09-02T09:18:00.000Z",
+        "1997-09-02T10:06:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testMinutelyByWeekNoAndWeekDayLast',
-//   new RRule({
-//     freq: RRule.MINUTELY,
-//     count: 3,
-//     byweekno: -1,
-//     byweekday: RRule.SU,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 12, 28, 0, 0),
-//     datetime(1997, 12, 28, 0, 1),
-//     datetime(1997, 12, 28, 0, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMinutelyBySecond",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=MINUTELY;COUNT=3;BYSECOND=6,18"],
+      [
+        "1997-09-02T09:00:06.000Z",
+        "1997-09-02T09:00:18.000Z",
+        "1997-09-02T09:01:06.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testMinutelyByWeekNoAndWeekDay53',
-//   new RRule({
-//     freq: RRule.MINUTELY,
-//     count: 3,
-//     byweekno: 53,
-//     byweekday: RRule.MO,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 12, 28, 0, 0),
-//     datetime(1998, 12, 28, 0, 1),
-//     datetime(1998, 12, 28, 0, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMinutelyByHourAndMinute",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=MINUTELY;COUNT=3;BYHOUR=6,18;BYMINUTE=6,18",
+      ],
+      [
+        "1997-09-02T18:06:00.000Z",
+        "1997-09-02T18:18:00.000Z",
+        "1997-09-03T06:06:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring.skip(
-//   'testMinutelyByEaster',
-//   new RRule({
-//     freq: RRule.MINUTELY,
-//     count: 3,
-//     byeaster: 0,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 4, 12, 0, 0),
-//     datetime(1998, 4, 12, 0, 1),
-//     datetime(1998, 4, 12, 0, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMinutelyByHourAndSecond",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=MINUTELY;COUNT=3;BYHOUR=6,18;BYSECOND=6,18",
+      ],
+      [
+        "1997-09-02T18:00:06.000Z",
+        "1997-09-02T18:00:18.000Z",
+        "1997-09-02T18:01:06.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring.skip(
-//   'testMinutelyByEasterPos',
-//   new RRule({
-//     freq: RRule.MINUTELY,
-//     count: 3,
-//     byeaster: 1,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 4, 13, 0, 0),
-//     datetime(1998, 4, 13, 0, 1),
-//     datetime(1998, 4, 13, 0, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMinutelyByMinuteAndSecond",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=MINUTELY;COUNT=3;BYMINUTE=6,18;BYSECOND=6,18",
+      ],
+      [
+        "1997-09-02T09:06:06.000Z",
+        "1997-09-02T09:06:18.000Z",
+        "1997-09-02T09:18:06.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring.skip(
-//   'testMinutelyByEasterNeg',
-//   new RRule({
-//     freq: RRule.MINUTELY,
-//     count: 3,
-//     byeaster: -1,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 4, 11, 0, 0),
-//     datetime(1998, 4, 11, 0, 1),
-//     datetime(1998, 4, 11, 0, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMinutelyByHourAndMinuteAndSecond",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=MINUTELY;COUNT=3;BYHOUR=6,18;BYMINUTE=6,18;BYSECOND=6,18",
+      ],
+      [
+        "1997-09-02T18:06:06.000Z",
+        "1997-09-02T18:06:18.000Z",
+        "1997-09-02T18:18:06.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testMinutelyByHour',
-//   new RRule({
-//     freq: RRule.MINUTELY,
-//     count: 3,
-//     byhour: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 18, 0),
-//     datetime(1997, 9, 2, 18, 1),
-//     datetime(1997, 9, 2, 18, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testSecondly",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=SECONDLY;COUNT=3"],
+      [
+        "1997-09-02T09:00:00.000Z",
+        "1997-09-02T09:00:01.000Z",
+        "1997-09-02T09:00:02.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testMinutelyByMinute',
-//   new RRule({
-//     freq: RRule.MINUTELY,
-//     count: 3,
-//     byminute: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 9, 6),
-//     datetime(1997, 9, 2, 9, 18),
-//     datetime(1997, 9, 2, 10, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testSecondlyInterval",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=SECONDLY;COUNT=3;INTERVAL=2"],
+      [
+        "1997-09-02T09:00:00.000Z",
+        "1997-09-02T09:00:02.000Z",
+        "1997-09-02T09:00:04.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testMinutelyBySecond',
-//   new RRule({
-//     freq: RRule.MINUTELY,
-//     count: 3,
-//     bysecond: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 9, 0, 6),
-//     datetime(1997, 9, 2, 9, 0, 18),
-//     datetime(1997, 9, 2, 9, 1, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testSecondlyIntervalLarge",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=SECONDLY;COUNT=3;INTERVAL=90061",
+      ],
+      [
+        "1997-09-02T09:00:00.000Z",
+        "1997-09-03T10:01:01.000Z",
+        "1997-09-04T11:02:02.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testMinutelyByHourAndMinute',
-//   new RRule({
-//     freq: RRule.MINUTELY,
-//     count: 3,
-//     byhour: [6, 18],
-//     byminute: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 18, 6),
-//     datetime(1997, 9, 2, 18, 18),
-//     datetime(1997, 9, 3, 6, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testSecondlyByMonth",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=SECONDLY;COUNT=3;BYMONTH=1,3"],
+      [
+        "1998-01-01T00:00:00.000Z",
+        "1998-01-01T00:00:01.000Z",
+        "1998-01-01T00:00:02.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testMinutelyByHourAndSecond',
-//   new RRule({
-//     freq: RRule.MINUTELY,
-//     count: 3,
-//     byhour: [6, 18],
-//     bysecond: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 18, 0, 6),
-//     datetime(1997, 9, 2, 18, 0, 18),
-//     datetime(1997, 9, 2, 18, 1, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testSecondlyByMonthDay",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=SECONDLY;COUNT=3;BYMONTHDAY=1,3",
+      ],
+      [
+        "1997-09-03T00:00:00.000Z",
+        "1997-09-03T00:00:01.000Z",
+        "1997-09-03T00:00:02.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testMinutelyByMinuteAndSecond',
-//   new RRule({
-//     freq: RRule.MINUTELY,
-//     count: 3,
-//     byminute: [6, 18],
-//     bysecond: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 9, 6, 6),
-//     datetime(1997, 9, 2, 9, 6, 18),
-//     datetime(1997, 9, 2, 9, 18, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testSecondlyByMonthAndMonthDay",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=SECONDLY;COUNT=3;BYMONTH=1,3;BYMONTHDAY=5,7",
+      ],
+      [
+        "1998-01-05T00:00:00.000Z",
+        "1998-01-05T00:00:01.000Z",
+        "1998-01-05T00:00:02.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testMinutelyByHourAndMinuteAndSecond',
-//   new RRule({
-//     freq: RRule.MINUTELY,
-//     count: 3,
-//     byhour: [6, 18],
-//     byminute: [6, 18],
-//     bysecond: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 18, 6, 6),
-//     datetime(1997, 9, 2, 18, 6, 18),
-//     datetime(1997, 9, 2, 18, 18, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testSecondlyByWeekDay",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=SECONDLY;COUNT=3;BYDAY=TU,TH"],
+      [
+        "1997-09-02T09:00:00.000Z",
+        "1997-09-02T09:00:01.000Z",
+        "1997-09-02T09:00:02.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testMinutelyBySetPos',
-//   new RRule({
-//     freq: RRule.MINUTELY,
-//     count: 3,
-//     bysecond: [15, 30, 45],
-//     bysetpos: [3, -3],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 9, 0, 15),
-//     datetime(1997, 9, 2, 9, 0, 45),
-//     datetime(1997, 9, 2, 9, 1, 15),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testSecondlyByNWeekDay",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=SECONDLY;COUNT=3;BYDAY=1TU,-1TH",
+      ],
+      [
+        "1997-09-02T09:00:00.000Z",
+        "1997-09-02T09:00:01.000Z",
+        "1997-09-02T09:00:02.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testSecondly',
-//   new RRule({
-//     freq: RRule.SECONDLY,
-//     count: 3,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 9, 0, 0),
-//     datetime(1997, 9, 2, 9, 0, 1),
-//     datetime(1997, 9, 2, 9, 0, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testSecondlyByMonthAndWeekDay",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=SECONDLY;COUNT=3;BYMONTH=1,3;BYDAY=TU,TH",
+      ],
+      [
+        "1998-01-01T00:00:00.000Z",
+        "1998-01-01T00:00:01.000Z",
+        "1998-01-01T00:00:02.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testSecondlyInterval',
-//   new RRule({
-//     freq: RRule.SECONDLY,
-//     count: 3,
-//     interval: 2,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 9, 0, 0),
-//     datetime(1997, 9, 2, 9, 0, 2),
-//     datetime(1997, 9, 2, 9, 0, 4),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testSecondlyByMonthAndNWeekDay",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=SECONDLY;COUNT=3;BYMONTH=1,3;BYDAY=1TU,-1TH",
+      ],
+      [
+        "1998-01-01T00:00:00.000Z",
+        "1998-01-01T00:00:01.000Z",
+        "1998-01-01T00:00:02.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testSecondlyIntervalLarge',
-//   new RRule({
-//     freq: RRule.SECONDLY,
-//     count: 3,
-//     interval: 90061,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 9, 0, 0),
-//     datetime(1997, 9, 3, 10, 1, 1),
-//     datetime(1997, 9, 4, 11, 2, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testSecondlyByMonthDayAndWeekDay",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=SECONDLY;COUNT=3;BYMONTHDAY=1,3;BYDAY=TU,TH",
+      ],
+      [
+        "1998-01-01T00:00:00.000Z",
+        "1998-01-01T00:00:01.000Z",
+        "1998-01-01T00:00:02.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testSecondlyByMonth',
-//   new RRule({
-//     freq: RRule.SECONDLY,
-//     count: 3,
-//     bymonth: [1, 3],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 1, 1, 0, 0, 0),
-//     datetime(1998, 1, 1, 0, 0, 1),
-//     datetime(1998, 1, 1, 0, 0, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testSecondlyByMonthAndMonthDayAndWeekDay",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=SECONDLY;COUNT=3;BYMONTH=1,3;BYMONTHDAY=1,3;BYDAY=TU,TH",
+      ],
+      [
+        "1998-01-01T00:00:00.000Z",
+        "1998-01-01T00:00:01.000Z",
+        "1998-01-01T00:00:02.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testSecondlyByMonthDay',
-//   new RRule({
-//     freq: RRule.SECONDLY,
-//     count: 3,
-//     bymonthday: [1, 3],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 3, 0, 0, 0),
-//     datetime(1997, 9, 3, 0, 0, 1),
-//     datetime(1997, 9, 3, 0, 0, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testSecondlyByYearDay",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=SECONDLY;COUNT=4;BYYEARDAY=1,100,200,365",
+      ],
+      [
+        "1997-12-31T00:00:00.000Z",
+        "1997-12-31T00:00:01.000Z",
+        "1997-12-31T00:00:02.000Z",
+        "1997-12-31T00:00:03.000Z",
+      ],
+    );
+  },
+});
+
+Deno.test({
+  name: "generator-hms/testSecondlyByYearDayNeg",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=SECONDLY;COUNT=4;BYYEARDAY=-365,-266,-166,-1",
+      ],
+      [
+        "1997-12-31T00:00:00.000Z",
+        "1997-12-31T00:00:01.000Z",
+        "1997-12-31T00:00:02.000Z",
+        "1997-12-31T00:00:03.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testSecondlyByMonthAndMonthDay',
-//   new RRule({
-//     freq: RRule.SECONDLY,
-//     count: 3,
-//     bymonth: [1, 3],
-//     bymonthday: [5, 7],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 1, 5, 0, 0, 0),
-//     datetime(1998, 1, 5, 0, 0, 1),
-//     datetime(1998, 1, 5, 0, 0, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testSecondlyByMonthAndYearDay",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=SECONDLY;COUNT=4;BYMONTH=4,7;BYYEARDAY=1,100,200,365",
+      ],
+      [
+        "1998-04-10T00:00:00.000Z",
+        "1998-04-10T00:00:01.000Z",
+        "1998-04-10T00:00:02.000Z",
+        "1998-04-10T00:00:03.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testSecondlyByWeekDay',
-//   new RRule({
-//     freq: RRule.SECONDLY,
-//     count: 3,
-//     byweekday: [RRule.TU, RRule.TH],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 9, 0, 0),
-//     datetime(1997, 9, 2, 9, 0, 1),
-//     datetime(1997, 9, 2, 9, 0, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testSecondlyByMonthAndYearDayNeg",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=SECONDLY;COUNT=4;BYMONTH=4,7;BYYEARDAY=-365,-266,-166,-1",
+      ],
+      [
+        "1998-04-10T00:00:00.000Z",
+        "1998-04-10T00:00:01.000Z",
+        "1998-04-10T00:00:02.000Z",
+        "1998-04-10T00:00:03.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testSecondlyByNWeekDay',
-//   new RRule({
-//     freq: RRule.SECONDLY,
-//     count: 3,
-//     byweekday: [RRule.TU.nth(1), RRule.TH.nth(-1)],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 9, 0, 0),
-//     datetime(1997, 9, 2, 9, 0, 1),
-//     datetime(1997, 9, 2, 9, 0, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testSecondlyByWeekNo",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=SECONDLY;COUNT=3;BYWEEKNO=20"],
+      [
+        "1998-05-11T00:00:00.000Z",
+        "1998-05-11T00:00:01.000Z",
+        "1998-05-11T00:00:02.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testSecondlyByMonthAndWeekDay',
-//   new RRule({
-//     freq: RRule.SECONDLY,
-//     count: 3,
-//     bymonth: [1, 3],
-//     byweekday: [RRule.TU, RRule.TH],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 1, 1, 0, 0, 0),
-//     datetime(1998, 1, 1, 0, 0, 1),
-//     datetime(1998, 1, 1, 0, 0, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testSecondlyByWeekNoAndWeekDay",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=SECONDLY;COUNT=3;BYWEEKNO=1;BYDAY=MO",
+      ],
+      [
+        "1997-12-29T00:00:00.000Z",
+        "1997-12-29T00:00:01.000Z",
+        "1997-12-29T00:00:02.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testSecondlyByMonthAndNWeekDay',
-//   new RRule({
-//     freq: RRule.SECONDLY,
-//     count: 3,
-//     bymonth: [1, 3],
-//     byweekday: [RRule.TU.nth(1), RRule.TH.nth(-1)],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 1, 1, 0, 0, 0),
-//     datetime(1998, 1, 1, 0, 0, 1),
-//     datetime(1998, 1, 1, 0, 0, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testSecondlyByWeekNoAndWeekDayLarge",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=SECONDLY;COUNT=3;BYWEEKNO=52;BYDAY=SU",
+      ],
+      [
+        "1997-12-28T00:00:00.000Z",
+        "1997-12-28T00:00:01.000Z",
+        "1997-12-28T00:00:02.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testSecondlyByMonthDayAndWeekDay',
-//   new RRule({
-//     freq: RRule.SECONDLY,
-//     count: 3,
-//     bymonthday: [1, 3],
-//     byweekday: [RRule.TU, RRule.TH],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 1, 1, 0, 0, 0),
-//     datetime(1998, 1, 1, 0, 0, 1),
-//     datetime(1998, 1, 1, 0, 0, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testSecondlyByWeekNoAndWeekDayLast",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=SECONDLY;COUNT=3;BYWEEKNO=-1;BYDAY=SU",
+      ],
+      [
+        "1997-12-28T00:00:00.000Z",
+        "1997-12-28T00:00:01.000Z",
+        "1997-12-28T00:00:02.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testSecondlyByMonthAndMonthDayAndWeekDay',
-//   new RRule({
-//     freq: RRule.SECONDLY,
-//     count: 3,
-//     bymonth: [1, 3],
-//     bymonthday: [1, 3],
-//     byweekday: [RRule.TU, RRule.TH],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 1, 1, 0, 0, 0),
-//     datetime(1998, 1, 1, 0, 0, 1),
-//     datetime(1998, 1, 1, 0, 0, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testSecondlyByWeekNoAndWeekDay53",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=SECONDLY;COUNT=3;BYWEEKNO=53;BYDAY=MO",
+      ],
+      [
+        "1998-12-28T00:00:00.000Z",
+        "1998-12-28T00:00:01.000Z",
+        "1998-12-28T00:00:02.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testSecondlyByYearDay',
-//   new RRule({
-//     freq: RRule.SECONDLY,
-//     count: 4,
-//     byyearday: [1, 100, 200, 365],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 12, 31, 0, 0, 0),
-//     datetime(1997, 12, 31, 0, 0, 1),
-//     datetime(1997, 12, 31, 0, 0, 2),
-//     datetime(1997, 12, 31, 0, 0, 3),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testSecondlyByHour",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=SECONDLY;COUNT=3;BYHOUR=6,18"],
+      [
+        "1997-09-02T18:00:00.000Z",
+        "1997-09-02T18:00:01.000Z",
+        "1997-09-02T18:00:02.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testSecondlyByYearDayNeg',
-//   new RRule({
-//     freq: RRule.SECONDLY,
-//     count: 4,
-//     byyearday: [-365, -266, -166, -1],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 12, 31, 0, 0, 0),
-//     datetime(1997, 12, 31, 0, 0, 1),
-//     datetime(1997, 12, 31, 0, 0, 2),
-//     datetime(1997, 12, 31, 0, 0, 3),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testSecondlyByMinute",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=SECONDLY;COUNT=3;BYMINUTE=6,18"],
+      [
+        "1997-09-02T09:06:00.000Z",
+        "1997-09-02T09:06:01.000Z",
+        "1997-09-02T09:06:02.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testSecondlyByMonthAndYearDay',
-//   new RRule({
-//     freq: RRule.SECONDLY,
-//     count: 4,
-//     bymonth: [4, 7],
-//     byyearday: [1, 100, 200, 365],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 4, 10, 0, 0, 0),
-//     datetime(1998, 4, 10, 0, 0, 1),
-//     datetime(1998, 4, 10, 0, 0, 2),
-//     datetime(1998, 4, 10, 0, 0, 3),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testSecondlyBySecond",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=SECONDLY;COUNT=3;BYSECOND=6,18"],
+      [
+        "1997-09-02T09:00:06.000Z",
+        "1997-09-02T09:00:18.000Z",
+        "1997-09-02T09:01:06.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testSecondlyByMonthAndYearDayNeg',
-//   new RRule({
-//     freq: RRule.SECONDLY,
-//     count: 4,
-//     bymonth: [4, 7],
-//     byyearday: [-365, -266, -166, -1],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 4, 10, 0, 0, 0),
-//     datetime(1998, 4, 10, 0, 0, 1),
-//     datetime(1998, 4, 10, 0, 0, 2),
-//     datetime(1998, 4, 10, 0, 0, 3),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testSecondlyByHourAndMinute",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=SECONDLY;COUNT=3;BYHOUR=6,18;BYMINUTE=6,18",
+      ],
+      [
+        "1997-09-02T18:06:00.000Z",
+        "1997-09-02T18:06:01.000Z",
+        "1997-09-02T18:06:02.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testSecondlyByWeekNo',
-//   new RRule({
-//     freq: RRule.SECONDLY,
-//     count: 3,
-//     byweekno: 20,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 5, 11, 0, 0, 0),
-//     datetime(1998, 5, 11, 0, 0, 1),
-//     datetime(1998, 5, 11, 0, 0, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testSecondlyByHourAndSecond",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=SECONDLY;COUNT=3;BYHOUR=6,18;BYSECOND=6,18",
+      ],
+      [
+        "1997-09-02T18:00:06.000Z",
+        "1997-09-02T18:00:18.000Z",
+        "1997-09-02T18:01:06.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testSecondlyByWeekNoAndWeekDay',
-//   new RRule({
-//     freq: RRule.SECONDLY,
-//     count: 3,
-//     byweekno: 1,
-//     byweekday: RRule.MO,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 12, 29, 0, 0, 0),
-//     datetime(1997, 12, 29, 0, 0, 1),
-//     datetime(1997, 12, 29, 0, 0, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testSecondlyByMinuteAndSecond",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=SECONDLY;COUNT=3;BYMINUTE=6,18;BYSECOND=6,18",
+      ],
+      [
+        "1997-09-02T09:06:06.000Z",
+        "1997-09-02T09:06:18.000Z",
+        "1997-09-02T09:18:06.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testSecondlyByWeekNoAndWeekDayLarge',
-//   new RRule({
-//     freq: RRule.SECONDLY,
-//     count: 3,
-//     byweekno: 52,
-//     byweekday: RRule.SU,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 12, 28, 0, 0, 0),
-//     datetime(1997, 12, 28, 0, 0, 1),
-//     datetime(1997, 12, 28, 0, 0, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testSecondlyByHourAndMinuteAndSecond",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=SECONDLY;COUNT=3;BYHOUR=6,18;BYMINUTE=6,18;BYSECOND=6,18",
+      ],
+      [
+        "1997-09-02T18:06:06.000Z",
+        "1997-09-02T18:06:18.000Z",
+        "1997-09-02T18:18:06.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testSecondlyByWeekNoAndWeekDayLast',
-//   new RRule({
-//     freq: RRule.SECONDLY,
-//     count: 3,
-//     byweekno: -1,
-//     byweekday: RRule.SU,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 12, 28, 0, 0, 0),
-//     datetime(1997, 12, 28, 0, 0, 1),
-//     datetime(1997, 12, 28, 0, 0, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testHourlyBySetPos",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=HOURLY;COUNT=3;BYMINUTE=15,45;BYSECOND=15,45;BYSETPOS=3,-3",
+      ],
+      [
+        "1997-09-02T09:15:45.000Z",
+        "1997-09-02T09:45:15.000Z",
+        "1997-09-02T10:15:45.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testSecondlyByWeekNoAndWeekDay53',
-//   new RRule({
-//     freq: RRule.SECONDLY,
-//     count: 3,
-//     byweekno: 53,
-//     byweekday: RRule.MO,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 12, 28, 0, 0, 0),
-//     datetime(1998, 12, 28, 0, 0, 1),
-//     datetime(1998, 12, 28, 0, 0, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMinutelyBySetPos",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=MINUTELY;COUNT=3;BYSECOND=15,30,45;BYSETPOS=3,-3",
+      ],
+      [
+        "1997-09-02T09:00:15.000Z",
+        "1997-09-02T09:00:45.000Z",
+        "1997-09-02T09:01:15.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring.skip(
-//   'testSecondlyByEaster',
-//   new RRule({
-//     freq: RRule.SECONDLY,
-//     count: 3,
-//     byeaster: 0,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 4, 12, 0, 0, 0),
-//     datetime(1998, 4, 12, 0, 0, 1),
-//     datetime(1998, 4, 12, 0, 0, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testHourlyByEaster",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=HOURLY;COUNT=3;BYEASTER=0"],
+      [
+        "1998-04-12T00:00:00.000Z",
+        "1998-04-12T01:00:00.000Z",
+        "1998-04-12T02:00:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring.skip(
-//   'testSecondlyByEasterPos',
-//   new RRule({
-//     freq: RRule.SECONDLY,
-//     count: 3,
-//     byeaster: 1,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 4, 13, 0, 0, 0),
-//     datetime(1998, 4, 13, 0, 0, 1),
-//     datetime(1998, 4, 13, 0, 0, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testHourlyByEasterPos",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=HOURLY;COUNT=3;BYEASTER=1"],
+      [
+        "1998-04-13T00:00:00.000Z",
+        "1998-04-13T01:00:00.000Z",
+        "1998-04-13T02:00:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring.skip(
-//   'testSecondlyByEasterNeg',
-//   new RRule({
-//     freq: RRule.SECONDLY,
-//     count: 3,
-//     byeaster: -1,
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1998, 4, 11, 0, 0, 0),
-//     datetime(1998, 4, 11, 0, 0, 1),
-//     datetime(1998, 4, 11, 0, 0, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testHourlyByEasterNeg",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=HOURLY;COUNT=3;BYEASTER=-1"],
+      [
+        "1998-04-11T00:00:00.000Z",
+        "1998-04-11T01:00:00.000Z",
+        "1998-04-11T02:00:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testSecondlyByHour',
-//   new RRule({
-//     freq: RRule.SECONDLY,
-//     count: 3,
-//     byhour: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 18, 0, 0),
-//     datetime(1997, 9, 2, 18, 0, 1),
-//     datetime(1997, 9, 2, 18, 0, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMinutelyByEaster",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=MINUTELY;COUNT=3;BYEASTER=0"],
+      [
+        "1998-04-12T00:00:00.000Z",
+        "1998-04-12T00:01:00.000Z",
+        "1998-04-12T00:02:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testSecondlyByMinute',
-//   new RRule({
-//     freq: RRule.SECONDLY,
-//     count: 3,
-//     byminute: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 9, 6, 0),
-//     datetime(1997, 9, 2, 9, 6, 1),
-//     datetime(1997, 9, 2, 9, 6, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMinutelyByEasterPos",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=MINUTELY;COUNT=3;BYEASTER=1"],
+      [
+        "1998-04-13T00:00:00.000Z",
+        "1998-04-13T00:01:00.000Z",
+        "1998-04-13T00:02:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testSecondlyBySecond',
-//   new RRule({
-//     freq: RRule.SECONDLY,
-//     count: 3,
-//     bysecond: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 9, 0, 6),
-//     datetime(1997, 9, 2, 9, 0, 18),
-//     datetime(1997, 9, 2, 9, 1, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testMinutelyByEasterNeg",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=MINUTELY;COUNT=3;BYEASTER=-1"],
+      [
+        "1998-04-11T00:00:00.000Z",
+        "1998-04-11T00:01:00.000Z",
+        "1998-04-11T00:02:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testSecondlyByHourAndMinute',
-//   new RRule({
-//     freq: RRule.SECONDLY,
-//     count: 3,
-//     byhour: [6, 18],
-//     byminute: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 18, 6, 0),
-//     datetime(1997, 9, 2, 18, 6, 1),
-//     datetime(1997, 9, 2, 18, 6, 2),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testSecondlyByEaster",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=SECONDLY;COUNT=3;BYEASTER=0"],
+      [
+        "1998-04-12T00:00:00.000Z",
+        "1998-04-12T00:00:01.000Z",
+        "1998-04-12T00:00:02.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testSecondlyByHourAndSecond',
-//   new RRule({
-//     freq: RRule.SECONDLY,
-//     count: 3,
-//     byhour: [6, 18],
-//     bysecond: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 18, 0, 6),
-//     datetime(1997, 9, 2, 18, 0, 18),
-//     datetime(1997, 9, 2, 18, 1, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testSecondlyByEasterPos",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=SECONDLY;COUNT=3;BYEASTER=1"],
+      [
+        "1998-04-13T00:00:00.000Z",
+        "1998-04-13T00:00:01.000Z",
+        "1998-04-13T00:00:02.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testSecondlyByMinuteAndSecond',
-//   new RRule({
-//     freq: RRule.SECONDLY,
-//     count: 3,
-//     byminute: [6, 18],
-//     bysecond: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 9, 6, 6),
-//     datetime(1997, 9, 2, 9, 6, 18),
-//     datetime(1997, 9, 2, 9, 18, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/testSecondlyByEasterNeg",
+  async fn() {
+    await assertRecurring(
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=SECONDLY;COUNT=3;BYEASTER=-1"],
+      [
+        "1998-04-11T00:00:00.000Z",
+        "1998-04-11T00:00:01.000Z",
+        "1998-04-11T00:00:02.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testSecondlyByHourAndMinuteAndSecond',
-//   new RRule({
-//     freq: RRule.SECONDLY,
-//     count: 3,
-//     byhour: [6, 18],
-//     byminute: [6, 18],
-//     bysecond: [6, 18],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 18, 6, 6),
-//     datetime(1997, 9, 2, 18, 6, 18),
-//     datetime(1997, 9, 2, 18, 18, 6),
-//   ]
-// )
+Deno.test({
+  name: "generator-hms/exdatesInTheirOwnZone",
+  async fn() {
+    // 17:00 in New York is 22:00Z, and 09:00 is 14:00 in London
+    await assertRecurring(
+      [
+        "DTSTART;TZID=America/New_York:20240101T090000",
+        "RRULE:FREQ=DAILY;COUNT=6;BYHOUR=9,17",
+        "EXDATE:20240101T220000Z",
+        "EXDATE;TZID=Europe/London:20240102T140000",
+        "EXDATE;VALUE=DATE:20240103",
+      ],
+      ["2024-01-01T14:00:00.000Z", "2024-01-02T22:00:00.000Z"],
+    );
+  },
+});
 
 // testRecurring(
 //   'testDTStartWithMicroseconds',
@@ -414,6 +414,28 @@ Deno.test({
   },
 });
 
+/**
+ * Python reference:
+ *     list(rrule(MONTHLY,
+ *                count=3,
+ *                byweekday=(FR),
+ *                dtstart=datetime(2024, 5, 31, 9, 0)))
+ *     [datetime(2024, 5, 31, 9, 0),
+ *      datetime(2024, 6, 7, 9, 0),
+ *      datetime(2024, 6, 14, 9, 0)]
+ *
+ */
+Deno.test({
+  name: "testMonthlyByWeekDayLastDayOfMonth",
+  fn() {
+    const iter = naivedate(2024, 5, 31).range(DateUnit.months(1), {
+      limit: 3,
+      filter: NaiveDate.Filter.byWeekday([Weekday.FRI]),
+    });
+    assertDtArrEqs(all(iter), ["2024-05-31", "2024-06-07", "2024-06-14"]);
+  },
+});
+
 /**
  * Python reference:
  *     def testYearlyByNWeekDay(self):
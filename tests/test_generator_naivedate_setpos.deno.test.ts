@@ -1,76 +1,82 @@
-import { assert } from "@std/assert";
+import { assertEquals } from "@std/assert";
+import { Recurrence } from "../chrono/recurrence/recurrence.ts";
+import { installTimezoneLoader } from "./utils.deno.ts";
+
+installTimezoneLoader();
+
+// Ported from rrule.js, which has times of day in UTC
+async function assertRecurring(lines: string[], expected: string[]) {
+  const recurrence = (await Recurrence.parse(lines)).exp();
+  assertEquals(
+    Array.from(recurrence.instants(), (mse) => new Date(mse).toISOString()),
+    expected,
+  );
+}
 
 Deno.test({
-  name: "generator-setpos",
-  fn() {
-    assert(false, "generator-setpos, not yet implemented");
+  name: "generator-setpos/testYearlyBySetPos",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=YEARLY;COUNT=3;BYMONTHDAY=15;BYHOUR=6,18;BYSETPOS=3,-3",
+      ],
+      [
+        "1997-11-15T18:00:00.000Z",
+        "1998-02-15T06:00:00.000Z",
+        "1998-11-15T18:00:00.000Z",
+      ],
+    );
   },
 });
 
-// testRecurring(
-//   'testYearlyBySetPos',
-//   new RRule({
-//     freq: RRule.YEARLY,
-//     count: 3,
-//     bymonthday: 15,
-//     byhour: [6, 18],
-//     bysetpos: [3, -3],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 11, 15, 18, 0),
-//     datetime(1998, 2, 15, 6, 0),
-//     datetime(1998, 11, 15, 18, 0),
-//   ]
-// )
-
-// testRecurring(
-//   'testMonthlyBySetPos',
-//   new RRule({
-//     freq: RRule.MONTHLY,
-//     count: 3,
-//     bymonthday: [13, 17],
-//     byhour: [6, 18],
-//     bysetpos: [3, -3],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 13, 18, 0),
-//     datetime(1997, 9, 17, 6, 0),
-//     datetime(1997, 10, 13, 18, 0),
-//   ]
-// )
+Deno.test({
+  name: "generator-setpos/testMonthlyBySetPos",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=MONTHLY;COUNT=3;BYMONTHDAY=13,17;BYHOUR=6,18;BYSETPOS=3,-3",
+      ],
+      [
+        "1997-09-13T18:00:00.000Z",
+        "1997-09-17T06:00:00.000Z",
+        "1997-10-13T18:00:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testWeeklyBySetPos',
-//   new RRule({
-//     freq: RRule.WEEKLY,
-//     count: 3,
-//     byweekday: [RRule.TU, RRule.TH],
-//     byhour: [6, 18],
-//     bysetpos: [3, -3],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 18, 0),
-//     datetime(1997, 9, 4, 6, 0),
-//     datetime(1997, 9, 9, 18, 0),
-//   ]
-// )
+Deno.test({
+  name: "generator-setpos/testWeeklyBySetPos",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=WEEKLY;COUNT=3;BYDAY=TU,TH;BYHOUR=6,18;BYSETPOS=3,-3",
+      ],
+      [
+        "1997-09-02T18:00:00.000Z",
+        "1997-09-04T06:00:00.000Z",
+        "1997-09-09T18:00:00.000Z",
+      ],
+    );
+  },
+});
 
-// testRecurring(
-//   'testDailyBySetPos',
-//   new RRule({
-//     freq: RRule.DAILY,
-//     count: 3,
-//     byhour: [6, 18],
-//     byminute: [15, 45],
-//     bysetpos: [3, -3],
-//     dtstart: parse('19970902T090000'),
-//   }),
-//   [
-//     datetime(1997, 9, 2, 18, 15),
-//     datetime(1997, 9, 3, 6, 45),
-//     datetime(1997, 9, 3, 18, 15),
-//   ]
-// )
+Deno.test({
+  name: "generator-setpos/testDailyBySetPos",
+  async fn() {
+    await assertRecurring(
+      [
+        "DTSTART:19970902T090000Z",
+        "RRULE:FREQ=DAILY;COUNT=3;BYHOUR=6,18;BYMINUTE=15,45;BYSETPOS=3,-3",
+      ],
+      [
+        "1997-09-02T18:15:00.000Z",
+        "1997-09-03T06:45:00.000Z",
+        "1997-09-03T18:15:00.000Z",
+      ],
+    );
+  },
+});
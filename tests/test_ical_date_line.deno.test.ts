@@ -47,3 +47,52 @@ Deno.test({
     );
   },
 });
+
+Deno.test({
+  name: "exdate/days index",
+  async fn() {
+    const input =
+      "EXDATE:20240103T090000Z,20240101T090000Z,20240103T170000Z,20240102";
+    const ex = (await ICalDateLine.parse(input, true)).exp();
+    // 2024-01-01 is day 19723 since epoch
+    assertEquals(Array.from(ex.days), [19723, 19724, 19725]);
+    assertEquals(ex.dates.length, 4);
+
+    const built = new ICalDateLine("EXDATE", ex.dates.slice().reverse());
+    assertEquals(Array.from(built.days), [19723, 19724, 19725]);
+  },
+});
+
+Deno.test({
+  name: "exdate/timestamp formats",
+  async fn() {
+    const input = "EXDATE:20240101T09,20240101T0930,20240101T093015Z";
+    const ex = (await ICalDateLine.parse(input, true)).exp();
+    assertEquals(
+      ex.dates.map((d) => d.ical()),
+      ["20240101T090000", "20240101T093000", "20240101T093015"],
+    );
+    assertEquals(ICalDateLine.Raw.parse("EXDATE-20240101").isErr, true);
+    assertEquals(ICalDateLine.Raw.parse("EXDATE:20240230").isErr, true);
+  },
+});
+
+Deno.test({
+  name: "exdate/days lookup",
+  async fn() {
+    const lines = [
+      "EXDATE:20240105T090000Z,20240101T090000Z",
+      "EXDATE;VALUE=DATE:20240103,20240105",
+    ];
+    const exdates = [];
+    for (const line of lines) {
+      exdates.push((await ICalDateLine.parse(line)).exp());
+    }
+    const days = ICalDateLine.Days.of(exdates);
+    assertEquals(Array.from(days), [19723, 19725, 19727]);
+    for (let dse = 19720; dse < 19730; ++dse) {
+      assertEquals(days.has(dse), [19723, 19725, 19727].includes(dse));
+    }
+    assertEquals(ICalDateLine.Days.of([]).has(19723), false);
+  },
+});
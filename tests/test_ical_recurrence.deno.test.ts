@@ -122,7 +122,7 @@ Deno.test({
           options: {
             until: new IsoDate(naivedate(2017, 12, 22), naivetime(1, 30), "Z"),
             interval: 1,
-            bysetpos: 17,
+            bysetpos: [17],
             byday: [
               Weekday.SUN,
               Weekday.MON,
@@ -173,3 +173,72 @@ Deno.test({
     assertEquals(recurr.toString(), exdate + "\n" + rrule);
   },
 });
+
+Deno.test({
+  name: "rrule/serde/recurrence_set",
+  async fn() {
+    const input = [
+      "DTSTART:20240101T090000Z",
+      "RRULE:FREQ=WEEKLY;BYDAY=MO;COUNT=4",
+      "RDATE;VALUE=DATE:20240110,20240108",
+      "RRULE:FREQ=WEEKLY;BYDAY=FR;COUNT=2",
+      "EXRULE:FREQ=MONTHLY;BYMONTHDAY=15;COUNT=1",
+      "EXDATE:20240122T090000Z",
+    ];
+    const recurr = (await ICalendar.Raw.parse(input, true)).exp();
+    assertEquals(recurr.isSet, true);
+    assertEquals(recurr.rrule!.inner.options!.byday, [Weekday.MON]);
+    assertEquals(recurr.rrules.length, 2);
+    assertEquals(recurr.lines.exrule!.length, 1);
+    assertEquals(recurr.toString(), input.join("\n"));
+  },
+});
+
+Deno.test({
+  name: "rrule/serde/exrule",
+  async fn() {
+    const input = [
+      "DTSTART:20240101T090000Z",
+      "RRULE:FREQ=DAILY;COUNT=10",
+      "EXRULE:FREQ=WEEKLY;BYDAY=SA,SU",
+    ];
+    const recurr = (await ICalendar.Raw.parse(input, true)).exp();
+    const exrule = recurr.lines.exrule![0];
+    assertEquals(exrule.inner.freq, "weekly");
+    assertEquals(exrule.inner.options!.byday, [Weekday.SAT, Weekday.SUN]);
+    assertEquals(recurr.toString(), input.join("\n"));
+  },
+});
+
+Deno.test({
+  name: "ical/parse_many/prefetches_timezones",
+  async fn() {
+    const calendars = [
+      [
+        "DTSTART;TZID=America/New_York:19970902T090000",
+        "RRULE:FREQ=WEEKLY;COUNT=3",
+        "EXDATE;TZID=Europe/Brussels:19970909T090000",
+      ],
+      ["DTSTART:19970902T090000Z", "RRULE:FREQ=DAILY;COUNT=2"],
+      ["RRULE:FREQ=BOGUS"],
+    ];
+
+    const scanned = ICalendar.Raw.scan(calendars[0], true).exp();
+    assertEquals(
+      [...scanned.tznames].sort(),
+      ["America/New_York", "Europe/Brussels"],
+    );
+
+    const many = await ICalendar.Raw.parseMany(calendars, true);
+    assertEquals(many.length, 3);
+    assertEquals(many[2].isErr, true);
+    for (let i = 0; i < 2; ++i) {
+      const one = (await ICalendar.Raw.parse(calendars[i], true)).exp();
+      assertEquals(many[i].exp().toString(), one.toString());
+    }
+    assertEquals(
+      many[0].exp().dtstart.region.fullname,
+      TimezoneRegion.cached("America/New_York").fullname,
+    );
+  },
+});
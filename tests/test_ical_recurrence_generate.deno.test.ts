@@ -1,7 +1,12 @@
 import { assertEquals } from "@std/assert";
+import { DateTime } from "../chrono/datetime.ts";
 import { naivedate } from "../chrono/mod.ts";
 import { NaiveDate } from "../chrono/naive-date.ts";
-import { Recurrence } from "../chrono/recurrence/recurrence.ts";
+import {
+  GoogleEventGenerator,
+  Recurrence,
+} from "../chrono/recurrence/recurrence.ts";
+import { YearMonthDay } from "../chrono/units/year-month-day.ts";
 import { installTimezoneLoader } from "./utils.deno.ts";
 
 installTimezoneLoader();
@@ -158,3 +163,669 @@ Deno.test({
     assertEquals(dates[4].toString(), "2024-04-19"); // Continue sequence
   },
 });
+
+Deno.test({
+  name: "recurrence/seek/keeps_interval_alignment",
+  async fn() {
+    const lines = ["DTSTART:20150101T090000Z", "RRULE:FREQ=DAILY;INTERVAL=3"];
+    const recurrence = (await Recurrence.parse(lines)).exp();
+
+    const dates: NaiveDate[] = [];
+    for (const nd of recurrence.seek(naivedate(2025, 6, 1))) {
+      dates.push(nd);
+      if (dates.length === 3) break;
+    }
+
+    // 2015-01-01 + 3 * 1703 days
+    assertEquals(dates[0].toString(), "2025-06-01");
+    assertEquals(dates[1].toString(), "2025-06-04");
+    assertEquals(dates[2].toString(), "2025-06-07");
+  },
+});
+
+Deno.test({
+  name: "recurrence/seek/respects_count",
+  async fn() {
+    const lines = [
+      "DTSTART:20240101T090000Z",
+      "RRULE:FREQ=WEEKLY;BYDAY=MO,TH;COUNT=10",
+    ];
+    const recurrence = (await Recurrence.parse(lines)).exp();
+
+    const expected = Array.from(recurrence.generate())
+      .map((d) => d.toString())
+      .filter((d) => d >= "2024-01-20");
+    const dates = Array.from(recurrence.seek(naivedate(2024, 1, 20))).map(
+      (d) => d.toString(),
+    );
+
+    assertEquals(dates, expected);
+    assertEquals(dates, [
+      "2024-01-22",
+      "2024-01-25",
+      "2024-01-29",
+      "2024-02-01",
+    ]);
+  },
+});
+
+Deno.test({
+  name: "recurrence/seek/counts_skipped_periods",
+  async fn() {
+    const rules = [
+      [
+        "DTSTART:20240110T090000Z",
+        "RRULE:FREQ=MONTHLY;BYMONTHDAY=1,15;COUNT=200",
+      ],
+      ["DTSTART:20240131T090000Z", "RRULE:FREQ=MONTHLY;COUNT=60"],
+      ["DTSTART:20240229T090000Z", "RRULE:FREQ=YEARLY;COUNT=6"],
+    ];
+    for (const lines of rules) {
+      const recurrence = (await Recurrence.parse(lines)).exp();
+      const expected = Array.from(recurrence.generate())
+        .map((d) => d.toString())
+        .filter((d) => d >= "2030-03-01");
+      const dates = Array.from(recurrence.seek(naivedate(2030, 3, 1))).map(
+        (d) => d.toString(),
+      );
+      assertEquals(dates, expected);
+    }
+  },
+});
+
+Deno.test({
+  name: "recurrence/seek/counts_setpos_periods",
+  async fn() {
+    const rules = [
+      "RRULE:FREQ=MONTHLY;BYDAY=MO,TU,WE,TH,FR;BYSETPOS=-1;COUNT=150",
+      "RRULE:FREQ=WEEKLY;BYDAY=MO,WE,FR;BYSETPOS=1,-1;COUNT=900",
+      "RRULE:FREQ=YEARLY;BYMONTH=3,9;BYMONTHDAY=-1;BYSETPOS=2;COUNT=12",
+    ];
+    for (const rule of rules) {
+      const lines = ["DTSTART:20240110T090000Z", rule];
+      const recurrence = (await Recurrence.parse(lines)).exp();
+      const expected = Array.from(recurrence.generate())
+        .map((d) => d.toString())
+        .filter((d) => d >= "2030-03-01");
+      const dates = Array.from(recurrence.seek(naivedate(2030, 3, 1))).map(
+        (d) => d.toString(),
+      );
+      assertEquals(dates, expected);
+    }
+  },
+});
+
+Deno.test({
+  name: "recurrence/between/packs_instants_across_dst",
+  async fn() {
+    const lines = [
+      "DTSTART;TZID=Europe/London:20240301T100000",
+      "RRULE:FREQ=WEEKLY;BYDAY=FR;COUNT=8",
+      "EXDATE;TZID=Europe/London:20240308T100000,20240322T100000,20240405T100000",
+    ];
+    const recurrence = (await Recurrence.parse(lines)).exp();
+
+    const { mse, offsets } = recurrence.between(
+      naivedate(2024, 3, 20),
+      naivedate(2024, 4, 19), // exclusive
+      null,
+      true,
+    );
+
+    // BST starts on 2024-03-31, local time stays at 10:00
+    assertEquals(
+      Array.from(mse).map((ms) => new Date(ms).toISOString()),
+      ["2024-03-29T10:00:00.000Z", "2024-04-12T09:00:00.000Z"],
+    );
+    assertEquals(Array.from(offsets!), [0, 60 * 60 * 1000]);
+  },
+});
+
+Deno.test({
+  name: "recurrence/between/empty_window",
+  async fn() {
+    const lines = ["DTSTART:20240101T090000Z", "RRULE:FREQ=DAILY"];
+    const recurrence = (await Recurrence.parse(lines)).exp();
+
+    const { mse, offsets } = recurrence.between(
+      naivedate(2024, 2, 1),
+      naivedate(2024, 2, 1),
+    );
+    assertEquals(mse.length, 0);
+    assertEquals(offsets, null);
+  },
+});
+
+Deno.test({
+  name: "recurrence/google_events/pages_incrementally",
+  async fn() {
+    const lines = [
+      "DTSTART;TZID=America/New_York:20240105T090000",
+      "RRULE:FREQ=WEEKLY;BYDAY=MO,FR",
+    ];
+    const recurrence = (await Recurrence.parse(lines)).exp();
+    const start = DateTime.fromRfc3339("2024-01-05T09:00:00-05:00").exp();
+    const end = naivedate(2024, 6, 30);
+
+    const all = (
+      await recurrence.generateGoogleEvents(start, null)
+    ).generateUpToDate(end);
+
+    // Page through the same range 3 days at a time
+    const paged = await recurrence.generateGoogleEvents(start, null);
+    const pages: string[] = [];
+    for (let d = naivedate(2024, 1, 1); d.dse < end.dse; d = d.addDays(3)) {
+      for (const event of paged.generateUpToDate(d)) {
+        pages.push(event.toString());
+      }
+    }
+    for (const event of paged.generateUpToDate(end)) {
+      pages.push(event.toString());
+    }
+
+    assertEquals(all.length, 51);
+    assertEquals(
+      pages,
+      all.map((event) => event.toString()),
+    );
+    // Once returned, events aren't returned again
+    assertEquals(paged.generateUpToDate(end), []);
+  },
+});
+
+Deno.test({
+  name: "recurrence/stream/resumes_after_budget",
+  async fn() {
+    const lines = ["DTSTART:20240101T090000Z", "RRULE:FREQ=DAILY;COUNT=250"];
+    const recurrence = (await Recurrence.parse(lines)).exp();
+
+    const dates: string[] = [];
+    let stream = recurrence.stream({ budget: 100 });
+    let pages = 0;
+    for (;;) {
+      for (const nd of stream) dates.push(nd.toString());
+      pages += 1;
+      const next = stream.resume();
+      if (!next) break;
+      stream = next;
+    }
+
+    // COUNT still applies across continuations
+    assertEquals(pages, 3);
+    assertEquals(dates.length, 250);
+    assertEquals(dates[100], "2024-04-10");
+    assertEquals(dates[249], "2024-09-06");
+  },
+});
+
+Deno.test({
+  name: "recurrence/generate/runs_past_budget",
+  async fn() {
+    const lines = ["DTSTART:20240101T090000Z", "RRULE:FREQ=DAILY"];
+    const recurrence = (await Recurrence.parse(lines)).exp();
+    const n = YearMonthDay.DEFAULT_BUDGET + 50;
+    const last = naivedate(2024, 1, 1).addDays(n - 1).toString();
+
+    // generate stops on the period budget, and says where
+    const dates = recurrence.generate();
+    let count = 0;
+    let next = dates.next();
+    for (; !next.done; next = dates.next()) ++count;
+    assertEquals(count, YearMonthDay.DEFAULT_BUDGET);
+    assertEquals(
+      next.value?.period.toString(),
+      naivedate(2024, 1, 1).addDays(count).toString(),
+    );
+
+    // the Google expansion resumes itself on each continuation
+    count = 0;
+    let nd: Option<YearMonthDay> = null;
+    for (nd of recurrence.generateToDate(null, null, true)) {
+      if (++count === n) break;
+    }
+    assertEquals(count, n);
+    assertEquals(nd?.toString(), last);
+  },
+});
+
+Deno.test({
+  name: "recurrence/stream/sparse_rule_far_future",
+  async fn() {
+    const lines = [
+      "DTSTART:20000229T090000Z",
+      "RRULE:FREQ=YEARLY;BYMONTH=2;BYMONTHDAY=29",
+    ];
+    const recurrence = (await Recurrence.parse(lines)).exp();
+
+    // Only leap years are examined, the others are skipped outright
+    const from = naivedate(2398, 1, 1);
+    const stream = recurrence.stream({ from, budget: 1 });
+    assertEquals(Array.from(stream).map(String), ["2400-02-29"]);
+    assertEquals(stream.continuation?.period.yr, 2404);
+
+    const rest = stream.resume(2)!;
+    assertEquals(Array.from(rest).map(String), ["2404-02-29", "2408-02-29"]);
+  },
+});
+
+Deno.test({
+  name: "recurrence/generate/unproductive_periods",
+  async fn() {
+    // INTERVAL=4 from 2001 never lands on a leap year
+    const never = [
+      "DTSTART:20010101T090000Z",
+      "RRULE:FREQ=YEARLY;INTERVAL=4;BYMONTH=2;BYMONTHDAY=29",
+    ];
+    const recurrence = (await Recurrence.parse(never)).exp();
+    assertEquals(Array.from(recurrence.generate()), []);
+
+    // Only months with 31 days are examined
+    const lines = ["DTSTART:20240131T090000Z", "RRULE:FREQ=MONTHLY;COUNT=8"];
+    const monthly = (await Recurrence.parse(lines)).exp();
+    assertEquals(Array.from(monthly.generate()).map(String), [
+      "2024-01-31",
+      "2024-03-31",
+      "2024-05-31",
+      "2024-07-31",
+      "2024-08-31",
+      "2024-10-31",
+      "2024-12-31",
+      "2025-01-31",
+    ]);
+  },
+});
+
+Deno.test({
+  name: "recurrence/occursOn/matches_generate",
+  async fn() {
+    const lines = [
+      "DTSTART:20240131T090000Z",
+      "RRULE:FREQ=MONTHLY;INTERVAL=2;BYDAY=-1FR,1MO;COUNT=15",
+      "EXDATE:20240527T090000Z",
+    ];
+    const recurrence = (await Recurrence.parse(lines)).exp();
+    const expected = new Set(
+      Array.from(recurrence.generate()).map((nd) => nd.toString()),
+    );
+
+    for (let d = naivedate(2024, 1, 1); d.yr < 2027; d = d.addDays(1)) {
+      assertEquals(recurrence.occursOn(d), expected.has(d.toString()));
+    }
+    // excluded, and past COUNT
+    assertEquals(recurrence.occursOn(naivedate(2024, 5, 27)), false);
+    assertEquals(recurrence.occursOn(naivedate(2026, 11, 27)), false);
+  },
+});
+
+Deno.test({
+  name: "recurrence/countBetween/and_indexOf",
+  async fn() {
+    const lines = [
+      "DTSTART:20240105T090000Z",
+      "RRULE:FREQ=WEEKLY;BYDAY=MO,FR",
+      "EXDATE:20240108T090000Z",
+    ];
+    const recurrence = (await Recurrence.parse(lines)).exp();
+    const start = naivedate(2024, 3, 1);
+    const end = naivedate(2030, 7, 1);
+    const dates = Array.from(
+      recurrence.stream({ end: end.addDays(-1), budget: Infinity }),
+    );
+
+    assertEquals(
+      recurrence.countBetween(start, end),
+      dates.filter((nd) => nd.dse >= start.dse).length,
+    );
+    assertEquals(recurrence.countBetween(end, start), 0);
+
+    assertEquals(recurrence.indexOf(naivedate(2024, 1, 5)), 0);
+    // the excluded monday isn't counted
+    assertEquals(recurrence.indexOf(naivedate(2024, 1, 8)), null);
+    assertEquals(recurrence.indexOf(naivedate(2024, 1, 12)), 1);
+    assertEquals(recurrence.indexOf(dates[300]), 300);
+    assertEquals(recurrence.indexOf(naivedate(2024, 1, 13)), null);
+  },
+});
+
+Deno.test({
+  name: "recurrence/reverse/mirrors_generate",
+  async fn() {
+    const lines = [
+      "DTSTART:20240131T090000Z",
+      "RRULE:FREQ=MONTHLY;BYMONTHDAY=-1,15;COUNT=20",
+      "EXDATE:20240415T090000Z",
+    ];
+    const recurrence = (await Recurrence.parse(lines)).exp();
+    const forward = Array.from(recurrence.generate()).map(String);
+
+    // COUNT ends the series in November 2024, a later anchor is the same
+    assertEquals(
+      Array.from(recurrence.reverse(naivedate(2030, 1, 1))).map(String),
+      forward.slice().reverse(),
+    );
+    assertEquals(
+      Array.from(recurrence.reverse(naivedate(2024, 4, 30))).map(String),
+      [
+        "2024-04-30",
+        "2024-03-31",
+        "2024-03-15",
+        "2024-02-29",
+        "2024-02-15",
+        "2024-01-31",
+      ],
+    );
+    assertEquals(
+      recurrence.previous(naivedate(2024, 4, 30))?.toString(),
+      "2024-03-31",
+    );
+    assertEquals(recurrence.previous(naivedate(2024, 1, 31)), null);
+  },
+});
+
+Deno.test({
+  name: "recurrence/set/merges_and_subtracts",
+  async fn() {
+    const lines = [
+      "DTSTART:20240101T090000Z",
+      "RRULE:FREQ=WEEKLY;BYDAY=MO;COUNT=4",
+      "RRULE:FREQ=WEEKLY;BYDAY=FR;COUNT=2",
+      "RDATE;VALUE=DATE:20240110,20240108",
+      "EXRULE:FREQ=MONTHLY;BYMONTHDAY=15;COUNT=1",
+      "EXDATE:20240122T090000Z",
+    ];
+    const recurrence = (await Recurrence.parse(lines)).exp();
+
+    const expected = [
+      "2024-01-01",
+      "2024-01-05",
+      "2024-01-08",
+      "2024-01-10",
+      "2024-01-12",
+    ];
+    assertEquals(Array.from(recurrence.generate()).map(String), expected);
+    assertEquals(
+      Array.from(recurrence.seek(naivedate(2024, 1, 6))).map(String),
+      expected.slice(2),
+    );
+    assertEquals(
+      Array.from(recurrence.reverse(naivedate(2024, 1, 31))).map(String),
+      [...expected].reverse(),
+    );
+
+    assertEquals(recurrence.occursOn(naivedate(2024, 1, 10)), true);
+    assertEquals(recurrence.occursOn(naivedate(2024, 1, 15)), false);
+    assertEquals(recurrence.occursOn(naivedate(2024, 1, 22)), false);
+    assertEquals(
+      recurrence.countBetween(naivedate(2024, 1, 1), naivedate(2024, 2, 1)),
+      5,
+    );
+    assertEquals(recurrence.indexOf(naivedate(2024, 1, 10)), 3);
+    assertEquals(
+      recurrence.previous(naivedate(2024, 1, 12))?.toString(),
+      "2024-01-10",
+    );
+  },
+});
+
+Deno.test({
+  name: "recurrence/set/infinite_rules_resume",
+  async fn() {
+    const lines = [
+      "DTSTART:20240101T090000Z",
+      "RRULE:FREQ=DAILY;INTERVAL=2",
+      "RRULE:FREQ=DAILY;INTERVAL=3",
+      "EXRULE:FREQ=DAILY;INTERVAL=5",
+    ];
+    const recurrence = (await Recurrence.parse(lines)).exp();
+
+    const expected: string[] = [];
+    for (let day = 0; expected.length < 100; ++day) {
+      if ((day % 2 === 0 || day % 3 === 0) && day % 5 !== 0) {
+        expected.push(naivedate(2024, 1, 1).addDays(day).toString());
+      }
+    }
+
+    // Lazily merged, so taking a prefix of the infinite set is cheap
+    const generated: string[] = [];
+    for (const nd of recurrence.generate()) {
+      generated.push(nd.toString());
+      if (generated.length === 100) break;
+    }
+    assertEquals(generated, expected);
+
+    // Budgeted pages pick up where the previous one stopped
+    const paged: string[] = [];
+    let stream = recurrence.stream({ budget: 7 });
+    while (paged.length < 100) {
+      for (const nd of stream) paged.push(nd.toString());
+      stream = stream.resume()!;
+    }
+    assertEquals(paged.slice(0, 100), expected);
+  },
+});
+
+Deno.test({
+  name: "recurrence/instants/minutely_by_hour",
+  async fn() {
+    const lines = [
+      "DTSTART;TZID=America/New_York:20240310T083000",
+      "RRULE:FREQ=MINUTELY;INTERVAL=15;BYHOUR=9;UNTIL=20240311T133000Z",
+      "EXDATE;TZID=America/New_York:20240310T091500",
+    ];
+    const recurrence = (await Recurrence.parse(lines)).exp();
+
+    // Wall clock times in New York, after DST began that morning
+    const expected = [
+      "2024-03-10T13:00:00.000Z",
+      "2024-03-10T13:30:00.000Z",
+      "2024-03-10T13:45:00.000Z",
+      "2024-03-11T13:00:00.000Z",
+      "2024-03-11T13:15:00.000Z",
+      "2024-03-11T13:30:00.000Z",
+    ];
+    const iso = (mse: number) => new Date(mse).toISOString();
+    assertEquals(Array.from(recurrence.instants(), iso), expected);
+
+    const { mse } = recurrence.between(
+      naivedate(2024, 3, 11),
+      naivedate(2024, 3, 12),
+    );
+    assertEquals(Array.from(mse, iso), expected.slice(3));
+  },
+});
+
+Deno.test({
+  name: "recurrence/setpos/first_and_last_weekday",
+  async fn() {
+    const lines = [
+      "DTSTART:20240115T090000Z",
+      "RRULE:FREQ=MONTHLY;BYDAY=MO,TU,WE,TH,FR;BYSETPOS=1,-1;COUNT=5",
+    ];
+    const recurrence = (await Recurrence.parse(lines)).exp();
+
+    // Jan 1 is picked but comes before DTSTART
+    const expected = [
+      "2024-01-31",
+      "2024-02-01",
+      "2024-02-29",
+      "2024-03-01",
+      "2024-03-29",
+    ];
+    assertEquals(Array.from(recurrence.generate()).map(String), expected);
+    assertEquals(
+      Array.from(recurrence.seek(naivedate(2024, 2, 10))).map(String),
+      expected.slice(2),
+    );
+    assertEquals(recurrence.occursOn(naivedate(2024, 3, 28)), false);
+    assertEquals(recurrence.occursOn(naivedate(2024, 3, 29)), true);
+    assertEquals(
+      recurrence.countBetween(naivedate(2024, 1, 1), naivedate(2024, 5, 1)),
+      5,
+    );
+    assertEquals(recurrence.indexOf(naivedate(2024, 3, 1)), 3);
+  },
+});
+
+Deno.test({
+  name: "recurrence/page/matches_generate",
+  async fn() {
+    const cases = [
+      ["DTSTART:20240101T090000Z", "RRULE:FREQ=DAILY;COUNT=10"],
+      // several dates per period, so pages stop partway through a week
+      [
+        "DTSTART:20240101T090000Z",
+        "RRULE:FREQ=WEEKLY;BYDAY=MO,WE,FR;COUNT=11",
+        "EXDATE:20240110T090000Z",
+      ],
+      [
+        "DTSTART:20240101T090000Z",
+        "RRULE:FREQ=MONTHLY;BYMONTHDAY=1,15;COUNT=9",
+        "RRULE:FREQ=WEEKLY;BYDAY=TU;COUNT=6",
+        "RDATE:20240107T090000Z",
+      ],
+    ];
+    for (const lines of cases) {
+      const recurrence = (await Recurrence.parse(lines)).exp();
+      const expected = Array.from(recurrence.generate()).map(String);
+
+      for (const size of [1, 2, 4]) {
+        const paged: string[] = [];
+        let token: Option<string> = null;
+        do {
+          const page: Recurrence.Page = recurrence.page(size, token).exp();
+          paged.push(...page.dates.map(String));
+          token = page.token;
+        } while (token != null);
+        assertEquals(paged, expected);
+      }
+    }
+  },
+});
+
+Deno.test({
+  name: "recurrence/page/bad_token",
+  async fn() {
+    const lines = ["DTSTART:20240101T090000Z", "RRULE:FREQ=DAILY;COUNT=10"];
+    const recurrence = (await Recurrence.parse(lines)).exp();
+    const token = recurrence.page(3).exp().token!;
+
+    assertEquals(recurrence.page(3, "not a token").asErr() != null, true);
+    assertEquals(recurrence.page(3, token + ".1").asErr() != null, true);
+
+    // a token only resumes the recurrence it was taken from
+    const other = ["DTSTART:20240101T090000Z", "RRULE:FREQ=DAILY;COUNT=11"];
+    const otherRecurrence = (await Recurrence.parse(other)).exp();
+    assertEquals(otherRecurrence.page(3, token).asErr() != null, true);
+  },
+});
+
+Deno.test({
+  name: "recurrence/google/token_resume",
+  async fn() {
+    const lines = [
+      "DTSTART:20240101T090000Z",
+      "RRULE:FREQ=WEEKLY;BYDAY=MO,TH;COUNT=9",
+      "EXDATE:20240111T090000Z",
+    ];
+    const recurrence = (await Recurrence.parse(lines)).exp();
+    const start = DateTime.fromRfc3339("2024-01-01T09:00:00Z").exp();
+
+    const all = new GoogleEventGenerator(recurrence, start, null);
+    const expected: string[] = [];
+    for (let event = all.next(); event; event = all.next()) {
+      expected.push(event.toString());
+    }
+    assertEquals(all.token(), null);
+
+    const paged: string[] = [];
+    let generator = new GoogleEventGenerator(recurrence, start, null);
+    for (;;) {
+      const event = generator.next();
+      if (!event) break;
+      paged.push(event.toString());
+      const token = generator.token();
+      if (!token) break;
+      generator = GoogleEventGenerator.resume(
+        recurrence,
+        start,
+        null,
+        token,
+      ).exp();
+    }
+    assertEquals(paged, expected);
+  },
+});
+
+Deno.test({
+  name: "recurrence/expand_many/matches_between",
+  async fn() {
+    const series = [
+      ["DTSTART:20240101T090000Z", "RRULE:FREQ=DAILY;INTERVAL=3"],
+      ["DTSTART:20240105T090000Z", "RRULE:FREQ=WEEKLY;BYDAY=MO,FR;COUNT=7"],
+      ["DTSTART:20240131T090000Z", "RRULE:FREQ=MONTHLY"],
+      [
+        "DTSTART:20240101T090000Z",
+        "RRULE:FREQ=MONTHLY;BYDAY=MO,TU,WE,TH,FR;BYSETPOS=-1",
+      ],
+      [
+        "DTSTART;TZID=America/New_York:20240301T083000",
+        "RRULE:FREQ=WEEKLY;INTERVAL=2;BYDAY=SU,WE",
+        "EXDATE;TZID=America/New_York:20240313T083000",
+      ],
+      ["DTSTART:20240229T090000Z", "RRULE:FREQ=YEARLY;BYYEARDAY=60,-1"],
+      [
+        "DTSTART:20240101T090000Z",
+        "RRULE:FREQ=WEEKLY;BYDAY=TU",
+        "RDATE:20240302T090000Z",
+      ],
+      ["DTSTART:20240101T090000Z", "RRULE:FREQ=HOURLY;INTERVAL=20"],
+    ];
+    const recurrences = [];
+    for (const lines of series) {
+      recurrences.push((await Recurrence.parse(lines)).exp());
+    }
+
+    const start = naivedate(2024, 2, 20);
+    const end = naivedate(2024, 4, 2);
+    const window = new Recurrence.Window(start, end);
+    const expanded = Recurrence.expandMany(recurrences, window);
+    for (const [i, recurrence] of recurrences.entries()) {
+      assertEquals(
+        Array.from(expanded[i].mse),
+        Array.from(recurrence.between(start, end).mse),
+        series[i].join("\n"),
+      );
+    }
+  },
+});
+
+Deno.test({
+  name: "recurrence/expand_many/keeps_offsets",
+  async fn() {
+    const series = [
+      [
+        "DTSTART;TZID=America/New_York:20240301T083000",
+        "RRULE:FREQ=WEEKLY;BYDAY=SU,WE",
+      ],
+      ["DTSTART:20240101T090000Z", "RRULE:FREQ=HOURLY;INTERVAL=20"],
+    ];
+    const recurrences = [];
+    for (const lines of series) {
+      recurrences.push((await Recurrence.parse(lines)).exp());
+    }
+
+    // spans the spring forward in New York
+    const start = naivedate(2024, 3, 1);
+    const end = naivedate(2024, 3, 20);
+    const window = new Recurrence.Window(start, end);
+    const expanded = Recurrence.expandMany(recurrences, window, null, true);
+    for (const [i, recurrence] of recurrences.entries()) {
+      const expected = recurrence.between(start, end, null, true);
+      assertEquals(Array.from(expanded[i].mse), Array.from(expected.mse));
+      assertEquals(
+        Array.from(expanded[i].offsets!),
+        Array.from(expected.offsets!),
+      );
+    }
+  },
+});
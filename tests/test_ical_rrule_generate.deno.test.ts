@@ -91,3 +91,103 @@ Deno.test({
     assertEquals(dates[1].toString(), "2025-03-15");
   },
 });
+
+Deno.test({
+  name: "rrule/toFilterProps/monthly_bymonthday_sorted",
+  fn() {
+    const rrule = RRule.parse(
+      "RRULE:FREQ=MONTHLY;COUNT=4;BYMONTHDAY=10,2,20",
+    ).exp();
+    const filterProps = rrule.toFilterProps();
+
+    const startDate = naivedate(2024, 1, 1);
+    const dates: NaiveDate[] = Array.from(startDate.rangeProps(filterProps));
+
+    // Days within a month are emitted in calendar order
+    assertEquals(
+      dates.map((d) => d.toString()),
+      ["2024-01-02", "2024-01-10", "2024-01-20", "2024-02-02"],
+    );
+  },
+});
+
+Deno.test({
+  name: "rrule/toFilterProps/yearly_bymonth_byday_leap_start",
+  fn() {
+    const rrule = RRule.parse(
+      "RRULE:FREQ=YEARLY;COUNT=3;BYMONTH=2;BYDAY=MO,WE,FR",
+    ).exp();
+    const filterProps = rrule.toFilterProps();
+
+    const startDate = naivedate(2016, 2, 29); // Monday
+    const dates: NaiveDate[] = Array.from(startDate.rangeProps(filterProps));
+
+    assertEquals(
+      dates.map((d) => d.toString()),
+      ["2016-02-29", "2017-02-01", "2017-02-03"],
+    );
+  },
+});
+
+Deno.test({
+  name: "rrule/compile/caches_plan_per_unit",
+  fn() {
+    const rrule = RRule.parse("RRULE:FREQ=YEARLY;BYDAY=-1FR;BYMONTH=5").exp();
+    const plan = rrule.compile("year");
+
+    assertEquals(rrule.compile("year"), plan);
+    assertEquals(plan.expands("year"), true);
+    // Last Friday of May
+    assertEquals(
+      plan
+        .expand(naivedate(2024, 1, 1), "year")
+        .map((dse) => NaiveDate.fromDse(dse as any).toString()),
+      ["2024-05-31"],
+    );
+  },
+});
+
+Deno.test({
+  name: "rrule/compile/shares_occurrences_by_year_type",
+  fn() {
+    const plan = RRule.parse("RRULE:FREQ=YEARLY;BYWEEKNO=1,-1;BYDAY=MO")
+      .exp()
+      .compile("year");
+
+    // common years starting on a Friday, after a leap year
+    assertEquals(plan.year(2021).offsets === plan.year(2049).offsets, true);
+    // 2027 also starts on a Friday, but 2026 isn't a leap year
+    assertEquals(plan.year(2021).offsets === plan.year(2027).offsets, false);
+
+    const mondays = (yr: number) =>
+      plan
+        .expand(naivedate(yr, 1, 1), "year")
+        .map((dse) => NaiveDate.fromDse(dse as any).toString());
+    assertEquals(mondays(2021), ["2021-01-04", "2021-12-27"]);
+    assertEquals(mondays(2027), ["2027-01-04", "2027-12-27"]);
+    assertEquals(plan.count(naivedate(2027, 12, 1), "month"), 1);
+  },
+});
+
+Deno.test({
+  name: "rrule/analyze/empty_and_rare",
+  fn() {
+    const analyze = (s: string) => RRule.parse(s).exp().analyze();
+
+    const feb30 = analyze("RRULE:FREQ=YEARLY;BYMONTH=2;BYMONTHDAY=30");
+    assertEquals(feb30.empty, true);
+    assertEquals(analyze("RRULE:FREQ=DAILY;BYYEARDAY=367").empty, true);
+
+    // Leap days follow the 400 year cycle
+    const leap = analyze("RRULE:FREQ=YEARLY;BYMONTH=2;BYMONTHDAY=29");
+    assertEquals(leap.empty, false);
+    assertEquals(leap.period, 400);
+    assertEquals(leap.density, 97);
+    assertEquals(leap.years[2000 % 400], 1);
+    assertEquals(leap.years[2100 % 400], 0);
+
+    const weekly = analyze("RRULE:FREQ=WEEKLY;BYDAY=MO");
+    assertEquals(weekly.period, 1);
+    assertEquals(weekly.density, 400);
+  },
+});
@@ -195,3 +195,31 @@ Deno.test({
     assertEquals(afterResolved.tz.info.offset.toHrsF, 1); // BST
   },
 });
+
+Deno.test({
+  name: "timezone edge cases - google cursor matches googleDatetimeResolved",
+  async fn() {
+    const tz = await TimezoneRegion.get("America/New_York");
+    const orig = tz.toWallClock(naivedatetime(2024, 10, 20, 1, 30));
+    const cursor = new TimezoneRegion.GoogleCursor(tz, orig);
+
+    // daily at 01:30 and 02:30 across both 2024/2025 transitions, then a
+    // step backwards to make sure the cursor rewinds
+    const dates = [];
+    for (let d = naivedate(2024, 10, 20); d < naivedate(2025, 4, 1); ) {
+      dates.push(d);
+      d = d.addDays(1);
+    }
+    dates.push(naivedate(2024, 11, 3), naivedate(2025, 3, 9));
+
+    for (const date of dates) {
+      for (const hr of [1, 2]) {
+        const ndt = naivedatetime(date.yr, date.mth, date.day, hr, 30);
+        const got = cursor.resolve(ndt);
+        const exp = tz.googleDatetimeResolved(ndt, orig);
+        assertEquals(got.mse, exp.mse);
+        assertEquals(got.tz.info.offset.toHrsF, exp.tz.info.offset.toHrsF);
+      }
+    }
+  },
+});
@@ -1,5 +1,6 @@
 import { assertEquals } from "@std/assert";
 import { range } from "../chrono/range.ts";
+import { DseSet } from "../chrono/units/dse-set.ts";
 
 Deno.test({
   name: "range",
@@ -8,3 +9,34 @@ Deno.test({
     assertEquals([...range(-2, 2)], [-2, -1, 0, 1]);
   },
 });
+
+Deno.test({
+  name: "dse_set",
+  fn() {
+    const set = new DseSet();
+    assertEquals(set.add(19000), true);
+    assertEquals(set.add(19000), false);
+    // grows in both directions
+    assertEquals(set.add(-40), true);
+    assertEquals(set.add(21000), true);
+    assertEquals(set.has(19000), true);
+    assertEquals(set.has(-40), true);
+    assertEquals(set.has(21000), true);
+    assertEquals(set.has(19001), false);
+
+    set.clear();
+    assertEquals(set.has(19000), false);
+    assertEquals(set.add(19000), true);
+
+    // after a clear, the window follows the next period
+    for (let period = 0; period < 100; ++period) {
+      set.clear();
+      const day = 19000 + period * 365;
+      assertEquals(set.has(day - 365), false);
+      assertEquals(set.add(day), true);
+      assertEquals(set.add(day + 6), true);
+      assertEquals(set.add(day), false);
+      assertEquals(set.has(day + 6), true);
+    }
+  },
+});
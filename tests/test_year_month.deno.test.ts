@@ -2,6 +2,7 @@
 
 import { assertEquals } from "@std/assert";
 import { Month0, Month1 } from "../chrono/units/units.ts";
+import { Year } from "../chrono/units/year.ts";
 import { YearMonth } from "../chrono/units/year-month.ts";
 
 Deno.test({
@@ -25,3 +26,22 @@ Deno.test({
     }
   },
 });
+
+Deno.test({
+  name: "ym/shape",
+  fn() {
+    // 2015-02 and 2026-02 both start on a sunday and have 28 days
+    assertEquals(
+      YearMonth.shape({ yr: 2015, mth: 2 as Month1 }),
+      YearMonth.shape({ yr: 2026, mth: 2 as Month1 }),
+    );
+    assertEquals(YearMonth.shape({ yr: 2015, mth: 2 as Month1 }), 0);
+    // 2024-02 starts on a thursday and has 29 days
+    assertEquals(YearMonth.shape({ yr: 2024, mth: 2 as Month1 }), 4 * 4 + 1);
+
+    // 2024 and 1996 are both leap years starting on a monday
+    assertEquals(Year.shape(2024), Year.shape(1996));
+    assertEquals(Year.shape(2024), 1 * 2 + 1);
+    assertEquals(Year.shape(2023), 0);
+  },
+});